@@ -0,0 +1,67 @@
+"""Bound price/qty/USDT NUMERIC columns with explicit precision and scale
+
+Revision ID: 026
+Revises: 025
+Create Date: 2026-10-15
+
+Binance는 가격·수량을 소수점 8자리 이하로만 반환하므로 scale을 고정해도
+기존 값이 손실되지 않는다. ALTER COLUMN TYPE은 테이블 재작성(ACCESS EXCLUSIVE)이
+발생하므로 트레이딩 엔진을 멈춘 상태에서 적용할 것.
+"""
+
+from alembic import op
+
+revision = "026"
+down_revision = "025"
+branch_labels = None
+depends_on = None
+
+PRICE = "numeric(18, 8)"
+QTY = "numeric(28, 12)"
+USDT = "numeric(20, 8)"
+
+_CANDLE_COLUMNS = {
+    "open": PRICE,
+    "high": PRICE,
+    "low": PRICE,
+    "close": PRICE,
+    "volume": QTY,
+    "quote_volume": QTY,
+}
+
+COLUMN_TYPES: dict[str, dict[str, str]] = {
+    "fills": {"price": PRICE, "qty": QTY, "quote_qty": USDT, "commission": QTY},
+    "lots": {
+        "buy_price": PRICE,
+        "buy_qty": QTY,
+        "sell_price": PRICE,
+        "fee_usdt": USDT,
+        "net_profit_usdt": USDT,
+    },
+    "orders": {"price": PRICE, "orig_qty": QTY, "executed_qty": QTY, "cum_quote_qty": USDT},
+    "positions": {"qty": QTY, "cost_basis_usdt": USDT, "avg_entry": PRICE},
+    "core_btc_history": {"btc_qty": QTY, "cost_usdt": USDT},
+    "price_snapshots": {"price": PRICE},
+    "trading_accounts": {"pending_earnings_usdt": USDT, "paper_initial_balance": USDT},
+    "backtest_runs": {"initial_usdt": USDT},
+    "price_candles_1m": _CANDLE_COLUMNS,
+    "price_candles_5m": _CANDLE_COLUMNS,
+    "price_candles_1h": _CANDLE_COLUMNS,
+    "price_candles_1d": _CANDLE_COLUMNS,
+}
+
+
+def _alter(table: str, columns: dict[str, str]) -> None:
+    # One ALTER TABLE per table so each table is rewritten only once
+    clauses = ", ".join(f'ALTER COLUMN "{col}" TYPE {typ}' for col, typ in columns.items())
+    op.execute(f"ALTER TABLE {table} {clauses}")
+
+
+def upgrade() -> None:
+    for table, columns in COLUMN_TYPES.items():
+        _alter(table, columns)
+
+
+def downgrade() -> None:
+    for table, columns in COLUMN_TYPES.items():
+        _alter(table, dict.fromkeys(columns, "numeric"))
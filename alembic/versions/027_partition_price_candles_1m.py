@@ -0,0 +1,83 @@
+"""Partition price_candles_1m by day on ts_ms
+
+Revision ID: 027
+Revises: 026
+Create Date: 2026-10-15
+
+1m 캔들은 7일 보관 후 삭제되므로 일 단위 RANGE 파티션으로 전환해
+만료 구간을 DELETE 대신 DROP TABLE로 정리한다 (CandleAggregator.run_once).
+PK는 파티션 키를 포함해야 하므로 (id, ts_ms)로 변경된다.
+기존 데이터를 복사하므로 트레이딩 엔진을 멈춘 상태에서 적용할 것.
+"""
+
+from alembic import op
+
+revision = "027"
+down_revision = "026"
+branch_labels = None
+depends_on = None
+
+# 기존 데이터 첫날부터 오늘 + 3일까지 일 단위 파티션 생성
+_CREATE_DAILY_PARTITIONS = """
+DO $$
+DECLARE
+    day_ms CONSTANT bigint := 86400000;
+    first_day bigint;
+    last_day bigint;
+    d bigint;
+BEGIN
+    last_day := (floor(extract(epoch FROM now()) * 1000 / day_ms) + 3)::bigint * day_ms;
+    SELECT coalesce(min(ts_ms) / day_ms * day_ms, last_day - 3 * day_ms)
+      INTO first_day FROM price_candles_1m_legacy;
+    d := first_day;
+    WHILE d <= last_day LOOP
+        EXECUTE format(
+            'CREATE TABLE price_candles_1m_p%s PARTITION OF price_candles_1m FOR VALUES FROM (%s) TO (%s)',
+            to_char(to_timestamp(d / 1000) AT TIME ZONE 'UTC', 'YYYYMMDD'), d, d + day_ms
+        );
+        d := d + day_ms;
+    END LOOP;
+END $$
+"""
+
+
+def upgrade() -> None:
+    op.execute("ALTER TABLE price_candles_1m RENAME TO price_candles_1m_legacy")
+    op.execute("ALTER TABLE price_candles_1m_legacy RENAME CONSTRAINT price_candles_1m_pkey TO price_candles_1m_legacy_pkey")
+    op.execute("ALTER INDEX idx_price_candles_1m_symbol_ts RENAME TO idx_price_candles_1m_legacy_symbol_ts")
+
+    op.execute(
+        "CREATE TABLE price_candles_1m ("
+        "LIKE price_candles_1m_legacy INCLUDING DEFAULTS, "
+        "CONSTRAINT price_candles_1m_pkey PRIMARY KEY (id, ts_ms)"
+        ") PARTITION BY RANGE (ts_ms)"
+    )
+    op.execute("CREATE UNIQUE INDEX idx_price_candles_1m_symbol_ts ON price_candles_1m (symbol, ts_ms)")
+    op.execute("CREATE TABLE price_candles_1m_default PARTITION OF price_candles_1m DEFAULT")
+    op.execute(_CREATE_DAILY_PARTITIONS)
+
+    op.execute("INSERT INTO price_candles_1m SELECT * FROM price_candles_1m_legacy")
+    # 시퀀스가 legacy 테이블과 함께 삭제되지 않도록 소유권 이전
+    op.execute("ALTER SEQUENCE price_candles_1m_id_seq OWNED BY price_candles_1m.id")
+    op.execute("DROP TABLE price_candles_1m_legacy")
+
+
+def downgrade() -> None:
+    op.execute("ALTER TABLE price_candles_1m RENAME TO price_candles_1m_partitioned")
+    op.execute("ALTER INDEX idx_price_candles_1m_symbol_ts RENAME TO idx_price_candles_1m_partitioned_symbol_ts")
+    op.execute(
+        "ALTER TABLE price_candles_1m_partitioned RENAME CONSTRAINT price_candles_1m_pkey "
+        "TO price_candles_1m_partitioned_pkey"
+    )
+
+    op.execute(
+        "CREATE TABLE price_candles_1m ("
+        "LIKE price_candles_1m_partitioned INCLUDING DEFAULTS, "
+        "CONSTRAINT price_candles_1m_pkey PRIMARY KEY (id)"
+        ")"
+    )
+    op.execute("CREATE UNIQUE INDEX idx_price_candles_1m_symbol_ts ON price_candles_1m (symbol, ts_ms)")
+    op.execute("INSERT INTO price_candles_1m SELECT * FROM price_candles_1m_partitioned")
+    op.execute("ALTER SEQUENCE price_candles_1m_id_seq OWNED BY price_candles_1m.id")
+    # 부모 테이블 삭제 시 모든 파티션이 함께 삭제된다
+    op.execute("DROP TABLE price_candles_1m_partitioned")
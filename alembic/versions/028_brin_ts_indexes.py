@@ -0,0 +1,33 @@
+"""Add BRIN indexes on ts_ms for append-ordered candle/snapshot tables
+
+Revision ID: 028
+Revises: 027
+Create Date: 2026-10-15
+
+price_candles_1m/5m, price_snapshots는 ts_ms 순서로 적재되므로 BRIN이
+기존 (symbol, ts_ms) B-tree 대비 극히 작은 크기로 심볼 무관 기간 스캔
+(보관 기간 정리, 집계)을 처리한다. 파티션 테이블에 생성하면 각 파티션에 전파된다.
+"""
+
+from alembic import op
+
+revision = "028"
+down_revision = "027"
+branch_labels = None
+depends_on = None
+
+BRIN_INDEXES = {
+    "idx_price_candles_1m_ts_brin": "price_candles_1m",
+    "idx_price_candles_5m_ts_brin": "price_candles_5m",
+    "idx_price_snapshots_ts_brin": "price_snapshots",
+}
+
+
+def upgrade() -> None:
+    for name, table in BRIN_INDEXES.items():
+        op.execute(f"CREATE INDEX IF NOT EXISTS {name} ON {table} USING brin (ts_ms) WITH (pages_per_range = 32)")
+
+
+def downgrade() -> None:
+    for name in BRIN_INDEXES:
+        op.execute(f"DROP INDEX IF EXISTS {name}")
@@ -0,0 +1,30 @@
+"""Make idx_lots_open a partial covering index over OPEN lots
+
+Revision ID: 029
+Revises: 028
+Create Date: 2026-10-15
+
+대시보드/트레이더의 OPEN lot 집계는 buy_price, buy_qty, buy_time만 읽으므로
+INCLUDE로 heap 접근 없이 처리한다. CLOSED/MERGED lot이 빠져 인덱스 크기도 줄어든다.
+"""
+
+from alembic import op
+
+revision = "029"
+down_revision = "028"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS idx_lots_open")
+    op.execute(
+        "CREATE INDEX idx_lots_open ON lots (account_id, symbol) "
+        "INCLUDE (buy_price, buy_qty, buy_time, combo_id) "
+        "WHERE status = 'OPEN'"
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS idx_lots_open")
+    op.execute("CREATE INDEX idx_lots_open ON lots (account_id, symbol, status)")
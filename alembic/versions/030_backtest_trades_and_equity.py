@@ -0,0 +1,93 @@
+"""Normalize backtest_runs.trade_log / equity_curve into child tables
+
+Revision ID: 030
+Revises: 029
+Create Date: 2026-10-15
+
+수만 건의 체결이 담긴 JSONB는 읽을 때마다 TOAST 전체를 풀어야 하므로
+backtest_trades / backtest_equity 행으로 분리한다. 기존 JSONB 데이터는 이관 후 컬럼을 삭제한다.
+"""
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects.postgresql import JSONB, UUID
+
+revision = "030"
+down_revision = "029"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "backtest_trades",
+        sa.Column(
+            "run_id", UUID(as_uuid=True), sa.ForeignKey("backtest_runs.id", ondelete="CASCADE"), primary_key=True
+        ),
+        sa.Column("idx", sa.Integer, primary_key=True),
+        sa.Column("ts_ms", sa.BigInteger, nullable=False),
+        sa.Column("side", sa.String, nullable=False),
+        sa.Column("price", sa.Numeric(18, 8), nullable=False),
+        sa.Column("qty", sa.Numeric(28, 12), nullable=False),
+        sa.Column("quote_qty", sa.Numeric(20, 8), nullable=False),
+    )
+    op.create_table(
+        "backtest_equity",
+        sa.Column(
+            "run_id", UUID(as_uuid=True), sa.ForeignKey("backtest_runs.id", ondelete="CASCADE"), primary_key=True
+        ),
+        sa.Column("ts_ms", sa.BigInteger, primary_key=True),
+        sa.Column("equity_usdt", sa.Numeric(20, 8), nullable=False),
+    )
+
+    op.execute("""
+        INSERT INTO backtest_trades (run_id, idx, ts_ms, side, price, qty, quote_qty)
+        SELECT r.id, (t.ord - 1)::int,
+               coalesce((t.e->>'ts_ms')::bigint, 0),
+               coalesce(t.e->>'side', ''),
+               coalesce((t.e->>'price')::numeric, 0),
+               coalesce((t.e->>'qty')::numeric, 0),
+               coalesce((t.e->>'quote_qty')::numeric, 0)
+        FROM backtest_runs r
+        CROSS JOIN LATERAL jsonb_array_elements(r.trade_log) WITH ORDINALITY AS t(e, ord)
+        WHERE jsonb_typeof(r.trade_log) = 'array'
+    """)
+    op.execute("""
+        INSERT INTO backtest_equity (run_id, ts_ms, equity_usdt)
+        SELECT r.id, (p->>'ts_ms')::bigint, (p->>'value')::numeric
+        FROM backtest_runs r
+        CROSS JOIN LATERAL jsonb_array_elements(r.equity_curve) AS p
+        WHERE jsonb_typeof(r.equity_curve) = 'array'
+        ON CONFLICT DO NOTHING
+    """)
+
+    op.drop_column("backtest_runs", "trade_log")
+    op.drop_column("backtest_runs", "equity_curve")
+
+
+def downgrade() -> None:
+    op.add_column("backtest_runs", sa.Column("trade_log", JSONB, nullable=True))
+    op.add_column("backtest_runs", sa.Column("equity_curve", JSONB, nullable=True))
+
+    op.execute("""
+        UPDATE backtest_runs r SET trade_log = t.log
+        FROM (
+            SELECT run_id, jsonb_agg(
+                jsonb_build_object('ts_ms', ts_ms, 'side', side, 'price', price, 'qty', qty, 'quote_qty', quote_qty)
+                ORDER BY idx
+            ) AS log
+            FROM backtest_trades GROUP BY run_id
+        ) t
+        WHERE r.id = t.run_id
+    """)
+    op.execute("""
+        UPDATE backtest_runs r SET equity_curve = e.curve
+        FROM (
+            SELECT run_id, jsonb_agg(jsonb_build_object('ts_ms', ts_ms, 'value', equity_usdt) ORDER BY ts_ms) AS curve
+            FROM backtest_equity GROUP BY run_id
+        ) e
+        WHERE r.id = e.run_id
+    """)
+
+    op.drop_table("backtest_equity")
+    op.drop_table("backtest_trades")
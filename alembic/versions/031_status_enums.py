@@ -0,0 +1,91 @@
+"""Store fixed-set status/side columns as PostgreSQL ENUM types
+
+Revision ID: 031
+Revises: 030
+Create Date: 2026-10-15
+
+앱이 값 집합을 통제하는 컬럼만 ENUM으로 전환한다 (기존 CHECK 제약 대체).
+orders.status / orders.type은 Binance가 값을 추가할 수 있으므로 String 유지.
+'OPEN' 리터럴을 쓰는 lots partial index는 ENUM 비교로 다시 만들어야 planner가 사용한다.
+"""
+
+from alembic import op
+
+revision = "031"
+down_revision = "030"
+branch_labels = None
+depends_on = None
+
+ENUM_TYPES = {
+    "lot_status": ("OPEN", "CLOSED", "MERGED"),
+    "backtest_status": ("PENDING", "RUNNING", "COMPLETED", "FAILED"),
+    "buy_pause_state": ("ACTIVE", "THROTTLED", "PAUSED"),
+    "core_btc_source": ("INIT", "MANUAL_APPROVE", "AUTO_RESERVE", "ADJUSTMENT"),
+    "order_side": ("BUY", "SELL"),
+}
+
+# (table, column, enum type, server default, CHECK constraint replaced by the ENUM)
+COLUMNS = [
+    ("lots", "status", "lot_status", "OPEN", "chk_lot_status"),
+    ("backtest_runs", "status", "backtest_status", "PENDING", "chk_backtest_status"),
+    ("trading_accounts", "buy_pause_state", "buy_pause_state", "ACTIVE", "chk_buy_pause_state"),
+    ("core_btc_history", "source", "core_btc_source", None, "chk_core_btc_source"),
+    ("orders", "side", "order_side", None, None),
+    ("fills", "side", "order_side", None, None),
+]
+
+_LOTS_PARTIAL_INDEXES = (
+    "CREATE INDEX idx_lots_open ON lots (account_id, symbol) "
+    "INCLUDE (buy_price, buy_qty, buy_time, combo_id) WHERE status = 'OPEN'",
+    "CREATE UNIQUE INDEX idx_lots_unique_buy_order ON lots (account_id, buy_order_id) "
+    "WHERE buy_order_id IS NOT NULL AND status = 'OPEN' AND sell_order_id IS NULL",
+)
+
+
+def _alter_type(table: str, column: str, new_type: str, default: str | None) -> None:
+    # varchar 기본값은 ENUM으로 자동 캐스트되지 않으므로 DROP → TYPE → SET 순서
+    clauses = [f"ALTER COLUMN {column} DROP DEFAULT"] if default else []
+    clauses.append(f"ALTER COLUMN {column} TYPE {new_type} USING {column}::text::{new_type}")
+    if default:
+        clauses.append(f"ALTER COLUMN {column} SET DEFAULT '{default}'")
+    op.execute(f"ALTER TABLE {table} {', '.join(clauses)}")
+
+
+def upgrade() -> None:
+    for name, values in ENUM_TYPES.items():
+        labels = ", ".join(f"'{v}'" for v in values)
+        op.execute(f"CREATE TYPE {name} AS ENUM ({labels})")
+
+    op.execute("DROP INDEX IF EXISTS idx_lots_open")
+    op.execute("DROP INDEX IF EXISTS idx_lots_unique_buy_order")
+
+    for table, column, enum_type, default, check in COLUMNS:
+        if check:
+            op.execute(f"ALTER TABLE {table} DROP CONSTRAINT IF EXISTS {check}")
+        _alter_type(table, column, enum_type, default)
+
+    for ddl in _LOTS_PARTIAL_INDEXES:
+        op.execute(ddl)
+
+
+def downgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS idx_lots_open")
+    op.execute("DROP INDEX IF EXISTS idx_lots_unique_buy_order")
+
+    for table, column, enum_type, default, _check in COLUMNS:
+        _alter_type(table, column, "varchar", default)
+    op.execute("ALTER TABLE trading_accounts ALTER COLUMN buy_pause_state TYPE varchar(20)")
+
+    for ddl in _LOTS_PARTIAL_INDEXES:
+        op.execute(ddl)
+
+    op.execute(
+        "ALTER TABLE lots ADD CONSTRAINT chk_lot_status CHECK (status IN ('OPEN', 'CLOSED', 'MERGED'))"
+    )
+    op.execute(
+        "ALTER TABLE trading_accounts ADD CONSTRAINT chk_buy_pause_state "
+        "CHECK (buy_pause_state IN ('ACTIVE', 'THROTTLED', 'PAUSED'))"
+    )
+
+    for name in ENUM_TYPES:
+        op.execute(f"DROP TYPE {name}")
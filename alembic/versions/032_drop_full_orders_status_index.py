@@ -0,0 +1,28 @@
+"""Drop full idx_orders_status in favour of partial idx_orders_open
+
+Revision ID: 032
+Revises: 031
+Create Date: 2026-10-15
+
+미체결 주문 조회는 013에서 추가한 partial index(idx_orders_open)가 담당한다.
+(account_id, status) 전체 인덱스는 대부분 FILLED 이력 행만 담고 있어 쓰기 비용만 늘린다.
+"""
+
+from alembic import op
+
+revision = "032"
+down_revision = "031"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS idx_orders_open ON orders (account_id, status) "
+        "WHERE status IN ('NEW', 'PARTIALLY_FILLED')"
+    )
+    op.execute("DROP INDEX IF EXISTS idx_orders_status")
+
+
+def downgrade() -> None:
+    op.execute("CREATE INDEX IF NOT EXISTS idx_orders_status ON orders (account_id, status)")
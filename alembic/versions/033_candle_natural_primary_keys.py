@@ -0,0 +1,49 @@
+"""Use (symbol, ts_ms) as the primary key of price candle tables
+
+Revision ID: 033
+Revises: 032
+Create Date: 2026-10-15
+
+id BIGSERIAL surrogate PK와 (symbol, ts_ms) UNIQUE 인덱스를 함께 유지하던 구조를
+자연키 PK 하나로 합친다 — INSERT 당 인덱스 유지비와 시퀀스 호출이 줄어든다.
+기존 upsert(ON CONFLICT (symbol, ts_ms))는 그대로 PK를 대상으로 동작한다.
+
+1h/1d는 심볼별 차트 조회 위주이므로 PK 순서로 CLUSTER 한다. 1m/5m은 ts_ms BRIN
+인덱스가 삽입 순서(시간순) 물리 배치에 의존하므로 CLUSTER 하지 않는다.
+테이블 재작성이 발생하므로 트레이딩 엔진을 멈춘 상태에서 적용할 것.
+"""
+
+from alembic import op
+
+revision = "033"
+down_revision = "032"
+branch_labels = None
+depends_on = None
+
+CANDLE_TABLES = ("price_candles_1m", "price_candles_5m", "price_candles_1h", "price_candles_1d")
+CLUSTERED_TABLES = ("price_candles_1h", "price_candles_1d")
+
+
+def upgrade() -> None:
+    for table in CANDLE_TABLES:
+        op.execute(f"ALTER TABLE {table} DROP CONSTRAINT {table}_pkey")
+        op.execute(f"DROP INDEX idx_{table}_symbol_ts")
+        # id 시퀀스는 컬럼 소유이므로 함께 삭제된다
+        op.execute(f"ALTER TABLE {table} DROP COLUMN id")
+        op.execute(f"ALTER TABLE {table} ADD CONSTRAINT {table}_pkey PRIMARY KEY (symbol, ts_ms)")
+
+    for table in CLUSTERED_TABLES:
+        op.execute(f"CLUSTER {table} USING {table}_pkey")
+
+
+def downgrade() -> None:
+    for table in CLUSTERED_TABLES:
+        op.execute(f"ALTER TABLE {table} SET WITHOUT CLUSTER")
+
+    for table in CANDLE_TABLES:
+        op.execute(f"ALTER TABLE {table} DROP CONSTRAINT {table}_pkey")
+        op.execute(f"ALTER TABLE {table} ADD COLUMN id BIGSERIAL")
+        # 파티션 테이블의 PK는 파티션 키(ts_ms)를 포함해야 한다
+        pk_columns = "id, ts_ms" if table == "price_candles_1m" else "id"
+        op.execute(f"ALTER TABLE {table} ADD CONSTRAINT {table}_pkey PRIMARY KEY ({pk_columns})")
+        op.execute(f"CREATE UNIQUE INDEX idx_{table}_symbol_ts ON {table} (symbol, ts_ms)")
@@ -0,0 +1,56 @@
+"""Fold strategy_state key/value rows into one JSONB row per (account_id, scope)
+
+Revision ID: 034
+Revises: 033
+Create Date: 2026-10-15
+
+EAV 구조 (account_id, scope, key, value)를 scope당 한 행 + state JSONB로 전환한다.
+값은 기존과 동일하게 문자열로 저장되므로 StrategyStateStore 호출부는 변경 없음.
+"""
+
+from alembic import op
+
+revision = "034"
+down_revision = "033"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute("ALTER TABLE strategy_state RENAME TO strategy_state_kv")
+    op.execute("ALTER TABLE strategy_state_kv RENAME CONSTRAINT strategy_state_pkey TO strategy_state_kv_pkey")
+    op.execute(
+        "CREATE TABLE strategy_state ("
+        "account_id uuid NOT NULL REFERENCES trading_accounts(id) ON DELETE CASCADE, "
+        "scope varchar NOT NULL, "
+        "state jsonb NOT NULL DEFAULT '{}', "
+        "updated_at timestamptz DEFAULT now(), "
+        "CONSTRAINT strategy_state_pkey PRIMARY KEY (account_id, scope))"
+    )
+    op.execute(
+        "INSERT INTO strategy_state (account_id, scope, state, updated_at) "
+        "SELECT account_id, scope, jsonb_object_agg(key, value), max(updated_at) "
+        "FROM strategy_state_kv GROUP BY account_id, scope"
+    )
+    op.execute("DROP TABLE strategy_state_kv")
+
+
+def downgrade() -> None:
+    op.execute("ALTER TABLE strategy_state RENAME TO strategy_state_jsonb")
+    op.execute("ALTER TABLE strategy_state_jsonb RENAME CONSTRAINT strategy_state_pkey TO strategy_state_jsonb_pkey")
+    op.execute(
+        "CREATE TABLE strategy_state ("
+        "account_id uuid NOT NULL REFERENCES trading_accounts(id) ON DELETE CASCADE, "
+        "scope varchar NOT NULL, "
+        "key varchar NOT NULL, "
+        "value varchar, "
+        "updated_at timestamptz DEFAULT now(), "
+        "CONSTRAINT strategy_state_pkey PRIMARY KEY (account_id, scope, key))"
+    )
+    op.execute("CREATE INDEX idx_strategy_state_account ON strategy_state (account_id)")
+    op.execute(
+        "INSERT INTO strategy_state (account_id, scope, key, value, updated_at) "
+        "SELECT s.account_id, s.scope, kv.key, kv.value, s.updated_at "
+        "FROM strategy_state_jsonb s, jsonb_each_text(s.state) kv"
+    )
+    op.execute("DROP TABLE strategy_state_jsonb")
@@ -0,0 +1,33 @@
+"""Put account_id first in the fills / lots / orders primary keys
+
+Revision ID: 035
+Revises: 034
+Create Date: 2026-10-15
+
+모든 조회가 account_id로 시작하므로 PK를 (account_id, id) 순서로 재구성하고
+PK 순서로 CLUSTER 해서 계정별 행을 힙에서 인접하게 배치한다.
+CLUSTER는 ACCESS EXCLUSIVE 잠금 + 테이블 재작성이므로 트레이딩 엔진을 멈춘 상태에서 적용할 것.
+이후 삽입되는 행은 자동으로 정렬되지 않으므로 필요 시 CLUSTER를 재실행한다 (clustered index는 기억됨).
+"""
+
+from alembic import op
+
+revision = "035"
+down_revision = "034"
+branch_labels = None
+depends_on = None
+
+PK_ID_COLUMNS = {"fills": "trade_id", "lots": "lot_id", "orders": "order_id"}
+
+
+def upgrade() -> None:
+    for table, id_column in PK_ID_COLUMNS.items():
+        op.execute(f"ALTER TABLE {table} DROP CONSTRAINT {table}_pkey")
+        op.execute(f"ALTER TABLE {table} ADD CONSTRAINT {table}_pkey PRIMARY KEY (account_id, {id_column})")
+        op.execute(f"CLUSTER {table} USING {table}_pkey")
+
+
+def downgrade() -> None:
+    for table, id_column in PK_ID_COLUMNS.items():
+        op.execute(f"ALTER TABLE {table} DROP CONSTRAINT {table}_pkey")
+        op.execute(f"ALTER TABLE {table} ADD CONSTRAINT {table}_pkey PRIMARY KEY ({id_column}, account_id)")
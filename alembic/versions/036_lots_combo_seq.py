@@ -0,0 +1,83 @@
+"""Reference combos from lots by a per-account smallint sequence
+
+Revision ID: 036
+Revises: 035
+Create Date: 2026-10-15
+
+lots.combo_id(UUID, 16바이트)를 lots.combo_seq(smallint, 2바이트)로 교체한다.
+trading_combos.combo_seq는 계정 내 순번이며 BEFORE INSERT 트리거가 부여한다.
+trading_combos.id(UUID)는 API/상태 scope용 외부 식별자로 그대로 유지.
+"""
+
+from alembic import op
+
+revision = "036"
+down_revision = "035"
+branch_labels = None
+depends_on = None
+
+_ASSIGN_SEQ_FUNCTION = """
+CREATE OR REPLACE FUNCTION trading_combos_assign_seq() RETURNS trigger AS $$
+BEGIN
+    IF NEW.combo_seq IS NULL THEN
+        PERFORM pg_advisory_xact_lock(hashtextextended(NEW.account_id::text, 0));
+        SELECT coalesce(max(combo_seq), 0) + 1 INTO NEW.combo_seq
+          FROM trading_combos WHERE account_id = NEW.account_id;
+    END IF;
+    RETURN NEW;
+END $$ LANGUAGE plpgsql
+"""
+
+
+def _create_lot_combo_indexes(column: str) -> None:
+    op.execute(
+        "CREATE INDEX idx_lots_open ON lots (account_id, symbol) "
+        f"INCLUDE (buy_price, buy_qty, buy_time, {column}) WHERE status = 'OPEN'"
+    )
+    op.execute(f"CREATE INDEX idx_lots_combo ON lots (account_id, {column}, status)")
+    op.execute(f"CREATE INDEX idx_lots_combo_v2 ON lots (account_id, {column}, symbol, status)")
+
+
+def upgrade() -> None:
+    op.execute("ALTER TABLE trading_combos ADD COLUMN combo_seq smallint")
+    op.execute(
+        "UPDATE trading_combos c SET combo_seq = s.rn FROM ("
+        "SELECT id, row_number() OVER (PARTITION BY account_id ORDER BY created_at, id) AS rn "
+        "FROM trading_combos) s WHERE c.id = s.id"
+    )
+    op.execute("ALTER TABLE trading_combos ALTER COLUMN combo_seq SET NOT NULL")
+    op.execute(
+        "ALTER TABLE trading_combos ADD CONSTRAINT uq_trading_combos_account_seq UNIQUE (account_id, combo_seq)"
+    )
+    op.execute(_ASSIGN_SEQ_FUNCTION)
+    op.execute(
+        "CREATE TRIGGER trg_trading_combos_seq BEFORE INSERT ON trading_combos "
+        "FOR EACH ROW EXECUTE FUNCTION trading_combos_assign_seq()"
+    )
+
+    op.execute("ALTER TABLE lots ADD COLUMN combo_seq smallint")
+    op.execute(
+        "UPDATE lots l SET combo_seq = c.combo_seq FROM trading_combos c "
+        "WHERE c.id = l.combo_id AND c.account_id = l.account_id"
+    )
+    # combo_id를 포함하는 idx_lots_open / idx_lots_combo / idx_lots_combo_v2 와 FK도 함께 삭제된다
+    op.execute("ALTER TABLE lots DROP COLUMN combo_id")
+    op.execute(
+        "ALTER TABLE lots ADD CONSTRAINT lots_combo_seq_fkey FOREIGN KEY (account_id, combo_seq) "
+        "REFERENCES trading_combos (account_id, combo_seq)"
+    )
+    _create_lot_combo_indexes("combo_seq")
+
+
+def downgrade() -> None:
+    op.execute("ALTER TABLE lots ADD COLUMN combo_id uuid REFERENCES trading_combos(id)")
+    op.execute(
+        "UPDATE lots l SET combo_id = c.id FROM trading_combos c "
+        "WHERE c.account_id = l.account_id AND c.combo_seq = l.combo_seq"
+    )
+    op.execute("ALTER TABLE lots DROP COLUMN combo_seq")
+    _create_lot_combo_indexes("combo_id")
+
+    op.execute("DROP TRIGGER trg_trading_combos_seq ON trading_combos")
+    op.execute("DROP FUNCTION trading_combos_assign_seq()")
+    op.execute("ALTER TABLE trading_combos DROP COLUMN combo_seq")
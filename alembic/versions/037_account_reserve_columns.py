@@ -0,0 +1,41 @@
+"""Move reserve pool from strategy_state 'shared' scope into trading_accounts columns
+
+Revision ID: 037
+Revises: 036
+Create Date: 2026-10-15
+
+reserve_qty / reserve_cost_usdt를 pending_earnings_usdt와 같은 정식 컬럼으로 옮겨
+SELECT → 계산 → SET 대신 UPDATE ... SET x = x + delta RETURNING x 한 번으로 증감한다.
+"""
+
+from alembic import op
+
+revision = "037"
+down_revision = "036"
+branch_labels = None
+depends_on = None
+
+RESERVE_COLUMNS = (("reserve_qty", "numeric(28, 12)"), ("reserve_cost_usdt", "numeric(20, 8)"))
+
+
+def upgrade() -> None:
+    for column, sql_type in RESERVE_COLUMNS:
+        op.execute(f"ALTER TABLE trading_accounts ADD COLUMN {column} {sql_type} NOT NULL DEFAULT 0")
+        op.execute(
+            f"UPDATE trading_accounts a SET {column} = (s.state->>'{column}')::numeric "
+            "FROM strategy_state s "
+            f"WHERE s.account_id = a.id AND s.scope = 'shared' AND s.state ? '{column}'"
+        )
+    op.execute("UPDATE strategy_state SET state = state - 'reserve_qty' - 'reserve_cost_usdt' WHERE scope = 'shared'")
+
+
+def downgrade() -> None:
+    op.execute(
+        "INSERT INTO strategy_state (account_id, scope, state) "
+        "SELECT id, 'shared', jsonb_build_object("
+        "'reserve_qty', (reserve_qty::float8)::text, 'reserve_cost_usdt', (reserve_cost_usdt::float8)::text) "
+        "FROM trading_accounts WHERE reserve_qty <> 0 OR reserve_cost_usdt <> 0 "
+        "ON CONFLICT (account_id, scope) DO UPDATE SET state = strategy_state.state || EXCLUDED.state"
+    )
+    for column, _ in RESERVE_COLUMNS:
+        op.execute(f"ALTER TABLE trading_accounts DROP COLUMN {column}")
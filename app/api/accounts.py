@@ -8,16 +8,15 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from app.db.account_repo import AccountRepository
 from app.db.session import get_trading_session
 from app.dependencies import get_current_user, get_owned_account, limiter, require_admin
-from app.schemas.account import AccountCreate, AccountListResponse, AccountResponse, AccountUpdate
+from app.schemas.account import AccountCreate, AccountResponse, AccountUpdate
 from app.services.account_service import AccountService
-from app.services.account_state_manager import AccountStateManager
 from app.utils.encryption import EncryptionManager
 from app.utils.logging import audit_log
 
 router = APIRouter(prefix="/api/accounts", tags=["accounts"])
 
 
-@router.get("", response_model=AccountListResponse)
+@router.get("", response_model=list[AccountResponse])
 @limiter.limit("120/minute")
 async def list_accounts(
     request: Request, user: dict = Depends(get_current_user), session: AsyncSession = Depends(get_trading_session)
@@ -37,7 +36,7 @@ async def list_accounts(
                 symbols.update(combo.symbols or [])
             resp.combo_symbols = sorted(symbols)
             responses.append(resp)
-        return AccountListResponse(accounts=responses)
+        return responses
     else:
         accounts = await account_service.get_accounts_by_owner(UUID(user["id"]))
         responses = []
@@ -50,7 +49,7 @@ async def list_accounts(
                 symbols.update(combo.symbols or [])
             resp.combo_symbols = sorted(symbols)
             responses.append(resp)
-        return AccountListResponse(accounts=responses)
+        return responses
 
 
 @router.post("", response_model=AccountResponse, status_code=201)
@@ -152,7 +151,6 @@ async def delete_account(
 ):
     engine = request.app.state.trading_engine
     await engine.stop_account(account.id)
-    AccountStateManager.remove_lock(account.id)
     await session.delete(account)
     await session.commit()
 
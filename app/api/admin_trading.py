@@ -4,16 +4,16 @@ from typing import Literal
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, Query, Request
+from sqlalchemy import false, select
 from sqlalchemy import func as sa_func
-from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import defer
+from sqlalchemy.orm import defer, undefer
 
 from app.db.session import get_trading_session
 from app.dependencies import limiter, require_admin
 from app.models.account import TradingAccount
 from app.models.fill import Fill
-from app.models.lot import Lot
+from app.models.lot import LOT_STATUSES, Lot
 from app.models.order import Order
 from app.models.trading_combo import TradingCombo
 from app.schemas.trade import OrderResponse
@@ -34,7 +34,7 @@ async def admin_list_trades(
     side: Literal["BUY", "SELL"] | None = Query(default=None),
 ):
     """Cross-account trade history with pagination."""
-    stmt = select(Order).options(defer(Order.raw_json)).order_by(Order.update_time_ms.desc())
+    stmt = select(Order).order_by(Order.update_time_ms.desc())
     count_stmt = select(sa_func.count(Order.order_id))
 
     if account_id:
@@ -79,15 +79,17 @@ async def admin_list_lots(
     """Cross-account lot listing with filtering and pagination."""
     stmt = (
         select(Lot, TradingAccount.name.label("account_name"))
-        .options(defer(Lot.metadata_))
+        .options(defer(Lot.metadata_), undefer(Lot.combo_id))
         .join(TradingAccount, Lot.account_id == TradingAccount.id)
         .order_by(Lot.buy_time.desc())
     )
     count_stmt = select(sa_func.count(Lot.lot_id))
 
     if status:
-        stmt = stmt.where(Lot.status == status.upper())
-        count_stmt = count_stmt.where(Lot.status == status.upper())
+        # CANCELLED는 lot_status ENUM에 없는 값 — 빈 결과 (ENUM 캐스트 오류 방지)
+        status_filter = Lot.status == status if status in LOT_STATUSES else false()
+        stmt = stmt.where(status_filter)
+        count_stmt = count_stmt.where(status_filter)
     if account_id:
         stmt = stmt.where(Lot.account_id == account_id)
         count_stmt = count_stmt.where(Lot.account_id == account_id)
@@ -173,13 +175,13 @@ async def admin_list_combos(
     """Cross-account combo overview with open lot counts."""
     open_lots_sq = (
         select(
-            Lot.combo_id,
+            Lot.combo_seq,
             Lot.account_id,
             sa_func.count(Lot.lot_id).label("open_lots"),
             sa_func.coalesce(sa_func.sum(Lot.buy_price * Lot.buy_qty), 0).label("total_invested"),
         )
         .where(Lot.status == "OPEN")
-        .group_by(Lot.combo_id, Lot.account_id)
+        .group_by(Lot.combo_seq, Lot.account_id)
         .subquery()
     )
 
@@ -193,7 +195,8 @@ async def admin_list_combos(
         .join(TradingAccount, TradingCombo.account_id == TradingAccount.id)
         .outerjoin(
             open_lots_sq,
-            (TradingCombo.id == open_lots_sq.c.combo_id) & (TradingCombo.account_id == open_lots_sq.c.account_id),
+            (TradingCombo.combo_seq == open_lots_sq.c.combo_seq)
+            & (TradingCombo.account_id == open_lots_sq.c.account_id),
         )
         .order_by(TradingAccount.name, TradingCombo.name)
     )
@@ -243,7 +246,6 @@ async def admin_list_fills(
     """Cross-account fill listing for audit."""
     stmt = (
         select(Fill, TradingAccount.name.label("account_name"))
-        .options(defer(Fill.raw_json))
         .join(TradingAccount, Fill.account_id == TradingAccount.id)
         .order_by(Fill.inserted_at.desc())
     )
@@ -5,6 +5,7 @@ from fastapi.responses import JSONResponse, RedirectResponse
 
 from app.dependencies import limiter
 from app.schemas.auth import LoginRequest, LoginResponse, UserResponse
+from app.services.auth_service import LoginThrottledError
 
 router = APIRouter(prefix="/api/auth", tags=["auth"])
 
@@ -16,7 +17,10 @@ async def login(login_req: LoginRequest, request: Request):
     auth_service = request.app.state.auth_service
     session_manager = request.app.state.session_manager
 
-    user = await auth_service.authenticate(login_req.email, login_req.password)
+    try:
+        user = await auth_service.authenticate(login_req.email, login_req.password)
+    except LoginThrottledError:
+        raise HTTPException(status_code=429, detail="Too many login attempts. Try again later.")
     if not user:
         raise HTTPException(status_code=401, detail="Invalid email or password.")
 
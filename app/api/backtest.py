@@ -7,14 +7,15 @@ from datetime import UTC, datetime
 from pathlib import Path
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, Request
+from fastapi import APIRouter, Depends, HTTPException, Request, Response
 from sqlalchemy import desc, select
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import defer, load_only
+from sqlalchemy.orm import load_only, undefer
 
 from app.db.session import get_trading_session
 from app.dependencies import require_admin
 from app.models.backtest_run import BacktestRun
+from app.models.backtest_trade import BacktestEquityPoint, BacktestTrade
 from app.schemas.backtest import (
     BacktestConfigOut,
     BacktestListItem,
@@ -25,6 +26,9 @@ from app.schemas.backtest import (
     BacktestRunResponse,
     BacktestStatusResponse,
     BacktestSummaryOut,
+    ChartCandle,
+    EquityPoint,
+    TradeLogEntry,
 )
 
 logger = logging.getLogger(__name__)
@@ -138,6 +142,33 @@ async def get_backtest_status(
     )
 
 
+async def _load_trade_log_and_equity(
+    session: AsyncSession, run_id: UUID
+) -> tuple[list[TradeLogEntry], list[EquityPoint]]:
+    """Rebuild the report's trade_log / equity_curve lists from the child tables."""
+    trades = await session.execute(
+        select(
+            BacktestTrade.ts_ms,
+            BacktestTrade.side,
+            BacktestTrade.price,
+            BacktestTrade.qty,
+            BacktestTrade.quote_qty,
+        )
+        .where(BacktestTrade.run_id == run_id)
+        .order_by(BacktestTrade.idx)
+    )
+    equity = await session.execute(
+        select(BacktestEquityPoint.ts_ms, BacktestEquityPoint.equity_usdt)
+        .where(BacktestEquityPoint.run_id == run_id)
+        .order_by(BacktestEquityPoint.ts_ms)
+    )
+    trade_log: list[TradeLogEntry] = [
+        {"ts_ms": r.ts_ms, "side": r.side, "price": r.price, "qty": r.qty, "quote_qty": r.quote_qty} for r in trades
+    ]
+    equity_curve: list[EquityPoint] = [{"ts_ms": r.ts_ms, "value": r.equity_usdt} for r in equity]
+    return trade_log, equity_curve
+
+
 @router.get("/{run_id}/report")
 async def get_backtest_report(
     run_id: UUID,
@@ -145,7 +176,7 @@ async def get_backtest_report(
     session: AsyncSession = Depends(get_trading_session),
 ):
     """Get full backtest report with candles."""
-    run = await session.get(BacktestRun, run_id)
+    run = await session.get(BacktestRun, run_id, options=[undefer(BacktestRun.result_summary)])
     if not run:
         raise HTTPException(status_code=404, detail="Backtest not found")
 
@@ -160,7 +191,7 @@ async def get_backtest_report(
 
     _MAX_CHART_CANDLES = 2000
 
-    def _load_candles() -> tuple[list[dict], int]:
+    def _load_candles() -> tuple[list[ChartCandle], int]:
         import pyarrow.compute as pc
         import pyarrow.parquet as pq
 
@@ -178,7 +209,7 @@ async def get_backtest_report(
                 continue
             indices = pc.sort_indices(table, sort_keys=[("ts_ms", "ascending")])
             table = table.take(indices)
-            rows = [
+            rows: list[ChartCandle] = [
                 {
                     "time": int(row["ts_ms"] / 1000),
                     "open": float(row["open"]),
@@ -194,7 +225,7 @@ async def get_backtest_report(
                 n = len(rows)
                 bucket_size = -(-n // _MAX_CHART_CANDLES)  # ceil division
                 bucket_interval = bucket_size * 60  # seconds
-                aggregated: dict[int, dict] = {}
+                aggregated: dict[int, ChartCandle] = {}
                 for row in rows:
                     key = (row["time"] // bucket_interval) * bucket_interval
                     if key not in aggregated:
@@ -219,6 +250,7 @@ async def get_backtest_report(
         return [], 60
 
     candles, candle_interval_sec = await asyncio.to_thread(_load_candles)
+    trade_log, equity_curve = await _load_trade_log_and_equity(session, run.id)
 
     config = BacktestConfigOut(
         symbol=run.symbol,
@@ -235,7 +267,7 @@ async def get_backtest_report(
         summary = BacktestSummaryOut(**run.result_summary)
 
     # Auto-save to JSON on first view (offload blocking I/O to thread)
-    await asyncio.to_thread(_auto_save, run, candles)  # type: ignore[arg-type]
+    await asyncio.to_thread(_auto_save, run, candles, trade_log, equity_curve)
 
     # Check pinned status from saved file
     def _is_pinned() -> bool:
@@ -250,16 +282,18 @@ async def get_backtest_report(
 
     pinned = await asyncio.to_thread(_is_pinned)
 
-    return BacktestReportResponse(
+    report = BacktestReportResponse(
         id=run.id,
         config=config,
         summary=summary,
-        trade_log=run.trade_log,
-        equity_curve=run.equity_curve,
+        trade_log=trade_log,
+        equity_curve=equity_curve,
         candles=candles,
         candle_interval_sec=candle_interval_sec,
         pinned=pinned,
     )
+    # 캔들/거래 수천 행 — jsonable_encoder + json.dumps 대신 pydantic-core 직렬화로 바로 응답
+    return Response(report.model_dump_json(), media_type="application/json")
 
 
 @router.get("/list", response_model=list[BacktestListItem])
@@ -269,13 +303,12 @@ async def list_backtests(
 ):
     """List all backtest runs (newest first)."""
     stmt = (
-        select(BacktestRun)
-        .options(defer(BacktestRun.trade_log), defer(BacktestRun.equity_curve))
+        select(BacktestRun, BacktestRun.result_summary["pnl_pct"].as_float().label("pnl_pct"))
         .order_by(desc(BacktestRun.created_at))
         .limit(50)
     )
     result = await session.execute(stmt)
-    runs = result.scalars().all()
+    rows = result.all()
 
     # Collect pinned status from JSON files (offload blocking I/O to thread)
     def _get_pinned_ids() -> set[str]:
@@ -292,10 +325,7 @@ async def list_backtests(
     pinned_ids = await asyncio.to_thread(_get_pinned_ids)
 
     items = []
-    for r in runs:
-        pnl_pct = None
-        if r.result_summary and "pnl_pct" in r.result_summary:
-            pnl_pct = r.result_summary["pnl_pct"]
+    for r, pnl_pct in rows:
         items.append(
             BacktestListItem(
                 id=r.id,
@@ -342,7 +372,9 @@ def _saved_path(run_id: str) -> Path:
     return SAVED_DIR / f"{run_id}.json"
 
 
-def _auto_save(run: BacktestRun, candles: list[dict]) -> None:
+def _auto_save(
+    run: BacktestRun, candles: list[ChartCandle], trade_log: list[TradeLogEntry], equity_curve: list[EquityPoint]
+) -> None:
     """Auto-save report to JSON on first view (idempotent)."""
     path = _saved_path(str(run.id))
     if path.exists():
@@ -361,8 +393,8 @@ def _auto_save(run: BacktestRun, candles: list[dict]) -> None:
             "end_ts_ms": run.end_ts_ms,
         },
         "summary": run.result_summary,
-        "trade_log": run.trade_log,
-        "equity_curve": run.equity_curve,
+        "trade_log": trade_log,
+        "equity_curve": equity_curve,
         "candles": candles,
     }
     try:
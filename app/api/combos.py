@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import logging
+from functools import cache
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, Request
@@ -31,16 +32,27 @@ router = APIRouter(prefix="/api", tags=["combos"])
 # --- Logic listing ---
 
 
+@cache
+def _buy_logic_infos() -> list[BuyLogicInfo]:
+    # 로직 등록은 app.strategies import 시점에 끝나므로 검증된 목록을 한 번만 만든다
+    return [BuyLogicInfo.model_validate(info) for info in BuyLogicRegistry.list_all()]
+
+
+@cache
+def _sell_logic_infos() -> list[SellLogicInfo]:
+    return [SellLogicInfo.model_validate(info) for info in SellLogicRegistry.list_all()]
+
+
 @router.get("/buy-logics", response_model=list[BuyLogicInfo])
 @limiter.limit("120/minute")
 async def list_buy_logics(request: Request, _user: dict = Depends(get_current_user)):
-    return BuyLogicRegistry.list_all()
+    return _buy_logic_infos()
 
 
 @router.get("/sell-logics", response_model=list[SellLogicInfo])
 @limiter.limit("120/minute")
 async def list_sell_logics(request: Request, _user: dict = Depends(get_current_user)):
-    return SellLogicRegistry.list_all()
+    return _sell_logic_infos()
 
 
 # --- Combo CRUD ---
@@ -203,7 +215,7 @@ async def delete_combo(
         select(Lot)
         .where(
             Lot.account_id == account.id,
-            Lot.combo_id == combo_id,
+            Lot.combo_seq == combo.combo_seq,
             Lot.status == "OPEN",
         )
         .limit(1)
@@ -6,18 +6,19 @@ from typing import Literal
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, Query, Request
-from sqlalchemy import func, select
+from sqlalchemy import false, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import defer
+from sqlalchemy.orm import defer, undefer
 
 from app.db.position_repo import PositionRepository
 from app.db.price_repo import get_candles
 from app.db.session import get_trading_session
 from app.dependencies import get_owned_account, limiter
 from app.models.fill import Fill
-from app.models.lot import Lot
+from app.models.lot import LOT_STATUSES, Lot
 from app.models.order import Order
 from app.models.position import Position
+from app.models.trading_combo import combo_seq_of
 from app.schemas.dashboard import (
     AssetStatus,
     BuyPauseInfo,
@@ -27,7 +28,6 @@ from app.schemas.dashboard import (
     PositionInfo,
 )
 from app.schemas.trade import LotResponse, OrderResponse
-from app.services.account_state_manager import AccountStateManager
 
 router = APIRouter(prefix="/api/dashboard", tags=["dashboard"])
 
@@ -55,13 +55,10 @@ async def get_dashboard(
     result = await session.execute(stmt)
     total_profit = float(result.scalar_one())
 
-    # Reserve from shared state
-    account_state = AccountStateManager(account.id, session)
-    reserve_qty = await account_state.get_reserve_qty()
-    reserve_cost = await account_state.get_reserve_cost_usdt()
-
-    # Pending earnings
-    pending_earnings = await account_state.get_pending_earnings()
+    # Reserve / pending earnings — trading_accounts 컬럼이라 get_owned_account가 읽은 행에 이미 있음
+    reserve_qty = float(account.reserve_qty)
+    reserve_cost = float(account.reserve_cost_usdt)
+    pending_earnings = float(account.pending_earnings_usdt)
 
     # Health
     engine = request.app.state.trading_engine
@@ -110,14 +107,15 @@ async def get_lots(
     account=Depends(get_owned_account),
     session: AsyncSession = Depends(get_trading_session),
 ):
-    filters = [Lot.account_id == account.id, Lot.status == status]
+    # CANCELLED는 lot_status ENUM에 없는 값 — 빈 결과 (ENUM 캐스트 오류 방지)
+    filters = [Lot.account_id == account.id, Lot.status == status if status in LOT_STATUSES else false()]
     if combo_id:
-        filters.append(Lot.combo_id == combo_id)
+        filters.append(Lot.combo_seq == combo_seq_of(account.id, combo_id))
     elif strategy:
         filters.append(Lot.strategy_name == strategy)
     stmt = (
         select(Lot)
-        .options(defer(Lot.metadata_))
+        .options(defer(Lot.metadata_), undefer(Lot.combo_id))
         .where(*filters)
         .order_by(Lot.lot_id.desc())
         .offset(offset)
@@ -185,13 +183,7 @@ async def get_trades(
     account=Depends(get_owned_account),
     session: AsyncSession = Depends(get_trading_session),
 ):
-    stmt = (
-        select(Order)
-        .options(defer(Order.raw_json))
-        .where(Order.account_id == account.id)
-        .order_by(Order.order_id.desc())
-        .limit(limit)
-    )
+    stmt = select(Order).where(Order.account_id == account.id).order_by(Order.order_id.desc()).limit(limit)
     result = await session.execute(stmt)
     return [OrderResponse.model_validate(o) for o in result.scalars().all()]
 
@@ -302,10 +294,9 @@ async def get_base_prices(
             scope = f"{combo.id}:{symbol}"
             row = (
                 await session.execute(
-                    select(StrategyState.value).where(
+                    select(StrategyState.state["base_price"].astext).where(
                         StrategyState.account_id == account.id,
                         StrategyState.scope == scope,
-                        StrategyState.key == "base_price",
                     )
                 )
             ).scalar_one_or_none()
@@ -375,13 +366,10 @@ async def get_asset_status(
     if held_symbols:
         primary_price = next((h.current_price for h in held_symbols if h.symbol == account.symbol), 0.0)
 
-    # Reserve pool
-    account_state = AccountStateManager(account.id, session)
-    reserve_qty = await account_state.get_reserve_qty()
-    reserve_cost = await account_state.get_reserve_cost_usdt()
-
-    # Pending earnings
-    pending_earnings = await account_state.get_pending_earnings()
+    # Reserve pool / pending earnings (account 행에 로드됨)
+    reserve_qty = float(account.reserve_qty)
+    reserve_cost = float(account.reserve_cost_usdt)
+    pending_earnings = float(account.pending_earnings_usdt)
 
     # Total invested = cost basis of open lots
     stmt = select(func.coalesce(func.sum(Lot.buy_price * Lot.buy_qty), 0)).where(
@@ -472,7 +460,7 @@ async def get_trade_events(
     filters = [Fill.account_id == account.id]
     if symbol:
         filters.append(Fill.symbol == symbol)
-    stmt = select(Fill).options(defer(Fill.raw_json)).where(*filters).order_by(Fill.trade_time_ms.desc()).limit(limit)
+    stmt = select(Fill).where(*filters).order_by(Fill.trade_time_ms.desc()).limit(limit)
     result = await session.execute(stmt)
     fills = result.scalars().all()
 
@@ -5,6 +5,7 @@ from fastapi import APIRouter, Depends, HTTPException, Request
 from app.dependencies import get_current_user, limiter
 from app.schemas.auth import ChangePasswordRequest
 from app.schemas.common import MessageResponse
+from app.services.auth_service import LoginThrottledError
 
 router = APIRouter(prefix="/api/user", tags=["user"])
 
@@ -20,7 +21,10 @@ async def change_password(
     auth_service = request.app.state.auth_service
 
     # 현재 비밀번호 검증 (brute-force 보호 자동 적용)
-    verified = await auth_service.authenticate(user["email"], req.current_password)
+    try:
+        verified = await auth_service.authenticate(user["email"], req.current_password)
+    except LoginThrottledError:
+        raise HTTPException(status_code=429, detail="Too many attempts. Try again later.")
     if not verified:
         raise HTTPException(status_code=400, detail="Current password is incorrect.")
 
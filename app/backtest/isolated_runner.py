@@ -19,9 +19,11 @@ from app.backtest.mem_stores import (
     InMemoryOrderRepository,
     InMemoryStateStore,
 )
+from app.db.bulk import copy_records
 from app.db.session import TradingSessionLocal  # results/status 저장용
 from app.exchange.backtest_client import BacktestClient
 from app.models.backtest_run import BacktestRun
+from app.models.backtest_trade import BacktestEquityPoint, BacktestTrade
 from app.strategies.registry import BuyLogicRegistry, SellLogicRegistry
 
 logger = logging.getLogger(__name__)
@@ -35,6 +37,15 @@ MAX_CANDLES = 10_000_000
 EQUITY_SAMPLE_INTERVAL = 12  # every 12 candles = 1 hour for 5m candles
 
 
+def _max_drawdown_pct(values: np.ndarray) -> float:
+    """최고점 대비 최대 낙폭(%, 양수). 누적 최대값으로 한 번에 계산 — 샘플 수십만 개도 Python 루프 없이 처리."""
+    peaks = np.maximum.accumulate(np.maximum(values, 0.0))
+    mask = peaks > 0
+    if not mask.any():
+        return 0.0
+    return float(((peaks[mask] - values[mask]) / peaks[mask] * 100).max())
+
+
 class IsolatedBacktestRunner:
     """In-memory backtest runner.
 
@@ -153,7 +164,9 @@ class IsolatedBacktestRunner:
             # ----------------------------------------------------------------
             client = BacktestClient(symbol=symbol, initial_balance_usdt=initial_usdt)
             account_id = uuid4()
-            equity_curve: list[dict] = []
+            # 자산 곡선은 행(dict) 대신 컬럼 두 개로 쌓는다 — 샘플 수십만 개에서 dict 오버헤드 제거
+            equity_ts_ms: list[int] = []
+            equity_values: list[float] = []
 
             # Shared in-memory stores
             shared_backing: dict[str, str] = {}
@@ -324,7 +337,8 @@ class IsolatedBacktestRunner:
                     # Sample equity curve periodically
                     if i % EQUITY_SAMPLE_INTERVAL == 0:
                         eq_val = self._calc_equity(client, price, base_asset)
-                        equity_curve.append({"ts_ms": ts_ms, "value": round(eq_val, 2)})
+                        equity_ts_ms.append(ts_ms)
+                        equity_values.append(round(eq_val, 2))
 
                     # Progress log every ~10%
                     if i > 0 and i % progress_interval == 0:
@@ -340,13 +354,9 @@ class IsolatedBacktestRunner:
                 final_price = close_arr[-1]
                 final_equity = self._calc_equity(client, final_price, base_asset)
                 final_ts_ms = ts_ms_arr[-1]
-                if not equity_curve or equity_curve[-1]["ts_ms"] != final_ts_ms:
-                    equity_curve.append(
-                        {
-                            "ts_ms": final_ts_ms,
-                            "value": round(final_equity, 2),
-                        }
-                    )
+                if not equity_ts_ms or equity_ts_ms[-1] != final_ts_ms:
+                    equity_ts_ms.append(final_ts_ms)
+                    equity_values.append(round(final_equity, 2))
 
                 # Collect results
                 first_price = close_arr[0]
@@ -355,7 +365,8 @@ class IsolatedBacktestRunner:
                     first_price,
                     final_price,
                     initial_usdt,
-                    equity_curve,
+                    np.asarray(equity_ts_ms, dtype=np.int64),
+                    np.asarray(equity_values, dtype=np.float64),
                     base_asset,
                     lot_repo,
                 )
@@ -439,7 +450,8 @@ class IsolatedBacktestRunner:
         first_price: float,
         final_price: float,
         initial_usdt: float,
-        equity_curve: list[dict],
+        equity_ts_ms: np.ndarray,
+        equity_values: np.ndarray,
         base_asset: str,
         lot_repo: InMemoryLotRepository | None = None,
     ) -> dict:
@@ -493,16 +505,7 @@ class IsolatedBacktestRunner:
         profit_factor = (gross_profit / gross_loss) if gross_loss > 0 else float("inf") if gross_profit > 0 else 0.0
 
         # Max drawdown from equity curve
-        max_drawdown_pct = 0.0
-        peak = 0.0
-        for point in equity_curve:
-            val = point["value"]
-            if val > peak:
-                peak = val
-            if peak > 0:
-                drawdown_pct = (peak - val) / peak * 100
-                if drawdown_pct > max_drawdown_pct:
-                    max_drawdown_pct = drawdown_pct
+        max_drawdown_pct = _max_drawdown_pct(equity_values)
 
         # Symbol quantity change (pure accumulation, price-neutral)
         # BEFORE: initial USDT → BTC at first price
@@ -536,7 +539,8 @@ class IsolatedBacktestRunner:
         return {
             "summary": summary,
             "trade_log": trade_log,
-            "equity_curve": equity_curve,
+            "equity_ts_ms": equity_ts_ms,
+            "equity_values": equity_values,
         }
 
     @staticmethod
@@ -555,21 +559,40 @@ class IsolatedBacktestRunner:
         return obj
 
     async def _save_results(self, run_id: UUID, results: dict) -> None:
-        """Persist results to backtest_runs table."""
-        safe_results = self._json_safe(results)
+        """Persist summary to backtest_runs and trade log / equity curve to child tables (COPY)."""
+        summary = self._json_safe(results["summary"])
+        trade_log = self._json_safe(results["trade_log"])
         async with TradingSessionLocal() as session:
             stmt = (
                 update(BacktestRun)
                 .where(BacktestRun.id == run_id)
                 .values(
                     status="COMPLETED",
-                    result_summary=safe_results["summary"],
-                    trade_log=safe_results["trade_log"],
-                    equity_curve=safe_results["equity_curve"],
+                    result_summary=summary,
                     completed_at=datetime.now(UTC),
                 )
             )
             await session.execute(stmt)
+            await copy_records(
+                session,
+                BacktestTrade.__tablename__,
+                ("run_id", "idx", "ts_ms", "side", "price", "qty", "quote_qty"),
+                (
+                    (run_id, i, int(t["ts_ms"]), t["side"], float(t["price"]), float(t["qty"]), float(t["quote_qty"]))
+                    for i, t in enumerate(trade_log)
+                ),
+            )
+            await copy_records(
+                session,
+                BacktestEquityPoint.__tablename__,
+                ("run_id", "ts_ms", "equity_usdt"),
+                (
+                    (run_id, ts_ms, value)
+                    for ts_ms, value in zip(
+                        results["equity_ts_ms"].tolist(), results["equity_values"].tolist(), strict=True
+                    )
+                ),
+            )
             await session.commit()
 
     async def _save_failure(self, run_id: UUID, error_msg: str) -> None:
@@ -340,8 +340,9 @@ class InMemoryOrderRepository:
     async def insert_fill(self, account_id: UUID, order_id: int, trade_data: dict) -> None:
         """No-op for in-memory backtest (fills tracked via lot close)."""
 
-    async def insert_fills_batch(self, account_id: UUID, fills: list[tuple[int, dict]]) -> None:
+    async def insert_fills_batch(self, account_id: UUID, fills: list[tuple[int, dict]]) -> int:
         """No-op for in-memory backtest (fills tracked via lot close)."""
+        return 0
 
     async def get_order(self, account_id: UUID, order_id: int) -> MemOrder | None:
         return self._orders.get((order_id, account_id))
@@ -2,7 +2,7 @@ import logging
 import secrets
 from functools import lru_cache
 
-from pydantic import model_validator
+from pydantic import Field, model_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 _config_logger = logging.getLogger(__name__)
@@ -11,6 +11,8 @@ _config_logger = logging.getLogger(__name__)
 class GlobalConfig(BaseSettings):
     # Database (트레이딩 엔진용 직접 연결)
     database_url: str = ""
+    # prepared statement 캐시 크기 (연결당). PgBouncer transaction 모드에서는 0
+    db_statement_cache_size: int = 500
 
     # Encryption (쉼표 구분 다중 키)
     encryption_keys: str = ""  # "key1,key2,key3"
@@ -19,6 +21,9 @@ class GlobalConfig(BaseSettings):
     session_secret_key: str = ""
     csrf_secret: str = ""
 
+    # Auth — bcrypt cost factor (2^rounds). 높일수록 로그인/가입 1회당 CPU 시간 증가
+    bcrypt_rounds: int = Field(12, ge=4, le=31)
+
     # App
     app_host: str = "0.0.0.0"
     app_port: int = 8000
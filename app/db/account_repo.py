@@ -5,10 +5,11 @@ from uuid import UUID
 
 from sqlalchemy import select, update
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import joinedload, selectinload
 
 from app.models.account import TradingAccount
 from app.models.trading_combo import TradingCombo
+from app.models.user import UserProfile
 
 
 class AccountRepository:
@@ -19,6 +20,19 @@ class AccountRepository:
         """Fetch account by primary key."""
         return await self._session.get(TradingAccount, account_id)
 
+    async def get_with_enabled_combos(self, account_id: UUID) -> TradingAccount | None:
+        """Fetch account with only its enabled combos loaded into trading_combos, in one query.
+
+        trading_combos는 필터된 컬렉션이므로 이 세션에서는 비활성 콤보가 보이지 않는다.
+        """
+        stmt = (
+            select(TradingAccount)
+            .where(TradingAccount.id == account_id)
+            .options(joinedload(TradingAccount.trading_combos.and_(TradingCombo.is_enabled.is_(True))))
+        )
+        result = await self._session.execute(stmt)
+        return result.unique().scalar_one_or_none()
+
     async def get_active_accounts(self) -> list[TradingAccount]:
         """Return all accounts where is_active=True."""
         stmt = select(TradingAccount).where(TradingAccount.is_active.is_(True))
@@ -108,9 +122,10 @@ class AccountRepository:
         return list(result.scalars().all())
 
     async def get_all_accounts_with_owner(self) -> list[TradingAccount]:
-        """Return all accounts with owner and trading_combos eagerly loaded."""
+        """Return all accounts with owner email and trading_combos eagerly loaded."""
         stmt = select(TradingAccount).options(
-            selectinload(TradingAccount.owner),
+            # many-to-one: 같은 쿼리에서 JOIN, 목록에는 이메일만 쓰므로 password_hash 등은 읽지 않는다
+            joinedload(TradingAccount.owner, innerjoin=True).load_only(UserProfile.email),
             selectinload(TradingAccount.trading_combos).defer(TradingCombo.buy_params).defer(TradingCombo.sell_params),
         )
         result = await self._session.execute(stmt)
@@ -0,0 +1,67 @@
+"""COPY 기반 대량 적재 헬퍼.
+
+행 단위 INSERT(파싱/플랜/실행 반복) 대신 asyncpg의 binary COPY로 한 번에 적재한다.
+세션의 현재 트랜잭션 안에서 실행되므로 commit/rollback은 호출자가 관리한다.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Sequence
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.session import FLOAT_NUMERIC_CODEC, set_float_numeric_codec
+
+
+async def copy_records(
+    session: AsyncSession,
+    table: str,
+    columns: Sequence[str],
+    records: Iterable[tuple],
+) -> int:
+    """COPY records into table within the session's transaction. Returns rows copied."""
+    conn = await session.connection()
+    raw = await conn.get_raw_connection()
+    driver = raw.driver_connection
+    if not driver.is_in_transaction():
+        # SQLAlchemy asyncpg 어댑터는 첫 statement 실행 시 BEGIN을 보낸다.
+        # 먼저 트랜잭션을 열지 않으면 COPY가 autocommit되어 rollback 대상에서 빠진다.
+        await conn.exec_driver_sql("SELECT 1")
+    float_numeric = raw.info.get(FLOAT_NUMERIC_CODEC, False)
+    if float_numeric:
+        # binary COPY는 text 전용 float 코덱으로 인코딩할 수 없다
+        await driver.reset_type_codec("numeric", schema="pg_catalog")
+    try:
+        status = await driver.copy_records_to_table(table, records=records, columns=list(columns))
+    finally:
+        if float_numeric:
+            await set_float_numeric_codec(driver)
+    return int(status.split()[-1])
+
+
+async def copy_insert_ignore(
+    session: AsyncSession,
+    table: str,
+    columns: Sequence[str],
+    records: Iterable[tuple],
+    conflict_columns: Sequence[str],
+) -> int:
+    """COPY into a temp staging table, then INSERT ... ON CONFLICT DO NOTHING into table.
+
+    COPY 자체는 ON CONFLICT를 지원하지 않으므로 멱등 적재가 필요한 fills/candles용.
+    Returns rows actually inserted (duplicates excluded).
+    """
+    # SAFETY: table/column names come from callers' static constants — no user input
+    staging = f"_copy_stage_{table}"
+    cols = ", ".join(columns)
+    await session.execute(text(f"CREATE TEMP TABLE {staging} (LIKE {table} INCLUDING DEFAULTS) ON COMMIT DROP"))
+    await copy_records(session, staging, columns, records)
+    result = await session.execute(
+        text(
+            f"INSERT INTO {table} ({cols}) SELECT {cols} FROM {staging} "
+            f"ON CONFLICT ({', '.join(conflict_columns)}) DO NOTHING"
+        )
+    )
+    await session.execute(text(f"DROP TABLE {staging}"))
+    return result.rowcount
@@ -4,11 +4,12 @@ import logging
 from datetime import UTC, datetime
 from uuid import UUID
 
-from sqlalchemy import select, update
+from sqlalchemy import insert, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import defer
 
 from app.models.lot import Lot
+from app.models.trading_combo import combo_seq_of
 
 logger = logging.getLogger(__name__)
 
@@ -16,6 +17,9 @@ logger = logging.getLogger(__name__)
 class LotRepository:
     def __init__(self, session: AsyncSession):
         self._session = session
+        # 이 리포지토리(=한 사이클)에서 새로 연/닫은 lot 수. 사이클 후 매도 감지에 COUNT 쿼리 대신 사용
+        self.lots_opened = 0
+        self.lots_closed = 0
 
     async def get_open_lots(
         self,
@@ -65,7 +69,7 @@ class LotRepository:
             .where(
                 Lot.account_id == account_id,
                 Lot.symbol == symbol,
-                Lot.combo_id == combo_id,
+                Lot.combo_seq == combo_seq_of(account_id, combo_id),
                 Lot.status == "OPEN",
             )
             .order_by(Lot.buy_time_ms.asc())
@@ -103,19 +107,24 @@ class LotRepository:
                 )
                 return existing
 
-        lot = Lot(
-            account_id=account_id,
-            symbol=symbol,
-            strategy_name=strategy_name,
-            buy_order_id=buy_order_id,
-            buy_price=buy_price,
-            buy_qty=buy_qty,
-            buy_time_ms=buy_time_ms,
-            combo_id=combo_id,
-            status="OPEN",
+        # combo_seq는 별도 SELECT 없이 INSERT 안의 서브쿼리로 해석하고, RETURNING으로 로드된 Lot을 받는다
+        stmt = (
+            insert(Lot)
+            .values(
+                account_id=account_id,
+                symbol=symbol,
+                strategy_name=strategy_name,
+                buy_order_id=buy_order_id,
+                buy_price=buy_price,
+                buy_qty=buy_qty,
+                buy_time_ms=buy_time_ms,
+                combo_seq=combo_seq_of(account_id, combo_id) if combo_id is not None else None,
+                status="OPEN",
+            )
+            .returning(Lot)
         )
-        self._session.add(lot)
-        await self._session.flush()
+        lot = await self._session.scalar(stmt)
+        self.lots_opened += 1
         return lot
 
     async def close_lot(
@@ -129,12 +138,13 @@ class LotRepository:
         net_profit_usdt: float,
         sell_order_id: int | None = None,
     ) -> None:
-        """Close a lot (set status=CLOSED with sell details)."""
+        """Close a lot (set status=CLOSED with sell details). Already-closed lots are left untouched."""
         stmt = (
             update(Lot)
             .where(
                 Lot.account_id == account_id,
                 Lot.lot_id == lot_id,
+                Lot.status == "OPEN",
             )
             .values(
                 status="CLOSED",
@@ -146,7 +156,8 @@ class LotRepository:
                 sell_order_id=sell_order_id,
             )
         )
-        await self._session.execute(stmt)
+        result = await self._session.execute(stmt)
+        self.lots_closed += result.rowcount
 
     async def set_sell_order(
         self,
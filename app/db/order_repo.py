@@ -9,6 +9,9 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from app.models.fill import Fill
 from app.models.order import Order
 
+# 더 이상 체결/변경이 생기지 않는 주문 상태
+FINAL_ORDER_STATUSES = ("FILLED", "CANCELED", "REJECTED", "EXPIRED")
+
 
 class OrderRepository:
     def __init__(self, session: AsyncSession):
@@ -30,7 +33,7 @@ class OrderRepository:
 
     async def get_order(self, account_id: UUID, order_id: int) -> Order | None:
         """Fetch a single order by composite PK."""
-        return await self._session.get(Order, (order_id, account_id))
+        return await self._session.get(Order, (account_id, order_id))
 
     async def get_recent_open_orders(self, account_id: UUID, limit: int = 50) -> list[int]:
         """Return order_ids whose status is NEW or PARTIALLY_FILLED."""
@@ -46,6 +49,18 @@ class OrderRepository:
         result = await self._session.execute(stmt)
         return list(result.scalars().all())
 
+    async def get_final_order_ids(self, account_id: UUID, order_ids: list[int]) -> set[int]:
+        """Return the subset of order_ids already stored with a final status (no further fills possible)."""
+        if not order_ids:
+            return set()
+        stmt = select(Order.order_id).where(
+            Order.account_id == account_id,
+            Order.order_id.in_(order_ids),
+            Order.status.in_(FINAL_ORDER_STATUSES),
+        )
+        result = await self._session.execute(stmt)
+        return set(result.scalars().all())
+
     async def get_fills_for_order(self, account_id: UUID, order_id: int) -> list[Fill]:
         """특정 주문의 체결 내역 조회."""
         stmt = select(Fill).where(
@@ -78,10 +93,13 @@ class OrderRepository:
         )
         await self._session.execute(stmt)
 
-    async def insert_fills_batch(self, account_id: UUID, fills: list[tuple[int, dict]]) -> None:
-        """Batch insert fills in a single multi-row INSERT ... ON CONFLICT DO NOTHING."""
+    async def insert_fills_batch(self, account_id: UUID, fills: list[tuple[int, dict]]) -> int:
+        """Batch insert fills in a single multi-row INSERT ... ON CONFLICT DO NOTHING.
+
+        Returns the number of newly inserted fills (duplicates excluded).
+        """
         if not fills:
-            return
+            return 0
         rows = []
         for order_id, trade_data in fills:
             side = "BUY" if trade_data.get("isBuyer") else "SELL"
@@ -108,7 +126,8 @@ class OrderRepository:
                 index_elements=["trade_id", "account_id"],
             )
         )
-        await self._session.execute(stmt)
+        result = await self._session.execute(stmt)
+        return result.rowcount
 
     def _build_order_values(self, account_id: UUID, order_data: dict) -> dict:
         """Build values dict from Binance API response for Order upsert."""
@@ -134,7 +153,15 @@ class OrderRepository:
         """Batch upsert orders in a single multi-row INSERT ... ON CONFLICT DO UPDATE."""
         if not orders:
             return
-        rows = [self._build_order_values(account_id, o) for o in orders]
+        # 한 statement 안에서 같은 order_id가 두 번 나오면 ON CONFLICT DO UPDATE가 실패하므로
+        # updateTime이 가장 최신인 응답만 남긴다
+        latest: dict[int, dict] = {}
+        for o in orders:
+            row = self._build_order_values(account_id, o)
+            prev = latest.get(row["order_id"])
+            if prev is None or (row["update_time_ms"] or 0) >= (prev["update_time_ms"] or 0):
+                latest[row["order_id"]] = row
+        rows = list(latest.values())
         update_cols = {k for k in rows[0] if k not in ("order_id", "account_id")}
         stmt = (
             pg_insert(Order)
@@ -1,5 +1,6 @@
 import logging
 import time
+import uuid
 
 from sqlalchemy import event
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
@@ -9,18 +10,56 @@ from app.config import get_settings
 settings = get_settings()
 _slow_query_logger = logging.getLogger("db.slow_query")
 
+
+def _statement_cache_args(cache_size: int) -> dict:
+    """asyncpg connect_args — 계정별 반복 쿼리의 parse/plan 비용을 prepared statement 캐시로 절약.
+
+    cache_size=0 (PgBouncer transaction 모드): 캐시를 끄고, 서버 연결이 바뀌어도
+    이름이 충돌하지 않도록 prepared statement 이름을 매번 고유하게 만든다.
+    """
+    args: dict = {"prepared_statement_cache_size": cache_size, "statement_cache_size": cache_size}
+    if cache_size == 0:
+        args["prepared_statement_name_func"] = lambda: f"__asyncpg_{uuid.uuid4()}__"
+    return args
+
+
 # 1) 트레이딩 엔진용: SQLAlchemy 직접 PostgreSQL 연결 (RLS 바이패스)
 engine_trading = create_async_engine(
     settings.database_url or "postgresql+asyncpg://localhost/crypto_trader",
-    pool_size=15,
+    # 트레이더는 사이클당 세션 1개를 잡으므로 계정 수만큼은 상시 풀에 둔다 (overflow는 API/백그라운드 작업용)
+    pool_size=max(15, settings.max_accounts_per_instance),
     max_overflow=10,
+    pool_recycle=1800,
     pool_pre_ping=True,
     echo=settings.sql_echo,
+    connect_args=_statement_cache_args(settings.db_statement_cache_size),
 )
 
 TradingSessionLocal = async_sessionmaker(engine_trading, class_=AsyncSession, expire_on_commit=False)
 
 
+FLOAT_NUMERIC_CODEC = "float_numeric_codec"
+
+
+async def set_float_numeric_codec(driver_connection) -> None:
+    """asyncpg 연결에서 NUMERIC을 Decimal 대신 float로 디코딩하도록 설정."""
+    await driver_connection.set_type_codec("numeric", encoder=str, decoder=float, schema="pg_catalog", format="text")
+
+
+def register_float_numeric_codec(dbapi_connection, connection_record) -> None:
+    """Pool "connect" 이벤트 핸들러 — 새 연결마다 float NUMERIC 코덱 등록.
+
+    모델의 Price/Qty/Usdt는 모두 asdecimal=False라 결국 float로 변환되므로,
+    드라이버 단계에서 Decimal 객체 생성을 건너뛴다 (캔들/체결 대량 조회 hot path).
+    text 전용 코덱이라 binary COPY(app.db.bulk)는 COPY 동안 기본 코덱으로 되돌린다.
+    """
+    dbapi_connection.run_async(set_float_numeric_codec)
+    connection_record.info[FLOAT_NUMERIC_CODEC] = True
+
+
+event.listen(engine_trading.sync_engine, "connect", register_float_numeric_codec)
+
+
 # Slow query detection
 @event.listens_for(engine_trading.sync_engine, "before_cursor_execute")
 def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
@@ -4,6 +4,7 @@ import asyncio
 import contextlib
 import logging
 import os
+import time
 from concurrent.futures import ThreadPoolExecutor
 from contextlib import asynccontextmanager
 
@@ -40,8 +41,10 @@ from app.middleware.metrics_middleware import MetricsMiddleware
 from app.middleware.no_cache_html import NoCacheHTMLMiddleware
 from app.middleware.request_id import RequestIdMiddleware
 from app.middleware.security_headers import SecurityHeadersMiddleware
+from app.schemas.common import build_deferred_schemas
 from app.services.auth_service import AuthService
 from app.services.candle_aggregator import run_aggregation_loop
+from app.services.candle_store import ensure_candle_partitions_1m
 from app.services.rate_limiter import GlobalRateLimiter
 from app.services.session_manager import SessionManager
 from app.services.trading_engine import TradingEngine
@@ -93,6 +96,9 @@ async def lifespan(app: FastAPI):
     logger = logging.getLogger(__name__)
     logger.info("Starting crypto-multi-trader...")
 
+    # defer_build 응답 스키마를 요청 경로 밖에서 컴파일
+    logger.info("Built %d deferred schemas", build_deferred_schemas())
+
     # Thread pool for asyncio.to_thread (Binance sync calls)
     loop = asyncio.get_running_loop()
     pool_size = max(MIN_THREAD_POOL_SIZE, settings.thread_pool_size)
@@ -131,6 +137,15 @@ async def lifespan(app: FastAPI):
         if not task.cancelled() and task.exception():
             logger.critical("Trading engine crashed: %s", task.exception())
 
+    # 1m 캔들 일별 파티션은 엔진(WS 백필)이 캔들을 쓰기 전에 만들어야 한다.
+    # 먼저 DEFAULT 파티션에 그날 행이 들어가면 해당 일자 파티션을 만들 수 없다.
+    try:
+        async with TradingSessionLocal() as session:
+            await ensure_candle_partitions_1m(int(time.time() * 1000), session=session)
+            await session.commit()
+    except Exception as e:
+        logger.error("Startup 1m partition maintenance failed: %s", e)
+
     engine_task = asyncio.create_task(engine.start())
     engine_task.add_done_callback(_on_engine_error)
 
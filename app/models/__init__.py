@@ -1,5 +1,6 @@
 from app.models.account import TradingAccount
 from app.models.backtest_run import BacktestRun
+from app.models.backtest_trade import BacktestEquityPoint, BacktestTrade
 from app.models.base import Base
 from app.models.core_btc_history import CoreBtcHistory
 from app.models.daily_report import DailyReport
@@ -41,6 +42,8 @@ __all__ = [
     "PriceCandle1d",
     # Backtest
     "BacktestRun",
+    "BacktestTrade",
+    "BacktestEquityPoint",
     # Log Persistence
     "PersistentLog",
     "DailyReport",
@@ -1,11 +1,13 @@
 import enum
 import uuid
 from datetime import datetime
+from typing import Literal, get_args
 
-from sqlalchemy import Boolean, CheckConstraint, DateTime, ForeignKey, Index, Integer, Numeric, String
+from sqlalchemy import Boolean, DateTime, Enum, ForeignKey, Index, Integer, String
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from app.models.base import Base, TimestampMixin
+from app.models.base import Base, Qty, TimestampMixin, Usdt
+from app.utils.uuid7 import uuid7
 
 
 class BuyPauseState(enum.StrEnum):
@@ -14,17 +16,16 @@ class BuyPauseState(enum.StrEnum):
     PAUSED = "PAUSED"
 
 
+# 응답 스키마용 Literal — StrEnum과 어긋나면 import 시점에 실패
+BuyPauseStateName = Literal["ACTIVE", "THROTTLED", "PAUSED"]
+assert get_args(BuyPauseStateName) == tuple(BuyPauseState), "BuyPauseStateName must match BuyPauseState"
+
+
 class TradingAccount(TimestampMixin, Base):
     __tablename__ = "trading_accounts"
-    __table_args__ = (
-        CheckConstraint(
-            "buy_pause_state IN ('ACTIVE', 'THROTTLED', 'PAUSED')",
-            name="chk_buy_pause_state",
-        ),
-        Index("idx_trading_accounts_owner", "owner_id"),
-    )
+    __table_args__ = (Index("idx_trading_accounts_owner", "owner_id"),)
 
-    id: Mapped[uuid.UUID] = mapped_column(primary_key=True, default=uuid.uuid4)
+    id: Mapped[uuid.UUID] = mapped_column(primary_key=True, default=uuid7)
     owner_id: Mapped[uuid.UUID] = mapped_column(ForeignKey("user_profiles.id", ondelete="CASCADE"), nullable=False)
     name: Mapped[str] = mapped_column(String, nullable=False)
     exchange: Mapped[str] = mapped_column(String, nullable=False, server_default="binance")
@@ -44,24 +45,58 @@ class TradingAccount(TimestampMixin, Base):
     auto_recovery_attempts: Mapped[int] = mapped_column(Integer, nullable=False, server_default="0")
     last_auto_recovery_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
     last_success_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
-    buy_pause_state: Mapped[str] = mapped_column(String(20), nullable=False, server_default=BuyPauseState.ACTIVE.value)
+    buy_pause_state: Mapped[str] = mapped_column(
+        Enum(*(s.value for s in BuyPauseState), name="buy_pause_state"),
+        nullable=False,
+        server_default=BuyPauseState.ACTIVE.value,
+    )
     buy_pause_reason: Mapped[str | None] = mapped_column(String(50), nullable=True)
     buy_pause_since: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
     consecutive_low_balance: Mapped[int] = mapped_column(Integer, nullable=False, server_default="0")
-    pending_earnings_usdt: Mapped[float] = mapped_column(Numeric(asdecimal=False), nullable=False, server_default="0")
+    pending_earnings_usdt: Mapped[float] = mapped_column(Usdt, nullable=False, server_default="0")
+    reserve_qty: Mapped[float] = mapped_column(Qty, nullable=False, server_default="0")
+    reserve_cost_usdt: Mapped[float] = mapped_column(Usdt, nullable=False, server_default="0")
     loop_interval_sec: Mapped[int] = mapped_column(Integer, nullable=False, server_default="60")
     order_cooldown_sec: Mapped[int] = mapped_column(Integer, nullable=False, server_default="7")
     is_paper: Mapped[bool] = mapped_column(Boolean, nullable=False, server_default="false")
-    paper_initial_balance: Mapped[float] = mapped_column(Numeric(asdecimal=False), nullable=False, server_default="0")
+    paper_initial_balance: Mapped[float] = mapped_column(Usdt, nullable=False, server_default="0")
 
     owner = relationship("UserProfile", back_populates="accounts")
-    strategy_configs = relationship("StrategyConfig", back_populates="account", cascade="all, delete-orphan")
-    strategy_states = relationship("StrategyState", back_populates="account", cascade="all, delete-orphan")
-    orders = relationship("Order", back_populates="account", cascade="all, delete-orphan")
-    fills = relationship("Fill", back_populates="account", cascade="all, delete-orphan")
-    lots = relationship("Lot", back_populates="account", cascade="all, delete-orphan")
-    positions = relationship("Position", back_populates="account", cascade="all, delete-orphan")
-    trading_combos = relationship("TradingCombo", back_populates="account", cascade="all, delete-orphan")
+    # 자식 컬렉션은 암묵적 lazy load 금지 (N+1 방지) — 필요한 쪽에서 selectinload()로 명시.
+    # 자식 FK가 모두 ON DELETE CASCADE이므로 삭제 시 컬렉션 로드 없이 DB에 위임 (passive_deletes).
+    strategy_configs = relationship(
+        "StrategyConfig",
+        back_populates="account",
+        cascade="all, delete-orphan",
+        lazy="raise_on_sql",
+        passive_deletes=True,
+    )
+    strategy_states = relationship(
+        "StrategyState",
+        back_populates="account",
+        cascade="all, delete-orphan",
+        lazy="raise_on_sql",
+        passive_deletes=True,
+    )
+    orders = relationship(
+        "Order", back_populates="account", cascade="all, delete-orphan", lazy="raise_on_sql", passive_deletes=True
+    )
+    fills = relationship(
+        "Fill", back_populates="account", cascade="all, delete-orphan", lazy="raise_on_sql", passive_deletes=True
+    )
+    lots = relationship(
+        "Lot", back_populates="account", cascade="all, delete-orphan", lazy="raise_on_sql", passive_deletes=True
+    )
+    positions = relationship(
+        "Position", back_populates="account", cascade="all, delete-orphan", lazy="raise_on_sql", passive_deletes=True
+    )
+    trading_combos = relationship(
+        "TradingCombo",
+        back_populates="account",
+        cascade="all, delete-orphan",
+        lazy="raise_on_sql",
+        passive_deletes=True,
+    )
 
     def __repr__(self) -> str:
         return f"<TradingAccount id={self.id} name={self.name!r} symbol={self.symbol!r} active={self.is_active}>"
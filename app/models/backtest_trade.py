@@ -0,0 +1,30 @@
+import uuid
+
+from sqlalchemy import BigInteger, ForeignKey, Integer, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.models.base import Base, Price, Qty, Usdt
+
+
+class BacktestTrade(Base):
+    """Backtest 체결 1건 — BacktestRun.trade_log JSONB를 정규화한 행."""
+
+    __tablename__ = "backtest_trades"
+
+    run_id: Mapped[uuid.UUID] = mapped_column(ForeignKey("backtest_runs.id", ondelete="CASCADE"), primary_key=True)
+    idx: Mapped[int] = mapped_column(Integer, primary_key=True)
+    ts_ms: Mapped[int] = mapped_column(BigInteger, nullable=False)
+    side: Mapped[str] = mapped_column(String, nullable=False)
+    price: Mapped[float] = mapped_column(Price, nullable=False)
+    qty: Mapped[float] = mapped_column(Qty, nullable=False)
+    quote_qty: Mapped[float] = mapped_column(Usdt, nullable=False)
+
+
+class BacktestEquityPoint(Base):
+    """Backtest 자산 곡선 샘플 — BacktestRun.equity_curve JSONB를 정규화한 행."""
+
+    __tablename__ = "backtest_equity"
+
+    run_id: Mapped[uuid.UUID] = mapped_column(ForeignKey("backtest_runs.id", ondelete="CASCADE"), primary_key=True)
+    ts_ms: Mapped[int] = mapped_column(BigInteger, primary_key=True)
+    equity_usdt: Mapped[float] = mapped_column(Usdt, nullable=False)
@@ -1,6 +1,7 @@
 from datetime import datetime
+from typing import Literal, get_args
 
-from sqlalchemy import BigInteger, DateTime, Integer, Numeric, String, func
+from sqlalchemy import BigInteger, DateTime, Enum, Integer, Numeric, String, func
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
 
 
@@ -8,6 +9,18 @@ class Base(DeclarativeBase):
     pass
 
 
+# Domain-sized NUMERIC types (Binance는 가격/수량 모두 소수점 8자리 이하).
+# 스케일을 고정해 저장 폭과 planner 추정치를 안정시킨다.
+Price = Numeric(18, 8, asdecimal=False)  # 단가 (최대 10^10)
+Qty = Numeric(28, 12, asdecimal=False)  # 코인 수량 / 거래량
+Usdt = Numeric(20, 8, asdecimal=False)  # USDT 금액 (원금, 수수료, 손익)
+
+# 고정된 값 집합은 PG ENUM으로 저장 (4바이트 고정폭, 문자열 collation 비교 없음)
+# 값 집합은 Literal 하나로 정의하고 DB ENUM과 응답 스키마 타입이 모두 여기서 파생된다
+OrderSideName = Literal["BUY", "SELL"]
+OrderSide = Enum(*get_args(OrderSideName), name="order_side")  # orders.side / fills.side 공유
+
+
 class CreatedAtMixin:
     """Mixin for models that only track creation time."""
 
@@ -29,15 +42,20 @@ class TimestampMixin(CreatedAtMixin, UpdatedAtMixin):
 
 
 class PriceCandleMixin(CreatedAtMixin):
-    """Shared columns for all price candle timeframe tables."""
-
-    id: Mapped[int] = mapped_column(BigInteger, primary_key=True, autoincrement=True)
-    symbol: Mapped[str] = mapped_column(String, nullable=False)
-    ts_ms: Mapped[int] = mapped_column(BigInteger, nullable=False)
-    open: Mapped[float] = mapped_column(Numeric(asdecimal=False), nullable=False)
-    high: Mapped[float] = mapped_column(Numeric(asdecimal=False), nullable=False)
-    low: Mapped[float] = mapped_column(Numeric(asdecimal=False), nullable=False)
-    close: Mapped[float] = mapped_column(Numeric(asdecimal=False), nullable=False)
-    volume: Mapped[float] = mapped_column(Numeric(asdecimal=False), nullable=False, server_default="0")
-    quote_volume: Mapped[float] = mapped_column(Numeric(asdecimal=False), nullable=False, server_default="0")
+    """Shared columns for all price candle timeframe tables.
+
+    PK는 자연키 (symbol, ts_ms) — 심볼별 기간 조회가 PK range scan이 된다.
+    """
+
+    # append-only 테이블: INSERT 후 server_default 값을 RETURNING으로 다시 읽지 않는다
+    __mapper_args__ = {"eager_defaults": False}
+
+    symbol: Mapped[str] = mapped_column(String, primary_key=True)
+    ts_ms: Mapped[int] = mapped_column(BigInteger, primary_key=True)
+    open: Mapped[float] = mapped_column(Price, nullable=False)
+    high: Mapped[float] = mapped_column(Price, nullable=False)
+    low: Mapped[float] = mapped_column(Price, nullable=False)
+    close: Mapped[float] = mapped_column(Price, nullable=False)
+    volume: Mapped[float] = mapped_column(Qty, nullable=False, server_default="0")
+    quote_volume: Mapped[float] = mapped_column(Qty, nullable=False, server_default="0")
     trade_count: Mapped[int] = mapped_column(Integer, nullable=False, server_default="0")
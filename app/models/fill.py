@@ -1,11 +1,11 @@
 import uuid
 from datetime import datetime
 
-from sqlalchemy import BigInteger, DateTime, ForeignKey, Index, Numeric, String, func
+from sqlalchemy import BigInteger, DateTime, ForeignKey, Index, String, func
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from app.models.base import Base
+from app.models.base import Base, OrderSide, Price, Qty, Usdt
 
 
 class Fill(Base):
@@ -16,21 +16,24 @@ class Fill(Base):
         Index("idx_fills_account_symbol", "account_id", "symbol"),
         Index("idx_fills_account_order", "account_id", "order_id"),
     )
+    __mapper_args__ = {"eager_defaults": False}
 
-    trade_id: Mapped[int] = mapped_column(BigInteger, primary_key=True)
+    # PK 컬럼 순서 = 선언 순서: account_id 선두로 계정별 행을 PK 범위 스캔
     account_id: Mapped[uuid.UUID] = mapped_column(
         ForeignKey("trading_accounts.id", ondelete="CASCADE"), primary_key=True
     )
+    trade_id: Mapped[int] = mapped_column(BigInteger, primary_key=True)
     order_id: Mapped[int | None] = mapped_column(BigInteger, nullable=True)
     symbol: Mapped[str] = mapped_column(String, nullable=False)
-    side: Mapped[str | None] = mapped_column(String, nullable=True)
-    price: Mapped[float | None] = mapped_column(Numeric(asdecimal=False), nullable=True)
-    qty: Mapped[float | None] = mapped_column(Numeric(asdecimal=False), nullable=True)
-    quote_qty: Mapped[float | None] = mapped_column(Numeric(asdecimal=False), nullable=True)
-    commission: Mapped[float | None] = mapped_column(Numeric(asdecimal=False), nullable=True)
+    side: Mapped[str | None] = mapped_column(OrderSide, nullable=True)
+    price: Mapped[float | None] = mapped_column(Price, nullable=True)
+    qty: Mapped[float | None] = mapped_column(Qty, nullable=True)
+    quote_qty: Mapped[float | None] = mapped_column(Usdt, nullable=True)
+    commission: Mapped[float | None] = mapped_column(Qty, nullable=True)
     commission_asset: Mapped[str | None] = mapped_column(String, nullable=True)
     trade_time_ms: Mapped[int | None] = mapped_column(BigInteger, nullable=True)
-    raw_json: Mapped[dict | None] = mapped_column(JSONB, nullable=True)
+    # Binance 원본 응답 — 조회 경로에서 거의 쓰지 않으므로 기본 SELECT에서 제외, 필요 시 undefer()
+    raw_json: Mapped[dict | None] = mapped_column(JSONB, nullable=True, deferred=True, deferred_raiseload=True)
     inserted_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
 
     account = relationship("TradingAccount", back_populates="fills")
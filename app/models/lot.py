@@ -1,22 +1,43 @@
 import uuid
 from datetime import datetime
+from typing import Literal, get_args
 
-from sqlalchemy import BigInteger, CheckConstraint, DateTime, ForeignKey, Index, Numeric, String, func, text
+from sqlalchemy import (
+    BigInteger,
+    DateTime,
+    Enum,
+    ForeignKey,
+    ForeignKeyConstraint,
+    Index,
+    SmallInteger,
+    String,
+    func,
+    select,
+    text,
+)
 from sqlalchemy.dialects.postgresql import JSONB
-from sqlalchemy.dialects.postgresql import UUID as PG_UUID
-from sqlalchemy.orm import Mapped, mapped_column, relationship
+from sqlalchemy.orm import Mapped, column_property, mapped_column, relationship
 
-from app.models.base import Base
+from app.models.base import Base, Price, Qty, Usdt
+from app.models.trading_combo import TradingCombo
 
-LOT_STATUSES = ("OPEN", "CLOSED", "MERGED")
+LotStatusName = Literal["OPEN", "CLOSED", "MERGED"]
+LOT_STATUSES = get_args(LotStatusName)
 
 
 class Lot(Base):
     __tablename__ = "lots"
     __table_args__ = (
-        Index("idx_lots_open", "account_id", "symbol", "status"),
+        # OPEN lot 집계(투입원금·심볼별 잔량/최초 매수)를 index-only scan으로 처리
+        Index(
+            "idx_lots_open",
+            "account_id",
+            "symbol",
+            postgresql_include=["buy_price", "buy_qty", "buy_time", "combo_seq"],
+            postgresql_where=text("status = 'OPEN'"),
+        ),
         Index("idx_lots_strategy", "account_id", "strategy_name", "status"),
-        Index("idx_lots_combo", "account_id", "combo_id", "status"),
+        Index("idx_lots_combo", "account_id", "combo_seq", "status"),
         Index("idx_lots_buy_time", "buy_time"),
         Index(
             "idx_lots_unique_buy_order",
@@ -25,30 +46,41 @@ class Lot(Base):
             unique=True,
             postgresql_where=text("buy_order_id IS NOT NULL AND status = 'OPEN' AND sell_order_id IS NULL"),
         ),
-        CheckConstraint(f"status IN {LOT_STATUSES!r}", name="chk_lot_status"),
+        ForeignKeyConstraint(
+            ["account_id", "combo_seq"],
+            ["trading_combos.account_id", "trading_combos.combo_seq"],
+            name="lots_combo_seq_fkey",
+        ),
     )
 
-    lot_id: Mapped[int] = mapped_column(BigInteger, primary_key=True, autoincrement=True)
     account_id: Mapped[uuid.UUID] = mapped_column(
         ForeignKey("trading_accounts.id", ondelete="CASCADE"), primary_key=True
     )
+    lot_id: Mapped[int] = mapped_column(BigInteger, primary_key=True, autoincrement=True)
     symbol: Mapped[str] = mapped_column(String, nullable=False)
     strategy_name: Mapped[str] = mapped_column(String, nullable=False, server_default="lot_stacking")
     buy_order_id: Mapped[int | None] = mapped_column(BigInteger, nullable=True)
-    buy_price: Mapped[float] = mapped_column(Numeric(asdecimal=False), nullable=False)
-    buy_qty: Mapped[float] = mapped_column(Numeric(asdecimal=False), nullable=False)
+    buy_price: Mapped[float] = mapped_column(Price, nullable=False)
+    buy_qty: Mapped[float] = mapped_column(Qty, nullable=False)
     buy_time: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
     buy_time_ms: Mapped[int | None] = mapped_column(BigInteger, nullable=True)
-    status: Mapped[str] = mapped_column(String, server_default="OPEN")
+    status: Mapped[str] = mapped_column(Enum(*LOT_STATUSES, name="lot_status"), server_default="OPEN")
     sell_order_id: Mapped[int | None] = mapped_column(BigInteger, nullable=True)
     sell_order_time_ms: Mapped[int | None] = mapped_column(BigInteger, nullable=True)
-    sell_price: Mapped[float | None] = mapped_column(Numeric(asdecimal=False), nullable=True)
+    sell_price: Mapped[float | None] = mapped_column(Price, nullable=True)
     sell_time: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
     sell_time_ms: Mapped[int | None] = mapped_column(BigInteger, nullable=True)
-    fee_usdt: Mapped[float | None] = mapped_column(Numeric(asdecimal=False), nullable=True)
-    net_profit_usdt: Mapped[float | None] = mapped_column(Numeric(asdecimal=False), nullable=True)
-    combo_id: Mapped[uuid.UUID | None] = mapped_column(
-        PG_UUID(as_uuid=True), ForeignKey("trading_combos.id"), nullable=True
+    fee_usdt: Mapped[float | None] = mapped_column(Usdt, nullable=True)
+    net_profit_usdt: Mapped[float | None] = mapped_column(Usdt, nullable=True)
+    # 조합 참조는 2바이트 계정 내 순번 — UUID가 필요하면 combo_id를 undefer()
+    combo_seq: Mapped[int | None] = mapped_column(SmallInteger, nullable=True)
+    combo_id: Mapped[uuid.UUID | None] = column_property(
+        select(TradingCombo.id)
+        .where(TradingCombo.account_id == account_id, TradingCombo.combo_seq == combo_seq)
+        .correlate_except(TradingCombo)
+        .scalar_subquery(),
+        deferred=True,
+        raiseload=True,
     )
     metadata_: Mapped[dict | None] = mapped_column("metadata", JSONB, server_default="{}")
 
@@ -1,35 +1,42 @@
 import uuid
 
-from sqlalchemy import BigInteger, ForeignKey, Index, Numeric, String
+from sqlalchemy import BigInteger, ForeignKey, Index, String, text
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from app.models.base import Base, UpdatedAtMixin
+from app.models.base import Base, OrderSide, Price, Qty, UpdatedAtMixin, Usdt
 
 
 class Order(UpdatedAtMixin, Base):
     __tablename__ = "orders"
     __table_args__ = (
-        Index("idx_orders_status", "account_id", "status"),
+        # 폴러는 미체결 주문만 조회 — FILLED/CANCELED 이력은 인덱싱하지 않는다
+        Index(
+            "idx_orders_open",
+            "account_id",
+            "status",
+            postgresql_where=text("status IN ('NEW', 'PARTIALLY_FILLED')"),
+        ),
         Index("idx_orders_update_time", "update_time_ms"),
         Index("idx_orders_symbol", "symbol"),
     )
 
-    order_id: Mapped[int] = mapped_column(BigInteger, primary_key=True)
     account_id: Mapped[uuid.UUID] = mapped_column(
         ForeignKey("trading_accounts.id", ondelete="CASCADE"), primary_key=True
     )
+    order_id: Mapped[int] = mapped_column(BigInteger, primary_key=True)
     symbol: Mapped[str] = mapped_column(String, nullable=False)
-    side: Mapped[str | None] = mapped_column(String, nullable=True)
+    side: Mapped[str | None] = mapped_column(OrderSide, nullable=True)
     type: Mapped[str | None] = mapped_column(String, nullable=True)
     status: Mapped[str | None] = mapped_column(String, nullable=True)
-    price: Mapped[float | None] = mapped_column(Numeric(asdecimal=False), nullable=True)
-    orig_qty: Mapped[float | None] = mapped_column(Numeric(asdecimal=False), nullable=True)
-    executed_qty: Mapped[float | None] = mapped_column(Numeric(asdecimal=False), nullable=True)
-    cum_quote_qty: Mapped[float | None] = mapped_column(Numeric(asdecimal=False), nullable=True)
+    price: Mapped[float | None] = mapped_column(Price, nullable=True)
+    orig_qty: Mapped[float | None] = mapped_column(Qty, nullable=True)
+    executed_qty: Mapped[float | None] = mapped_column(Qty, nullable=True)
+    cum_quote_qty: Mapped[float | None] = mapped_column(Usdt, nullable=True)
     client_order_id: Mapped[str | None] = mapped_column(String, nullable=True)
     update_time_ms: Mapped[int | None] = mapped_column(BigInteger, nullable=True)
-    raw_json: Mapped[dict | None] = mapped_column(JSONB, nullable=True)
+    # Binance 원본 응답 — 조회 경로에서 거의 쓰지 않으므로 기본 SELECT에서 제외, 필요 시 undefer()
+    raw_json: Mapped[dict | None] = mapped_column(JSONB, nullable=True, deferred=True, deferred_raiseload=True)
 
     account = relationship("TradingAccount", back_populates="orders")
 
@@ -10,6 +10,7 @@ from sqlalchemy.dialects.postgresql import JSONB, UUID
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.models.base import Base
+from app.utils.uuid7 import uuid7
 
 
 class PersistentLog(Base):
@@ -25,7 +26,7 @@ class PersistentLog(Base):
         Index("ix_persistent_log_logged", "logged_at"),
     )
 
-    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     logged_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
     level: Mapped[str] = mapped_column(String(10), nullable=False)
     account_id: Mapped[uuid.UUID | None] = mapped_column(
@@ -1,9 +1,9 @@
 import uuid
 
-from sqlalchemy import ForeignKey, Numeric, String
+from sqlalchemy import ForeignKey, String
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from app.models.base import Base, UpdatedAtMixin
+from app.models.base import Base, Price, Qty, UpdatedAtMixin, Usdt
 
 
 class Position(UpdatedAtMixin, Base):
@@ -13,9 +13,9 @@ class Position(UpdatedAtMixin, Base):
         ForeignKey("trading_accounts.id", ondelete="CASCADE"), primary_key=True
     )
     symbol: Mapped[str] = mapped_column(String, primary_key=True)
-    qty: Mapped[float] = mapped_column(Numeric(asdecimal=False), nullable=False)
-    cost_basis_usdt: Mapped[float] = mapped_column(Numeric(asdecimal=False), nullable=False)
-    avg_entry: Mapped[float] = mapped_column(Numeric(asdecimal=False), nullable=False)
+    qty: Mapped[float] = mapped_column(Qty, nullable=False)
+    cost_basis_usdt: Mapped[float] = mapped_column(Usdt, nullable=False)
+    avg_entry: Mapped[float] = mapped_column(Price, nullable=False)
 
     account = relationship("TradingAccount", back_populates="positions")
 
@@ -1,4 +1,4 @@
-from sqlalchemy import Index
+from sqlalchemy import DDL, Index, event
 
 from app.models.base import Base, PriceCandleMixin, UpdatedAtMixin
 
@@ -7,25 +7,44 @@ class PriceCandle5m(PriceCandleMixin, UpdatedAtMixin, Base):
     """5-minute candles — upserted from real-time price feed."""
 
     __tablename__ = "price_candles_5m"
-    __table_args__ = (Index("idx_price_candles_5m_symbol_ts", "symbol", "ts_ms", unique=True),)
+    __table_args__ = (
+        Index(
+            "idx_price_candles_5m_ts_brin", "ts_ms", postgresql_using="brin", postgresql_with={"pages_per_range": 32}
+        ),
+    )
 
 
 class PriceCandle1m(PriceCandleMixin, Base):
-    """1-minute candles — write-once from kline WebSocket."""
+    """1-minute candles — write-once from kline WebSocket.
+
+    ts_ms 기준 일 단위 RANGE 파티션. 파티션 생성/삭제는 candle_store 참고.
+    """
 
     __tablename__ = "price_candles_1m"
-    __table_args__ = (Index("idx_price_candles_1m_symbol_ts", "symbol", "ts_ms", unique=True),)
+    __table_args__ = (
+        # append-only라 ts_ms와 물리 순서가 일치 — 심볼 무관 기간 스캔용 BRIN
+        Index(
+            "idx_price_candles_1m_ts_brin", "ts_ms", postgresql_using="brin", postgresql_with={"pages_per_range": 32}
+        ),
+        {"postgresql_partition_by": "RANGE (ts_ms)"},
+    )
+
+
+# create_all(테스트)로 만든 부모 테이블에도 INSERT가 가능하도록 DEFAULT 파티션을 붙인다
+event.listen(
+    PriceCandle1m.__table__,
+    "after_create",
+    DDL("CREATE TABLE IF NOT EXISTS price_candles_1m_default PARTITION OF price_candles_1m DEFAULT"),
+)
 
 
 class PriceCandle1h(PriceCandleMixin, Base):
     """1-hour candles — aggregated from 5m candles."""
 
     __tablename__ = "price_candles_1h"
-    __table_args__ = (Index("idx_price_candles_1h_symbol_ts", "symbol", "ts_ms", unique=True),)
 
 
 class PriceCandle1d(PriceCandleMixin, Base):
     """1-day candles — aggregated from 1h candles."""
 
     __tablename__ = "price_candles_1d"
-    __table_args__ = (Index("idx_price_candles_1d_symbol_ts", "symbol", "ts_ms", unique=True),)
@@ -1,14 +1,18 @@
-from sqlalchemy import BigInteger, Index, Numeric, String
+from sqlalchemy import BigInteger, Index, String
 from sqlalchemy.orm import Mapped, mapped_column
 
-from app.models.base import Base, CreatedAtMixin
+from app.models.base import Base, CreatedAtMixin, Price
 
 
 class PriceSnapshot(CreatedAtMixin, Base):
     __tablename__ = "price_snapshots"
-    __table_args__ = (Index("idx_price_snapshots_symbol_ts", "symbol", "ts_ms", unique=True),)
+    __table_args__ = (
+        Index("idx_price_snapshots_symbol_ts", "symbol", "ts_ms", unique=True),
+        Index("idx_price_snapshots_ts_brin", "ts_ms", postgresql_using="brin", postgresql_with={"pages_per_range": 32}),
+    )
+    __mapper_args__ = {"eager_defaults": False}
 
     id: Mapped[int] = mapped_column(BigInteger, primary_key=True, autoincrement=True)
     symbol: Mapped[str] = mapped_column(String, nullable=False)
     ts_ms: Mapped[int] = mapped_column(BigInteger, nullable=False)
-    price: Mapped[float] = mapped_column(Numeric(asdecimal=False), nullable=False)
+    price: Mapped[float] = mapped_column(Price, nullable=False)
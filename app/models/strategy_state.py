@@ -1,19 +1,21 @@
 import uuid
 
 from sqlalchemy import ForeignKey, String
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.models.base import Base, UpdatedAtMixin
 
 
 class StrategyState(UpdatedAtMixin, Base):
+    """(account_id, scope)당 한 행 — scope의 모든 키는 state JSONB에 문자열 값으로 저장."""
+
     __tablename__ = "strategy_state"
 
     account_id: Mapped[uuid.UUID] = mapped_column(
         ForeignKey("trading_accounts.id", ondelete="CASCADE"), primary_key=True
     )
     scope: Mapped[str] = mapped_column(String, primary_key=True)
-    key: Mapped[str] = mapped_column(String, primary_key=True)
-    value: Mapped[str | None] = mapped_column(String, nullable=True)
+    state: Mapped[dict[str, str]] = mapped_column(JSONB, nullable=False, server_default="{}")
 
     account = relationship("TradingAccount", back_populates="strategy_states")
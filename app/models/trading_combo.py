@@ -1,11 +1,25 @@
 import uuid
 
-from sqlalchemy import Boolean, CheckConstraint, ForeignKey, Index, String
+from sqlalchemy import (
+    DDL,
+    Boolean,
+    CheckConstraint,
+    FetchedValue,
+    ForeignKey,
+    Index,
+    ScalarSelect,
+    SmallInteger,
+    String,
+    UniqueConstraint,
+    event,
+    select,
+)
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.dialects.postgresql import UUID as PG_UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.models.base import Base, TimestampMixin
+from app.utils.uuid7 import uuid7
 
 
 class TradingCombo(TimestampMixin, Base):
@@ -13,10 +27,13 @@ class TradingCombo(TimestampMixin, Base):
     __table_args__ = (
         CheckConstraint("reference_combo_id != id", name="chk_no_self_reference"),
         Index("idx_combos_account", "account_id", "is_enabled"),
+        UniqueConstraint("account_id", "combo_seq", name="uq_trading_combos_account_seq"),
     )
 
-    id: Mapped[uuid.UUID] = mapped_column(PG_UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id: Mapped[uuid.UUID] = mapped_column(PG_UUID(as_uuid=True), primary_key=True, default=uuid7)
     account_id: Mapped[uuid.UUID] = mapped_column(ForeignKey("trading_accounts.id", ondelete="CASCADE"), nullable=False)
+    # 계정 내 순번 — lots는 UUID 대신 (account_id, combo_seq)로 참조. INSERT 트리거가 부여
+    combo_seq: Mapped[int] = mapped_column(SmallInteger, nullable=False, server_default=FetchedValue())
     name: Mapped[str] = mapped_column(String, nullable=False)
     symbols: Mapped[list[str]] = mapped_column(JSONB, nullable=False, server_default="[]")
     buy_logic_name: Mapped[str] = mapped_column(String, nullable=False)
@@ -32,3 +49,42 @@ class TradingCombo(TimestampMixin, Base):
 
     def __repr__(self) -> str:
         return f"<TradingCombo id={self.id} name={self.name!r} enabled={self.is_enabled}>"
+
+
+def combo_seq_of(account_id: uuid.UUID, combo_id: uuid.UUID) -> ScalarSelect[int]:
+    """(account_id, combo_id) → combo_seq 스칼라 서브쿼리 (쿼리당 한 번 평가).
+
+    combo_seq는 계정 내에서만 유일하므로 반드시 계정으로 한정한다 —
+    다른 계정의 combo_id면 NULL이 되어 어떤 로트와도 매칭되지 않는다.
+    """
+    return (
+        select(TradingCombo.combo_seq)
+        .where(TradingCombo.id == combo_id, TradingCombo.account_id == account_id)
+        .scalar_subquery()
+    )
+
+
+# create_all(테스트)에도 migration 036과 동일한 combo_seq 부여 트리거를 만든다
+event.listen(
+    TradingCombo.__table__,
+    "after_create",
+    DDL("""
+CREATE OR REPLACE FUNCTION trading_combos_assign_seq() RETURNS trigger AS $$
+BEGIN
+    IF NEW.combo_seq IS NULL THEN
+        PERFORM pg_advisory_xact_lock(hashtextextended(NEW.account_id::text, 0));
+        SELECT coalesce(max(combo_seq), 0) + 1 INTO NEW.combo_seq
+          FROM trading_combos WHERE account_id = NEW.account_id;
+    END IF;
+    RETURN NEW;
+END $$ LANGUAGE plpgsql
+"""),
+)
+event.listen(
+    TradingCombo.__table__,
+    "after_create",
+    DDL(
+        "CREATE TRIGGER trg_trading_combos_seq BEFORE INSERT ON trading_combos "
+        "FOR EACH ROW EXECUTE FUNCTION trading_combos_assign_seq()"
+    ),
+)
@@ -1,4 +1,4 @@
-from app.schemas.account import AccountCreate, AccountListResponse, AccountResponse, AccountUpdate
+from app.schemas.account import AccountCreate, AccountResponse, AccountUpdate
 from app.schemas.auth import (
     CreateUserRequest,
     LoginRequest,
@@ -46,7 +46,6 @@ __all__ = [
     "UserResponse",
     # Account
     "AccountCreate",
-    "AccountListResponse",
     "AccountResponse",
     "AccountUpdate",
     # Dashboard
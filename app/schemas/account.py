@@ -3,7 +3,9 @@ from __future__ import annotations
 from datetime import datetime
 from uuid import UUID
 
-from pydantic import BaseModel, Field, model_validator
+from pydantic import BaseModel, ConfigDict, Field, model_validator
+
+from app.models.account import BuyPauseStateName
 
 
 class AccountCreate(BaseModel):
@@ -59,7 +61,7 @@ class AccountResponse(BaseModel):
     last_success_at: datetime | None
     loop_interval_sec: int
     order_cooldown_sec: int
-    buy_pause_state: str = "ACTIVE"
+    buy_pause_state: BuyPauseStateName = "ACTIVE"
     buy_pause_reason: str | None = None
     buy_pause_since: datetime | None = None
     consecutive_low_balance: int = 0
@@ -72,8 +74,4 @@ class AccountResponse(BaseModel):
     owner_email: str | None = None  # Computed: joined from UserProfile.email
     combo_symbols: list[str] = []  # Computed: aggregated from TradingCombo.symbols
 
-    model_config = {"from_attributes": True}
-
-
-class AccountListResponse(BaseModel):
-    accounts: list[AccountResponse]
+    model_config = ConfigDict(from_attributes=True, defer_build=True)
@@ -1,8 +1,9 @@
 from __future__ import annotations
 
 import re
+from typing import Annotated
 
-from pydantic import BaseModel, field_validator
+from pydantic import AfterValidator, BaseModel
 
 _EMAIL_RE = re.compile(r"^[a-zA-Z0-9_.+-]+@[a-zA-Z0-9-]+\.[a-zA-Z0-9-.]+$")
 
@@ -25,6 +26,18 @@ def _validate_email(v: str) -> str:
     return v.lower().strip()
 
 
+def _validate_role(v: str) -> str:
+    if v not in ("admin", "user"):
+        raise ValueError("Role must be 'admin' or 'user'")
+    return v
+
+
+# 모델마다 field_validator를 다시 붙이지 않고 검증기를 타입 하나로 공유한다
+Email = Annotated[str, AfterValidator(_validate_email)]
+Password = Annotated[str, AfterValidator(_validate_password)]
+Role = Annotated[str, AfterValidator(_validate_role)]
+
+
 class UserResponse(BaseModel):
     id: str
     email: str
@@ -32,11 +45,9 @@ class UserResponse(BaseModel):
 
 
 class LoginRequest(BaseModel):
-    email: str
+    email: Email
     password: str
 
-    _check_email = field_validator("email")(_validate_email)
-
 
 class LoginResponse(BaseModel):
     success: bool
@@ -44,32 +55,18 @@ class LoginResponse(BaseModel):
 
 
 class CreateUserRequest(BaseModel):
-    email: str
-    password: str
-    role: str = "user"
-
-    _check_email = field_validator("email")(_validate_email)
-    _check_password = field_validator("password")(_validate_password)
-
-    @field_validator("role")
-    @classmethod
-    def validate_role(cls, v: str) -> str:
-        if v not in ("admin", "user"):
-            raise ValueError("Role must be 'admin' or 'user'")
-        return v
+    email: Email
+    password: Password
+    role: Role = "user"
 
 
 class ChangePasswordRequest(BaseModel):
     current_password: str
-    new_password: str
-
-    _check_new_password = field_validator("new_password")(_validate_password)
+    new_password: Password
 
 
 class ResetPasswordRequest(BaseModel):
-    new_password: str
-
-    _check_password = field_validator("new_password")(_validate_password)
+    new_password: Password
 
 
 class SetActiveRequest(BaseModel):
@@ -77,11 +74,4 @@ class SetActiveRequest(BaseModel):
 
 
 class SetRoleRequest(BaseModel):
-    role: str = "user"
-
-    @field_validator("role")
-    @classmethod
-    def validate_role(cls, v: str) -> str:
-        if v not in ("admin", "user"):
-            raise ValueError("Role must be 'admin' or 'user'")
-        return v
+    role: Role = "user"
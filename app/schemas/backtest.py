@@ -1,18 +1,16 @@
 from __future__ import annotations
 
 from datetime import datetime
-from typing import Any
+from typing import Any, TypedDict
 from uuid import UUID
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
+from app.models.backtest_run import BacktestStatusName
+from app.schemas.strategy import ComboLogicFields
 
-class BacktestComboConfig(BaseModel):
-    name: str
-    buy_logic_name: str
-    buy_params: dict[str, Any] = Field(default_factory=dict)
-    sell_logic_name: str
-    sell_params: dict[str, Any] = Field(default_factory=dict)
+
+class BacktestComboConfig(ComboLogicFields):
     reference_combo_name: str | None = None
 
 
@@ -26,19 +24,19 @@ class BacktestRunRequest(BaseModel):
 
 class BacktestRunResponse(BaseModel):
     id: UUID
-    status: str
+    status: BacktestStatusName
 
-    model_config = {"from_attributes": True}
+    model_config = ConfigDict(from_attributes=True, defer_build=True)
 
 
 class BacktestStatusResponse(BaseModel):
     id: UUID
-    status: str
+    status: BacktestStatusName
     error_message: str | None = None
     started_at: datetime | None = None
     completed_at: datetime | None = None
 
-    model_config = {"from_attributes": True}
+    model_config = ConfigDict(from_attributes=True, defer_build=True)
 
 
 class BacktestConfigOut(BaseModel):
@@ -51,6 +49,8 @@ class BacktestConfigOut(BaseModel):
     start_ts_ms: int
     end_ts_ms: int
 
+    model_config = ConfigDict(defer_build=True)
+
 
 class BacktestSummaryOut(BaseModel):
     final_value_usdt: float
@@ -69,17 +69,45 @@ class BacktestSummaryOut(BaseModel):
     qty_change_pct: float | None = None
     max_open_lots: int = 0
 
+    model_config = ConfigDict(defer_build=True)
+
+
+class TradeLogEntry(TypedDict):
+    ts_ms: int
+    side: str
+    price: float
+    qty: float
+    quote_qty: float
+
+
+class EquityPoint(TypedDict):
+    ts_ms: int
+    value: float
+
+
+class ChartCandle(TypedDict):
+    time: int  # seconds
+    open: float
+    high: float
+    low: float
+    close: float
+    volume: float
+
 
 class BacktestReportResponse(BaseModel):
     id: UUID
     config: BacktestConfigOut
     summary: BacktestSummaryOut | None = None
-    trade_log: list[dict[str, Any]] | None = None
-    equity_curve: list[dict[str, Any]] | None = None
-    candles: list[dict[str, Any]] | None = None
+    # 수천 행 규모 — 고정 키 TypedDict로 선언해 generic dict 순회 대신 typed 스키마로 검증/직렬화
+    trade_log: list[TradeLogEntry] | None = None
+    equity_curve: list[EquityPoint] | None = None
+    candles: list[ChartCandle] | None = None
     candle_interval_sec: int = 60
     pinned: bool = False
 
+    # response_model 없이 리포트 조회 시에만 생성되므로 첫 사용 시점까지 스키마 빌드를 미룬다
+    model_config = ConfigDict(defer_build=True)
+
 
 class BacktestPresetSaveRequest(BaseModel):
     name: str
@@ -101,9 +129,9 @@ class BacktestListItem(BaseModel):
     initial_usdt: float
     start_ts_ms: int
     end_ts_ms: int
-    status: str
+    status: BacktestStatusName
     pnl_pct: float | None = None
     created_at: datetime
     pinned: bool = False
 
-    model_config = {"from_attributes": True}
+    model_config = ConfigDict(from_attributes=True, defer_build=True)
@@ -4,3 +4,19 @@ from pydantic import BaseModel
 class MessageResponse(BaseModel):
     status: str
     message: str | None = None
+
+
+def build_deferred_schemas() -> int:
+    """defer_build 스키마를 미리 빌드 — 첫 요청에서 스키마 컴파일 지연이 생기지 않도록 워커 시작 시 호출.
+
+    Returns the number of schemas built.
+    """
+    built = 0
+    pending = list(BaseModel.__subclasses__())
+    while pending:
+        model = pending.pop()
+        pending.extend(model.__subclasses__())
+        if model.__module__.startswith("app.schemas.") and not model.__pydantic_complete__:
+            model.model_rebuild()
+            built += 1
+    return built
@@ -5,9 +5,11 @@ from uuid import UUID
 
 from pydantic import BaseModel
 
+from app.models.account import BuyPauseStateName
+
 
 class BuyPauseInfo(BaseModel):
-    state: str  # ACTIVE, THROTTLED, PAUSED
+    state: BuyPauseStateName
     reason: str | None = None
     since: str | None = None  # ISO datetime string
     consecutive_low_balance: int = 0
@@ -2,15 +2,19 @@ from __future__ import annotations
 
 from typing import Any
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 
 class StrategyStateResponse(BaseModel):
     scope: str
     data: dict[str, str]
 
+    model_config = ConfigDict(defer_build=True)
+
 
 class AccountSettingsResponse(BaseModel):
     account_id: str
     strategy_states: dict[str, dict[str, str]]
     strategy_configs: list[dict[str, Any]]
+
+    model_config = ConfigDict(defer_build=True)
@@ -1,9 +1,9 @@
 from __future__ import annotations
 
-from typing import Any
+from typing import Annotated, Any
 from uuid import UUID
 
-from pydantic import BaseModel, field_validator
+from pydantic import BaseModel, ConfigDict, Field, StringConstraints
 
 
 class LogicInfo(BaseModel):
@@ -14,6 +14,9 @@ class LogicInfo(BaseModel):
     default_params: dict[str, Any]
     tunable_params: dict[str, dict[str, Any]]
 
+    # 레지스트리 메타데이터 — 한 번 만든 인스턴스를 캐시해 재사용하므로 변경 불가
+    model_config = ConfigDict(frozen=True)
+
 
 # Backward-compatible aliases
 BuyLogicInfo = LogicInfo
@@ -22,65 +25,38 @@ SellLogicInfo = LogicInfo
 
 # --- Combo schemas ---
 
+# 형식 검사(대소문자 무관) + 대문자 변환을 pydantic-core 문자열 검증기에서 원소별로 처리
+Symbol = Annotated[str, StringConstraints(to_upper=True, pattern=r"^[A-Za-z0-9]{2,20}$")]
+
+
+class ComboLogicFields(BaseModel):
+    """콤보 생성/응답과 백테스트 콤보 설정이 공유하는 이름 + 매수/매도 로직 파라미터."""
 
-class ComboCreate(BaseModel):
     name: str
-    symbols: list[str]
     buy_logic_name: str
-    buy_params: dict[str, Any] = {}
+    buy_params: dict[str, Any] = Field(default_factory=dict)
     sell_logic_name: str
-    sell_params: dict[str, Any] = {}
-    reference_combo_id: UUID | None = None
+    sell_params: dict[str, Any] = Field(default_factory=dict)
 
-    @field_validator("symbols")
-    @classmethod
-    def validate_symbols(cls, v: list[str]) -> list[str]:
-        if not v:
-            raise ValueError("symbols must contain at least one entry")
-        import re
 
-        pattern = re.compile(r"^[A-Z0-9]{2,20}$")
-        result = [s.upper() for s in v]
-        for s in result:
-            if not pattern.match(s):
-                raise ValueError(f"invalid symbol: {s!r} (only A-Z, 0-9 allowed)")
-        return result
+class ComboCreate(ComboLogicFields):
+    symbols: list[Symbol] = Field(min_length=1)
+    reference_combo_id: UUID | None = None
 
 
 class ComboUpdate(BaseModel):
     name: str | None = None
-    symbols: list[str] | None = None
+    symbols: list[Symbol] | None = Field(default=None, min_length=1)
     buy_params: dict[str, Any] | None = None
     sell_params: dict[str, Any] | None = None
     reference_combo_id: UUID | None = None
     reapply_open_orders: bool = False
 
-    @field_validator("symbols")
-    @classmethod
-    def validate_symbols(cls, v: list[str] | None) -> list[str] | None:
-        if v is not None:
-            if not v:
-                raise ValueError("symbols must contain at least one entry")
-            import re
 
-            pattern = re.compile(r"^[A-Z0-9]{2,20}$")
-            result = [s.upper() for s in v]
-            for s in result:
-                if not pattern.match(s):
-                    raise ValueError(f"invalid symbol: {s!r} (only A-Z, 0-9 allowed)")
-            return result
-        return v
-
-
-class ComboResponse(BaseModel):
+class ComboResponse(ComboLogicFields):
     id: UUID
-    name: str
     symbols: list[str]
-    buy_logic_name: str
-    buy_params: dict[str, Any]
-    sell_logic_name: str
-    sell_params: dict[str, Any]
     reference_combo_id: UUID | None
     is_enabled: bool
 
-    model_config = {"from_attributes": True}
+    model_config = ConfigDict(from_attributes=True, defer_build=True)
@@ -3,7 +3,10 @@ from __future__ import annotations
 from datetime import datetime
 from uuid import UUID
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
+
+from app.models.base import OrderSideName
+from app.models.lot import LotStatusName
 
 
 class LotResponse(BaseModel):
@@ -16,7 +19,7 @@ class LotResponse(BaseModel):
     buy_qty: float
     buy_time: datetime | None
     buy_time_ms: int | None
-    status: str
+    status: LotStatusName
     sell_price: float | None
     sell_time: datetime | None
     fee_usdt: float | None
@@ -30,14 +33,14 @@ class LotResponse(BaseModel):
     sell_order_status: str | None = None
     sell_order_price: float | None = None
 
-    model_config = {"from_attributes": True}
+    model_config = ConfigDict(from_attributes=True, defer_build=True)
 
 
 class OrderResponse(BaseModel):
     order_id: int
     account_id: UUID
     symbol: str
-    side: str | None
+    side: OrderSideName | None
     type: str | None
     status: str | None
     price: float | None
@@ -46,7 +49,7 @@ class OrderResponse(BaseModel):
     cum_quote_qty: float | None
     updated_at: datetime
 
-    model_config = {"from_attributes": True}
+    model_config = ConfigDict(from_attributes=True, defer_build=True)
 
 
 class PositionResponse(BaseModel):
@@ -56,4 +59,4 @@ class PositionResponse(BaseModel):
     cost_basis_usdt: float
     avg_entry: float
 
-    model_config = {"from_attributes": True}
+    model_config = ConfigDict(from_attributes=True, defer_build=True)
@@ -3,6 +3,7 @@ from __future__ import annotations
 import logging
 from uuid import UUID
 
+from sqlalchemy import update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.db.account_repo import AccountRepository
@@ -66,11 +67,15 @@ class AccountService:
         return self._encryption.decrypt(account.api_secret_encrypted)
 
     async def update_api_keys(self, account_id: UUID, api_key: str, api_secret: str) -> None:
-        account = await self._repo.get_by_id(account_id)
-        if account:
-            account.api_key_encrypted = self._encryption.encrypt(api_key)
-            account.api_secret_encrypted = self._encryption.encrypt(api_secret)
-            await self._session.flush()
+        stmt = (
+            update(TradingAccount)
+            .where(TradingAccount.id == account_id)
+            .values(
+                api_key_encrypted=self._encryption.encrypt(api_key),
+                api_secret_encrypted=self._encryption.encrypt(api_secret),
+            )
+        )
+        await self._session.execute(stmt)
 
     async def get_all_accounts_with_owner(self) -> list[TradingAccount]:
         return await self._repo.get_all_accounts_with_owner()
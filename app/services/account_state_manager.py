@@ -1,7 +1,5 @@
 from __future__ import annotations
 
-import asyncio
-from typing import ClassVar
 from uuid import UUID
 
 from sqlalchemy import select, update
@@ -15,14 +13,9 @@ class AccountStateManager:
     """
     계정 레벨 공유 상태 관리.
     reserve pool(reserve_qty, reserve_cost_usdt)은 LOT/TREND 양쪽에서 접근.
-    pending_earnings_usdt는 trading_accounts 정식 컬럼으로 원자적 접근.
-
-    reserve 변경은 per-account asyncio lock으로 read-modify-write 경합 방지.
-    (단일 프로세스 asyncio 앱 전제. 다중 프로세스 확장 시 DB-level lock 필요.)
+    reserve pool과 pending_earnings_usdt는 trading_accounts 정식 컬럼으로 원자적 접근.
     """
 
-    _reserve_locks: ClassVar[dict[UUID, asyncio.Lock]] = {}
-
     def __init__(self, account_id: UUID, session: AsyncSession):
         self._account_id = account_id
         self._session = session
@@ -32,53 +25,51 @@ class AccountStateManager:
         """Bulk-load the shared scope into cache to avoid per-key DB queries."""
         await self._store.preload()
 
-    @classmethod
-    def _get_reserve_lock(cls, account_id: UUID) -> asyncio.Lock:
-        if account_id not in cls._reserve_locks:
-            cls._reserve_locks[account_id] = asyncio.Lock()
-        return cls._reserve_locks[account_id]
+    async def _get_column(self, column) -> float:
+        stmt = select(column).where(TradingAccount.id == self._account_id)
+        result = await self._session.execute(stmt)
+        val = result.scalar_one_or_none()
+        return float(val) if val is not None else 0.0
 
-    @classmethod
-    def remove_lock(cls, account_id: UUID) -> None:
-        """Remove lock for a deleted/deactivated account to prevent memory leak."""
-        cls._reserve_locks.pop(account_id, None)
+    async def _add_column(self, column, delta: float) -> float:
+        """UPDATE ... SET col = col + delta RETURNING col — 한 번의 왕복으로 원자적 증감"""
+        stmt = (
+            update(TradingAccount)
+            .where(TradingAccount.id == self._account_id)
+            .values({column: column + delta})
+            .returning(column)
+        )
+        result = await self._session.execute(stmt)
+        val = result.scalar_one_or_none()
+        return float(val) if val is not None else 0.0
 
-    # ---- reserve (shared scope KV, guarded by asyncio lock) ----
+    # ---- reserve (trading_accounts 컬럼) ----
 
     async def get_reserve_qty(self) -> float:
-        return await self._store.get_float("reserve_qty", 0.0)
+        return await self._get_column(TradingAccount.reserve_qty)
 
     async def set_reserve_qty(self, qty: float) -> None:
-        await self._store.set("reserve_qty", float(qty))
+        stmt = update(TradingAccount).where(TradingAccount.id == self._account_id).values(reserve_qty=float(qty))
+        await self._session.execute(stmt)
 
     async def add_reserve_qty(self, delta: float) -> float:
-        async with self._get_reserve_lock(self._account_id):
-            current = await self.get_reserve_qty()
-            new_val = current + delta
-            await self.set_reserve_qty(new_val)
-            return new_val
+        return await self._add_column(TradingAccount.reserve_qty, delta)
 
     async def get_reserve_cost_usdt(self) -> float:
-        return await self._store.get_float("reserve_cost_usdt", 0.0)
+        return await self._get_column(TradingAccount.reserve_cost_usdt)
 
     async def set_reserve_cost_usdt(self, cost: float) -> None:
-        await self._store.set("reserve_cost_usdt", float(cost))
+        stmt = update(TradingAccount).where(TradingAccount.id == self._account_id).values(reserve_cost_usdt=float(cost))
+        await self._session.execute(stmt)
 
     async def add_reserve_cost_usdt(self, delta: float) -> float:
-        async with self._get_reserve_lock(self._account_id):
-            current = await self.get_reserve_cost_usdt()
-            new_val = current + delta
-            await self.set_reserve_cost_usdt(new_val)
-            return new_val
+        return await self._add_column(TradingAccount.reserve_cost_usdt, delta)
 
     # ---- pending_earnings (신규 - 원자적 SQL) ----
 
     async def get_pending_earnings(self) -> float:
         """trading_accounts.pending_earnings_usdt 조회"""
-        stmt = select(TradingAccount.pending_earnings_usdt).where(TradingAccount.id == self._account_id)
-        result = await self._session.execute(stmt)
-        val = result.scalar_one_or_none()
-        return float(val) if val is not None else 0.0
+        return await self._get_column(TradingAccount.pending_earnings_usdt)
 
     async def add_pending_earnings(self, delta: float) -> None:
         """원자적 증감 - 동시성 안전 (trading loop + approve 경합 방지)"""
@@ -1,16 +1,18 @@
 from __future__ import annotations
 
 import asyncio
-import contextlib
+import itertools
 import logging
 import re
 import time
 from datetime import UTC, datetime
 from typing import TYPE_CHECKING
-from uuid import UUID, uuid4
+from uuid import UUID
 
+import sentry_sdk
 from sqlalchemy import func, select
 from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import undefer
 
 from app.db.account_repo import AccountRepository
 from app.db.lot_repo import LotRepository
@@ -24,7 +26,7 @@ from app.models.lot import Lot
 from app.models.order import Order
 from app.models.trading_combo import TradingCombo
 from app.services.account_state_manager import AccountStateManager
-from app.services.alert_service import get_alert_service
+from app.services.alert_service import AlertSeverity, get_alert_service
 from app.services.buy_pause_manager import MIN_TRADE_USDT, BuyPauseManager
 from app.strategies.base import BaseBuyLogic, BaseSellLogic, RepositoryBundle, StrategyContext
 from app.strategies.registry import BuyLogicRegistry, SellLogicRegistry
@@ -44,6 +46,10 @@ logger = logging.getLogger(__name__)
 # 서킷 브레이커 발동 임계값 (연속 실패 횟수)
 CB_FAILURE_THRESHOLD = 5
 
+# 사이클 ID: 프로세스 시작 시각(4 hex) + 프로세스 전역 카운터(8 hex). 사이클마다 uuid4(os.urandom) 생략
+_CYCLE_ID_PREFIX = f"{int(time.time()) & 0xFFFF:04x}"
+_cycle_counter = itertools.count()
+
 
 class AccountTrader:
     """
@@ -65,11 +71,13 @@ class AccountTrader:
         initial_symbols: set[str] | None = None,
     ):
         self.account_id = account_id
+        self._account_id_str = str(account_id)  # 로그 contextvar용 — 매 사이클 UUID 포맷팅 회피
         self._running = True
         self._client: BinanceClient | None = None
         self._is_paper: bool = False
         self._buy_instances: dict[tuple[UUID, str], BaseBuyLogic] = {}
         self._sell_instances: dict[tuple[UUID, str], BaseSellLogic] = {}
+        self._order_prefixes: dict[UUID, str] = {}  # combo_id → clientOrderId prefix
         self._price_collector = price_collector
         self._rate_limiter = rate_limiter
         self._encryption = encryption
@@ -253,11 +261,16 @@ class AccountTrader:
             self._sell_instances[key] = SellLogicRegistry.create_instance(name)
         return self._sell_instances[key]
 
+    def _order_prefix(self, combo_id: UUID) -> str:
+        prefix = self._order_prefixes.get(combo_id)
+        if prefix is None:
+            # UUIDv7 앞 8자리는 ms 타임스탬프 상위 비트라 ~65초간 동일 → 랜덤 꼬리 8자리 사용
+            prefix = self._order_prefixes[combo_id] = f"CMT_{self.account_id.hex[-8:]}_{combo_id.hex[-8:]}_"
+        return prefix
+
     def _instrument_sentry(self, cycle_id: str, combos_count: int) -> None:
         """Set Sentry tags/context for the current cycle. Non-critical."""
         try:
-            import sentry_sdk
-
             sentry_sdk.set_tag("account_id", str(self.account_id))
             sentry_sdk.set_tag("trading_cycle", cycle_id)
             sentry_sdk.set_context(
@@ -267,8 +280,6 @@ class AccountTrader:
                     "active_combos": combos_count,
                 },
             )
-        except ImportError:
-            pass  # Sentry SDK not installed
         except Exception as e:
             logger.debug("Sentry instrumentation failed: %s", e)
 
@@ -285,6 +296,12 @@ class AccountTrader:
         prefetched_lots: dict[tuple, list],
     ) -> None:
         """Execute scan logging and combo x symbol tick loop."""
+        # 콤보×심볼 상태를 한 번의 SELECT로 preload (각 scope는 자기 틱에서만 갱신되므로 루프 시작 시점 값으로 충분)
+        combo_states = await StrategyStateStore.preload_many(
+            self.account_id,
+            [f"{c.id}:{s}" for c in combos for s in (c.symbols or [account.symbol])],
+            session,
+        )
         now = time.time()
         if now - self._last_scan_log_at >= 3600:
             total_symbols = sum(len(c.symbols) if c.symbols else 1 for c in combos)
@@ -295,9 +312,7 @@ class AccountTrader:
                 combo_symbols = combo.symbols if combo.symbols else [account.symbol]
                 for symbol in combo_symbols:
                     try:
-                        ss = StrategyStateStore(self.account_id, f"{combo.id}:{symbol}", session)
-                        await ss.preload()
-                        bp = await ss.get_float("base_price", 0.0)
+                        bp = await combo_states[f"{combo.id}:{symbol}"].get_float("base_price", 0.0)
                         if bp > 0:
                             bp_parts.append(f"{symbol}={bp:.2f}")
                     except Exception:
@@ -340,13 +355,14 @@ class AccountTrader:
                     session,
                     account_state,
                     prefetched_lots,
+                    combo_states[f"{combo.id}:{symbol}"],
                 )
 
     async def _post_cycle_sell_check(
         self,
-        session,
         account,
-        open_lots_count_before: int,
+        open_lots_after: int,
+        lots_closed: int,
         is_balance_sufficient: bool,
         pause_mgr: BuyPauseManager,
     ) -> bool:
@@ -358,17 +374,8 @@ class AccountTrader:
             - Sets self._has_open_positions based on open lot count
             - Updates self._buy_pause_state and self._consecutive_low_balance via pause_mgr
         """
-        # --- Sell detection: compare open lot count before/after strategies ---
-        open_lots_after_stmt = (
-            select(func.count())
-            .select_from(Lot)
-            .where(
-                Lot.account_id == self.account_id,
-                Lot.status == "OPEN",
-            )
-        )
-        open_lots_after = (await session.execute(open_lots_after_stmt)).scalar_one()
-        did_sell_occur = open_lots_after < open_lots_count_before
+        # --- Sell detection: lots closed by this cycle's strategies (LotRepository counters) ---
+        did_sell_occur = lots_closed > 0
         self._has_open_positions = open_lots_after > 0
 
         # 매도 발생 + PAUSED → 잔고 재체크
@@ -421,13 +428,13 @@ class AccountTrader:
     async def _do_step(self) -> int:
         """Inner step logic. Returns loop_interval_sec for run_forever."""
         start_time = time.perf_counter()
-        result, cycle_id = 60, uuid4().hex[:12]
+        result, cycle_id = 60, f"{_CYCLE_ID_PREFIX}{next(_cycle_counter) & 0xFFFFFFFF:08x}"
         cycle_token = current_cycle_id.set(cycle_id)
-        token = current_account_id.set(str(self.account_id))
+        token = current_account_id.set(self._account_id_str)
         try:
             async with TradingSessionLocal() as session:
                 account_repo = AccountRepository(session)
-                account = await account_repo.get_by_id(self.account_id)
+                account = await account_repo.get_with_enabled_combos(self.account_id)
                 if not account or not account.is_active:
                     return 60
                 raw_state = account.buy_pause_state
@@ -444,11 +451,7 @@ class AccountTrader:
                     is_balance_sufficient = False
                 lot_repo = LotRepository(session)
                 repos = RepositoryBundle(lot=lot_repo, order=order_repo, position=position_repo, price=None)
-                combo_stmt = select(TradingCombo).where(
-                    TradingCombo.account_id == self.account_id,
-                    TradingCombo.is_enabled.is_(True),
-                )
-                combos = list((await session.execute(combo_stmt)).scalars().all())
+                combos = list(account.trading_combos)
                 if not combos:
                     return result
                 # Sync orders/fills and reconcile orphans
@@ -456,30 +459,44 @@ class AccountTrader:
                 for c in combos:
                     if c.symbols:
                         all_combo_symbols.update(s.upper() for s in c.symbols)
-                await self._sync_orders_and_fills(account, all_combo_symbols, order_repo, position_repo, session)
-                orphan_count = 0
-                try:
-                    async with session.begin_nested():
-                        orphan_count = await self._reconcile_orphan_sells(order_repo, lot_repo, session)
-                except Exception as e:
-                    logger.warning("Orphan reconciliation failed (non-fatal): %s", e)
-                if orphan_count > 0:
-                    logger.warning("Reconciled %d orphaned sell orders for account %s", orphan_count, self.account_id)
-                self._instrument_sentry(cycle_id, len(combos))
-                pause_mgr = BuyPauseManager(self.account_id, session)
-                self._buy_pause_mgr = pause_mgr
-                account_state = AccountStateManager(self.account_id, session)
-                await account_state.preload()
-                should_buy, self._throttle_cycle = BuyPauseManager.should_attempt_buy(
-                    self._buy_pause_state,
-                    is_balance_sufficient,
-                    self._throttle_cycle,
+                # 콤보 틱은 같은 세션/트랜잭션을 공유하므로 순차 실행. 대신 심볼 가격 조회(WS 미수신 시 REST)는
+                # DB를 쓰지 않으므로 주문/체결 동기화와 겹쳐 미리 받아 두고, 틱에서는 캐시를 읽는다.
+                cycle_symbols = {s for c in combos for s in (c.symbols or [account.symbol])}
+                price_prefetch = asyncio.gather(
+                    *(self._price_collector.get_price(s) for s in cycle_symbols), return_exceptions=True
                 )
-                all_open_lots = await repos.lot.get_all_open_lots_for_account(self.account_id)
-                prefetched_lots: dict[tuple, list] = {}
-                for lot in all_open_lots:
-                    prefetched_lots.setdefault((lot.combo_id, lot.symbol), []).append(lot)
-                self._balance_error_in_cycle = False
+                try:
+                    await self._sync_orders_and_fills(account, all_combo_symbols, order_repo, position_repo, session)
+                    orphan_count = 0
+                    try:
+                        async with session.begin_nested():
+                            orphan_count = await self._reconcile_orphan_sells(order_repo, lot_repo, session)
+                    except Exception as e:
+                        logger.warning("Orphan reconciliation failed (non-fatal): %s", e)
+                    if orphan_count > 0:
+                        logger.warning(
+                            "Reconciled %d orphaned sell orders for account %s", orphan_count, self.account_id
+                        )
+                    self._instrument_sentry(cycle_id, len(combos))
+                    pause_mgr = BuyPauseManager(self.account_id, session)
+                    self._buy_pause_mgr = pause_mgr
+                    account_state = AccountStateManager(self.account_id, session)
+                    await account_state.preload()
+                    should_buy, self._throttle_cycle = BuyPauseManager.should_attempt_buy(
+                        self._buy_pause_state,
+                        is_balance_sufficient,
+                        self._throttle_cycle,
+                    )
+                    all_open_lots = await repos.lot.get_all_open_lots_for_account(self.account_id)
+                    prefetched_lots: dict[tuple, list] = {}
+                    for lot in all_open_lots:
+                        prefetched_lots.setdefault((lot.combo_seq, lot.symbol), []).append(lot)
+                    self._balance_error_in_cycle = False
+                except BaseException:
+                    # 동기화/조회가 실패하면 선행 가격 조회를 버린다 (await되지 않은 gather 방치 방지)
+                    price_prefetch.cancel()
+                    raise
+                await price_prefetch
                 await self._run_combo_loop(
                     combos,
                     account,
@@ -494,9 +511,9 @@ class AccountTrader:
                 if self._balance_error_in_cycle:
                     is_balance_sufficient = False
                 is_balance_sufficient = await self._post_cycle_sell_check(
-                    session,
                     account,
-                    len(all_open_lots),
+                    len(all_open_lots) + lot_repo.lots_opened - lot_repo.lots_closed,
+                    lot_repo.lots_closed,
                     is_balance_sufficient,
                     pause_mgr,
                 )
@@ -526,6 +543,7 @@ class AccountTrader:
         session,
         account_state: AccountStateManager,
         prefetched_lots: dict[tuple, list] | None = None,
+        combo_state: StrategyStateStore | None = None,
     ) -> None:
         """Execute buy/sell strategies for a single combo×symbol pair."""
         try:
@@ -549,13 +567,14 @@ class AccountTrader:
         buy_logic = self._get_or_create_buy(combo.id, symbol, combo.buy_logic_name)
         sell_logic = self._get_or_create_sell(combo.id, symbol, combo.sell_logic_name)
 
-        combo_state = StrategyStateStore(self.account_id, f"{combo.id}:{symbol}", session)
-        await combo_state.preload()
-        prefix = f"CMT_{str(self.account_id)[:8]}_{str(combo.id)[:8]}_"
+        if combo_state is None:
+            combo_state = StrategyStateStore(self.account_id, f"{combo.id}:{symbol}", session)
+            await combo_state.preload()
+        prefix = self._order_prefix(combo.id)
 
         # Use prefetched lots if available, otherwise fall back to DB query
         if prefetched_lots is not None:
-            open_lots = prefetched_lots.get((combo.id, symbol), [])
+            open_lots = prefetched_lots.get((combo.combo_seq, symbol), [])
         else:
             open_lots = await repos.lot.get_open_lots_by_combo(
                 self.account_id,
@@ -660,24 +679,26 @@ class AccountTrader:
 
             async def _fetch_order_data(oid: int):
                 symbol = order_symbol_map.get(oid, account.symbol)
-                await self._rate_limiter.acquire(weight=1)
                 return oid, await self._client.get_order(oid, symbol)
 
-            # API calls in parallel, DB writes sequential (AsyncSession is not concurrency-safe)
+            # API calls in parallel, DB write as one multi-row upsert (AsyncSession is not concurrency-safe)
+            await self._rate_limiter.acquire(weight=len(to_refresh))
             results = await asyncio.gather(
                 *[_fetch_order_data(oid) for oid in to_refresh],
                 return_exceptions=True,
             )
+            refreshed: dict[int, dict] = {}
             for res in results:
                 if isinstance(res, Exception):
                     logger.warning("Order sync fetch failed: %s", res)
                     continue
                 oid, order_data = res
-                try:
-                    await order_repo.upsert_order(self.account_id, order_data)
-                    synced_oids.add(oid)
-                except Exception as e:
-                    logger.warning("Order %s upsert failed: %s", oid, e)
+                refreshed[oid] = order_data
+            try:
+                await order_repo.upsert_orders_batch(self.account_id, list(refreshed.values()))
+                synced_oids.update(refreshed)
+            except Exception as e:
+                logger.warning("Order upsert failed for %s: %s", sorted(refreshed), e)
 
         # Step 3: Sync recent fills per symbol
         if self._is_paper:
@@ -693,10 +714,14 @@ class AccountTrader:
     async def _sync_paper_fills(self, symbols: set[str], order_repo: OrderRepository, session) -> set[str]:
         """Paper accounts: create Fill records from FILLED orders' raw_json."""
         # Find FILLED orders without corresponding fills
-        filled_stmt = select(Order).where(
-            Order.account_id == self.account_id,
-            Order.symbol.in_(symbols),
-            Order.status == "FILLED",
+        filled_stmt = (
+            select(Order)
+            .options(undefer(Order.raw_json))
+            .where(
+                Order.account_id == self.account_id,
+                Order.symbol.in_(symbols),
+                Order.status == "FILLED",
+            )
         )
         filled_result = await session.execute(filled_stmt)
         filled_orders = list(filled_result.scalars().all())
@@ -785,37 +810,42 @@ class AccountTrader:
                         seen_oids.add(oid)
                         unseen_oids.append(oid)
                     fill_rows.append((oid, t))
-                if fill_rows:
-                    await order_repo.insert_fills_batch(self.account_id, fill_rows)
-
-                if trades:
+                # 실제로 새로 들어간 체결이 있을 때만 포지션 재계산 대상 (MAX 조회 실패 시 전체 재조회는 중복뿐일 수 있음)
+                if fill_rows and await order_repo.insert_fills_batch(self.account_id, fill_rows):
                     symbols_with_new_fills.add(symbol)
 
-                # Parallel fetch for unseen order IDs (API parallel, DB sequential)
+                # 이미 최종 상태로 저장된 주문(예: 시장가 매수 응답 FILLED)은 재조회하지 않는다
+                if unseen_oids:
+                    final_oids = await order_repo.get_final_order_ids(self.account_id, unseen_oids)
+                    unseen_oids = [oid for oid in unseen_oids if oid not in final_oids]
+
+                # Parallel fetch for unseen order IDs (API parallel, one batched DB upsert)
                 if unseen_oids:
 
                     async def _fetch_fill_order_data(fill_oid: int, fill_sym: str = symbol):
-                        await self._rate_limiter.acquire(weight=1)
-                        return fill_oid, await self._client.get_order(fill_oid, fill_sym)
+                        return await self._client.get_order(fill_oid, fill_sym)
 
+                    await self._rate_limiter.acquire(weight=len(unseen_oids))
                     fill_results = await asyncio.gather(
                         *[_fetch_fill_order_data(oid) for oid in unseen_oids],
                         return_exceptions=True,
                     )
+                    fill_orders: list[dict] = []
                     for res in fill_results:
                         if isinstance(res, Exception):
                             logger.warning("Fill order fetch failed: %s", res)
                             continue
-                        fill_oid, order_data = res
-                        try:
-                            await order_repo.upsert_order(self.account_id, order_data)
-                        except Exception as e:
-                            logger.warning("Fill order %s upsert failed: %s", fill_oid, e)
+                        fill_orders.append(res)
+                    try:
+                        await order_repo.upsert_orders_batch(self.account_id, fill_orders)
+                    except Exception as e:
+                        logger.warning("Fill order upsert failed for %s: %s", symbol, e)
             except Exception as e:
                 logger.warning("Fills processing failed for %s: %s", symbol, e)
 
         return symbols_with_new_fills
 
+    # CMT_{account.hex[-8:]}_{combo.hex[-8:]}__TP_{lot_id}. 이전 형식(str(uuid)[:8])도 같은 모양이라 함께 매칭
     _ORPHAN_TP_RE = re.compile(r"^CMT_[0-9a-f]{8}_[0-9a-f]{8}__TP_(\d+)$")
 
     async def _reconcile_orphan_sells(
@@ -897,7 +927,7 @@ class AccountTrader:
         Transient/timeout 에러: 매수만 일시정지, trader 루프는 계속 실행.
         """
         # Set account context early so _init_client and error logs include account_id
-        token = current_account_id.set(str(self.account_id))
+        token = current_account_id.set(self._account_id_str)
         try:
             # Phase 3-A: _init_client() 실패 시 — PERMANENT만 CB, 나머지는 재시도
             try:
@@ -927,7 +957,8 @@ class AccountTrader:
             while self._running:
                 try:
                     # Phase 3-B: step() 타임아웃 (180초)
-                    loop_interval = await asyncio.wait_for(self.step(), timeout=180)
+                    async with asyncio.timeout(180):
+                        loop_interval = await self.step()
                 except TimeoutError:
                     self._consecutive_failures += 1
                     self._failure_history.append(f"[{self._consecutive_failures}] Timeout (180s)")
@@ -938,7 +969,7 @@ class AccountTrader:
                         await self._pause_buying_on_error("consecutive timeouts")
 
                     backoff = min(60, 2 ** (self._consecutive_failures - 1))
-                    await asyncio.sleep(backoff)
+                    await self._interruptible_sleep(backoff)
                     continue
                 except Exception as e:
                     err_type = classify_error(e)
@@ -979,7 +1010,7 @@ class AccountTrader:
                             await self._pause_buying_on_error(f"transient errors ({self._consecutive_failures}x)")
 
                     backoff = min(60, 2 ** (self._consecutive_failures - 1))
-                    await asyncio.sleep(backoff)
+                    await self._interruptible_sleep(backoff)
                     continue
 
                 # Success — reset failure counter and resume buying if paused by errors
@@ -1003,9 +1034,15 @@ class AccountTrader:
 
     async def _interruptible_sleep(self, seconds: float):
         """Sleep that can be interrupted by _wake_event (manual resume)."""
+        # wait_for는 평상시 경로(타임아웃)마다 TimeoutError를 만들어 삼키므로, 타이머로 이벤트를 직접 세운다
+        if not self._running:
+            return  # step() 도중 stop()이 세운 이벤트를 아래 clear()가 지우지 않도록
         self._wake_event.clear()
-        with contextlib.suppress(TimeoutError):
-            await asyncio.wait_for(self._wake_event.wait(), timeout=seconds)
+        handle = asyncio.get_running_loop().call_later(seconds, self._wake_event.set)
+        try:
+            await self._wake_event.wait()
+        finally:
+            handle.cancel()
 
     async def _disable_with_circuit_breaker(self):
         async with TradingSessionLocal() as session:
@@ -1025,12 +1062,13 @@ class AccountTrader:
         try:
             alert = get_alert_service()
             failure_detail = "\n".join(self._failure_history[-5:]) if self._failure_history else "N/A"
-            await alert.send_critical(
+            alert.send_in_background(
                 f"Circuit Breaker triggered\n"
                 f"Account: {self.account_id}\n"
                 f"Consecutive failures: {self._consecutive_failures}\n"
                 f"Failure history:\n{failure_detail}\n"
-                f"Auto recovery will attempt in 30 minutes"
+                f"Auto recovery will attempt in 30 minutes",
+                AlertSeverity.CRITICAL,
             )
         except Exception as alert_err:
             logger.warning("Failed to send CB alert: %s", alert_err)
@@ -1050,8 +1088,9 @@ class AccountTrader:
             logger.warning("Buying paused due to errors: %s", reason)
 
             alert = get_alert_service()
-            await alert.send_critical(
-                f"Buying paused (errors)\nAccount: {self.account_id}\nReason: {reason}\nSelling/monitoring continues"
+            alert.send_in_background(
+                f"Buying paused (errors)\nAccount: {self.account_id}\nReason: {reason}\nSelling/monitoring continues",
+                AlertSeverity.CRITICAL,
             )
         except Exception as e:
             logger.warning("Failed to pause buying on error: %s", e)
@@ -1059,11 +1098,13 @@ class AccountTrader:
     async def stop_async(self):
         """Stop trading loop and clear exchange client credentials from memory."""
         self._running = False
+        self._wake_event.set()
         if self._client and hasattr(self._client, "close"):
             await self._client.close()
 
     def stop(self):
         self._running = False
+        self._wake_event.set()  # 대기 중인 sleep/backoff를 즉시 깨워 루프를 종료시킨다
 
     def wake(self):
         """Wake the trading loop from interruptible sleep (for manual resume)."""
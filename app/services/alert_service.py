@@ -10,6 +10,8 @@ Features:
 
 from __future__ import annotations
 
+import asyncio
+import html
 import logging
 import time
 from collections import deque
@@ -29,6 +31,14 @@ class AlertSeverity(StrEnum):
     INFO = "INFO"  # daily digest, status updates
 
 
+_SEVERITY_PREFIX = {
+    AlertSeverity.CRITICAL: "🚨",
+    AlertSeverity.HIGH: "⚠️",
+    AlertSeverity.MEDIUM: "📊",
+    AlertSeverity.INFO: "ℹ️",
+}
+
+
 class AlertService:
     """Lightweight Telegram alerting. No external queue needed at this scale."""
 
@@ -44,6 +54,9 @@ class AlertService:
         self._consecutive_failures = 0
         self._max_failures = 5  # circuit breaker for Telegram API itself
         self._client = httpx.AsyncClient(timeout=5.0)
+        # send_in_background()로 띄운 전송 태스크 (GC 방지 + 종료 시 drain). 상한 초과분은 버린다
+        self._pending: set[asyncio.Task] = set()
+        self._max_pending = 256
 
     @property
     def is_enabled(self) -> bool:
@@ -62,16 +75,7 @@ class AlertService:
             logger.debug("Alert rate-limited: %s", message[:50])
             return False
 
-        prefix = {
-            AlertSeverity.CRITICAL: "🚨",
-            AlertSeverity.HIGH: "⚠️",
-            AlertSeverity.MEDIUM: "📊",
-            AlertSeverity.INFO: "ℹ️",
-        }.get(severity, "")
-
-        import html
-
-        formatted = f"{prefix} [{severity.value}] {html.escape(message)}"
+        formatted = f"{_SEVERITY_PREFIX.get(severity, '')} [{severity}] {html.escape(message)}"
 
         try:
             return await self._send_telegram(formatted)
@@ -85,6 +89,17 @@ class AlertService:
                 )
             return False
 
+    def send_in_background(self, message: str, severity: AlertSeverity = AlertSeverity.INFO) -> None:
+        """Schedule send() without awaiting it, so callers never wait on Telegram I/O."""
+        if not self.is_enabled:
+            return
+        if len(self._pending) >= self._max_pending:
+            logger.debug("Alert dropped (%d pending): %s", len(self._pending), message[:50])
+            return
+        task = asyncio.create_task(self.send(message, severity))
+        self._pending.add(task)
+        task.add_done_callback(self._pending.discard)
+
     async def send_critical(self, message: str) -> bool:
         """Immediate send for circuit breaker, account disable events."""
         return await self.send(message, AlertSeverity.CRITICAL)
@@ -128,7 +143,9 @@ class AlertService:
         return len(self._send_times) < self._rate_limit
 
     async def close(self) -> None:
-        """Close the shared HTTP client."""
+        """Flush background sends, then close the shared HTTP client."""
+        if self._pending:
+            await asyncio.gather(*self._pending, return_exceptions=True)
         await self._client.aclose()
 
     def reset_circuit_breaker(self) -> None:
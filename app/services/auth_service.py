@@ -1,15 +1,19 @@
 from __future__ import annotations
 
+import asyncio
 import logging
 import re
+import time
 from datetime import UTC, datetime, timedelta
-from uuid import UUID, uuid4
+from uuid import UUID
 
 import bcrypt
-from sqlalchemy import select
+from sqlalchemy import case, select, update
 from sqlalchemy.ext.asyncio import async_sessionmaker
 
+from app.config import get_settings
 from app.models.user import UserProfile
+from app.utils.uuid7 import uuid7
 
 logger = logging.getLogger(__name__)
 
@@ -17,8 +21,25 @@ logger = logging.getLogger(__name__)
 MAX_FAILED_ATTEMPTS = 5
 LOCK_DURATION_MINUTES = 30
 
-# Pre-hashed dummy password for timing-attack prevention
-_DUMMY_HASH = bcrypt.hashpw(b"dummy-timing-safe", bcrypt.gensalt(rounds=12))
+_BCRYPT_ROUNDS = get_settings().bcrypt_rounds
+
+# 이메일별 로그인 토큰 버킷: 초당 리필량 / 최대 토큰. 소진 시 bcrypt 전에 즉시 거절
+LOGIN_BUCKET_RATE = 0.2
+LOGIN_BUCKET_CAPACITY = 10
+_BUCKET_SWEEP_EVERY = 1024
+
+# Pre-hashed dummy password for timing-attack prevention.
+# 실제 해시와 같은 cost여야 "존재하지 않는 계정" 응답 시간이 구분되지 않는다.
+_DUMMY_HASH = bcrypt.hashpw(b"dummy-timing-safe", bcrypt.gensalt(rounds=_BCRYPT_ROUNDS))
+
+
+async def _dummy_verify(password: str) -> None:
+    """실패 경로용 더미 bcrypt 비교 — 실제 검증 1회와 같은 시간을 소모한다."""
+    await asyncio.to_thread(bcrypt.checkpw, password.encode("utf-8"), _DUMMY_HASH)
+
+
+class LoginThrottledError(Exception):
+    """같은 이메일로 로그인 시도가 너무 잦음 (토큰 버킷 소진)."""
 
 
 class AuthService:
@@ -26,47 +47,89 @@ class AuthService:
 
     def __init__(self, session_factory: async_sessionmaker):
         self._session_factory = session_factory
+        self._login_buckets: dict[str, tuple[float, float]] = {}  # email → (tokens, last_refill)
+        self._bucket_calls = 0
+
+    def _take_login_token(self, email: str) -> bool:
+        """토큰 1개 소비. 버킷이 비었으면 False."""
+        now = time.monotonic()
+        self._bucket_calls += 1
+        if self._bucket_calls % _BUCKET_SWEEP_EVERY == 0:
+            # 가득 찰 만큼 오래 쉰 버킷은 새 버킷과 같으므로 제거
+            full_after = LOGIN_BUCKET_CAPACITY / LOGIN_BUCKET_RATE
+            self._login_buckets = {k: v for k, v in self._login_buckets.items() if now - v[1] < full_after}
+
+        tokens, last = self._login_buckets.get(email, (LOGIN_BUCKET_CAPACITY, now))
+        tokens = min(LOGIN_BUCKET_CAPACITY, tokens + (now - last) * LOGIN_BUCKET_RATE)
+        if tokens < 1:
+            self._login_buckets[email] = (tokens, now)
+            return False
+        self._login_buckets[email] = (tokens - 1, now)
+        return True
 
     async def authenticate(self, email: str, password: str) -> dict | None:
         """
         이메일+비밀번호 인증.
         성공: {"id": str, "email": str, "role": str}
         실패: None
+        시도 과다: LoginThrottledError (DB/bcrypt 접근 없이 즉시)
         """
+        if not self._take_login_token(email.lower()):
+            raise LoginThrottledError(email)
+
         async with self._session_factory() as session:
             stmt = select(UserProfile).where(UserProfile.email == email)
             result = await session.execute(stmt)
             user = result.scalar_one_or_none()
 
+            # Timing attack prevention: bcrypt 검증 전에 끝나는 모든 실패 경로는
+            # 더미 비교를 정확히 1회 수행해 비밀번호 오답과 응답 시간을 맞춘다.
             if not user:
-                # Timing attack prevention: dummy bcrypt comparison
-                bcrypt.checkpw(password.encode("utf-8"), _DUMMY_HASH)
+                await _dummy_verify(password)
                 return None
 
             # Check account lock
             now = datetime.now(UTC)
             if user.locked_until and user.locked_until > now:
+                await _dummy_verify(password)
                 return None
 
             # Check active status
             if not user.is_active:
+                await _dummy_verify(password)
                 return None
 
             # Check password (None = no password set yet)
             if not user.password_hash:
+                await _dummy_verify(password)
                 return None
 
-            password_valid = bcrypt.checkpw(
+            # bcrypt는 호출당 수백 ms CPU — 이벤트 루프 밖(스레드)에서 실행
+            password_valid = await asyncio.to_thread(
+                bcrypt.checkpw,
                 password.encode("utf-8"),
                 user.password_hash.encode("utf-8"),
             )
 
             if not password_valid:
-                user.failed_login_count += 1
-                if user.failed_login_count >= MAX_FAILED_ATTEMPTS:
-                    user.locked_until = now + timedelta(minutes=LOCK_DURATION_MINUTES)
-                    logger.warning("Account locked: %s (failed %d times)", email, user.failed_login_count)
+                # 단일 UPDATE로 원자적 증감 — 동시 오답 시도 간 카운트 유실 방지
+                new_count = UserProfile.failed_login_count + 1
+                stmt = (
+                    update(UserProfile)
+                    .where(UserProfile.id == user.id)
+                    .values(
+                        failed_login_count=new_count,
+                        locked_until=case(
+                            (new_count >= MAX_FAILED_ATTEMPTS, now + timedelta(minutes=LOCK_DURATION_MINUTES)),
+                            else_=UserProfile.locked_until,
+                        ),
+                    )
+                    .returning(UserProfile.failed_login_count)
+                )
+                failed_count = (await session.execute(stmt)).scalar_one()
                 await session.commit()
+                if failed_count >= MAX_FAILED_ATTEMPTS:
+                    logger.warning("Account locked: %s (failed %d times)", email, failed_count)
                 return None
 
             # Success: reset counters
@@ -95,6 +158,10 @@ class AuthService:
                 "password_changed_at": user.password_changed_at,
             }
 
+    @staticmethod
+    def _hash_password(password: str) -> str:
+        return bcrypt.hashpw(password.encode("utf-8"), bcrypt.gensalt(rounds=_BCRYPT_ROUNDS)).decode("utf-8")
+
     @staticmethod
     def _validate_password(password: str) -> None:
         """비밀번호 복잡도 검증 (12자+, 대소문자+숫자). 스키마와 동일한 규칙."""
@@ -113,7 +180,7 @@ class AuthService:
         """새 사용자 생성. 비밀번호 복잡도 검증 포함."""
         self._validate_password(password)
 
-        hashed = bcrypt.hashpw(password.encode("utf-8"), bcrypt.gensalt(rounds=12))
+        hashed = await asyncio.to_thread(self._hash_password, password)
 
         async with self._session_factory() as session:
             # Check duplicate email
@@ -123,9 +190,9 @@ class AuthService:
                 raise ValueError("이미 등록된 이메일입니다.")
 
             new_user = UserProfile(
-                id=uuid4(),
+                id=uuid7(),
                 email=email,
-                password_hash=hashed.decode("utf-8"),
+                password_hash=hashed,
                 role=role,
                 password_changed_at=datetime.now(UTC),
             )
@@ -143,7 +210,7 @@ class AuthService:
         """비밀번호 초기화. 잠금 해제 포함."""
         self._validate_password(new_password)
 
-        hashed = bcrypt.hashpw(new_password.encode("utf-8"), bcrypt.gensalt(rounds=12))
+        hashed = await asyncio.to_thread(self._hash_password, new_password)
 
         async with self._session_factory() as session:
             stmt = select(UserProfile).where(UserProfile.id == UUID(user_id))
@@ -152,7 +219,7 @@ class AuthService:
             if not user:
                 return False
 
-            user.password_hash = hashed.decode("utf-8")
+            user.password_hash = hashed
             user.password_changed_at = datetime.now(UTC)
             user.failed_login_count = 0
             user.locked_until = None
@@ -5,6 +5,11 @@ Retention policy:
   - 1m candles: kept for 7 days, then aggregated to 5m
   - 5m candles: kept for 30 days, then aggregated to 1h
   - 1h candles: kept for 90 days, then aggregated to 1d
+
+price_candles_1m is partitioned by day; maintain_partitions() pre-creates
+upcoming partitions. Expired 1m days are aggregated and then removed by
+dropping their partitions (no row-by-row DELETE); only rows that landed in the
+DEFAULT partition are deleted.
 """
 
 from __future__ import annotations
@@ -17,7 +22,13 @@ from sqlalchemy import distinct, select
 
 from app.db.session import TradingSessionLocal
 from app.models.price_candle import PriceCandle1m
-from app.services.candle_store import aggregate_candles, delete_old_candles
+from app.services.candle_store import (
+    aggregate_candles,
+    delete_old_candles,
+    delete_old_candles_1m_default,
+    drop_expired_candle_partitions_1m,
+    ensure_candle_partitions_1m,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -26,9 +37,14 @@ _7_DAYS_MS = 7 * 24 * 60 * 60 * 1000
 _30_DAYS_MS = 30 * 24 * 60 * 60 * 1000
 _90_DAYS_MS = 90 * 24 * 60 * 60 * 1000
 
+_1_DAY_MS = 24 * 60 * 60 * 1000
+
 # Aggregation interval (6 hours)
 _RUN_INTERVAL_SEC = 6 * 60 * 60
 
+# 동시에 집계할 심볼 수 (심볼당 세션 1개 점유)
+_MAX_CONCURRENT_SYMBOLS = 4
+
 # Tiers: (source_interval, target_interval, retention_ms)
 _TIERS = [
     ("1m", "5m", _7_DAYS_MS),
@@ -40,6 +56,16 @@ _TIERS = [
 class CandleAggregator:
     """Periodic candle compaction job."""
 
+    async def maintain_partitions(self) -> list[str]:
+        """Create upcoming 1m partitions. Returns names of the partitions created."""
+        now_ms = int(time.time() * 1000)
+        async with TradingSessionLocal() as session:
+            created = await ensure_candle_partitions_1m(now_ms, session=session)
+            await session.commit()
+        if created:
+            logger.info("CandleAggregator: 1m partitions created=%s", created)
+        return created
+
     async def run_once(self) -> dict:
         """Execute one round of aggregation for all symbols.
         Returns a summary of work done."""
@@ -52,58 +78,105 @@ class CandleAggregator:
             result = await session.execute(stmt)
             symbols = [row[0] for row in result.all()]
 
-        if not symbols:
-            return summary
-
-        for symbol in symbols:
-            symbol_summary = {}
-            for source_interval, target_interval, retention_ms in _TIERS:
-                cutoff_ms = now_ms - retention_ms
-                try:
-                    # Single transaction: aggregate + delete
-                    async with TradingSessionLocal() as session:
-                        aggregated = await aggregate_candles(
+        # 모든 심볼이 같은 기준 시각을 쓰므로 tier별 cutoff는 한 번만 계산.
+        # 1m은 일 단위 파티션을 통째로 DROP하므로 cutoff를 UTC 일 경계로 내림
+        cutoff_1m = (now_ms - _7_DAYS_MS) // _1_DAY_MS * _1_DAY_MS
+        tiers = [(src, tgt, cutoff_1m if src == "1m" else now_ms - retention_ms) for src, tgt, retention_ms in _TIERS]
+
+        # 심볼 간에는 독립이므로 동시 처리. 트레이더와 커넥션 풀을 공유하므로 동시성은 작게 제한
+        sem = asyncio.Semaphore(_MAX_CONCURRENT_SYMBOLS)
+
+        async def _bounded(symbol: str) -> tuple[dict, set[str]]:
+            async with sem:
+                return await self._compact_symbol(symbol, tiers)
+
+        results = await asyncio.gather(*(_bounded(symbol) for symbol in symbols))
+        failed_1m = []
+        for symbol, (symbol_summary, failed_sources) in zip(symbols, results, strict=True):
+            if symbol_summary:
+                summary[symbol] = symbol_summary
+            if "1m" in failed_sources:
+                failed_1m.append(symbol)
+
+        # 만료된 1m 파티션은 모든 심볼의 1m->5m 집계가 끝난 뒤에만 DROP (행이 파티션과 함께 사라진다)
+        if failed_1m:
+            logger.warning("CandleAggregator: 1m->5m failed for %s; expired 1m partitions kept", failed_1m)
+        else:
+            await self._drop_expired_partitions(cutoff_1m)
+
+        return summary
+
+    async def _drop_expired_partitions(self, cutoff_ms: int) -> list[str]:
+        """cutoff_ms 이전의 1m 일별 파티션을 DROP."""
+        try:
+            async with TradingSessionLocal() as session:
+                dropped = await drop_expired_candle_partitions_1m(cutoff_ms, session=session)
+                await session.commit()
+        except Exception as e:
+            logger.error("CandleAggregator: 1m partition drop failed: %s", e)
+            return []
+        if dropped:
+            logger.info("CandleAggregator: 1m partitions dropped=%s", dropped)
+        return dropped
+
+    async def _compact_symbol(self, symbol: str, tiers: list[tuple[str, str, int]]) -> tuple[dict, set[str]]:
+        """한 심볼의 tier들을 순서대로 집계 (상위 tier가 하위 tier 결과를 읽으므로 순차).
+
+        Returns (summary, 집계에 실패한 source interval 집합).
+        """
+        symbol_summary = {}
+        failed_sources = set()
+        for source_interval, target_interval, cutoff_ms in tiers:
+            try:
+                # Single transaction: aggregate + delete
+                async with TradingSessionLocal() as session:
+                    aggregated = await aggregate_candles(
+                        symbol=symbol,
+                        source_interval=source_interval,
+                        target_interval=target_interval,
+                        cutoff_ts_ms=cutoff_ms,
+                        session=session,
+                    )
+                    deleted = 0
+                    if aggregated > 0 and source_interval == "1m":
+                        # 일별 파티션의 행은 run_once가 파티션 DROP으로 정리
+                        deleted = await delete_old_candles_1m_default(
                             symbol=symbol,
-                            source_interval=source_interval,
-                            target_interval=target_interval,
-                            cutoff_ts_ms=cutoff_ms,
+                            before_ts_ms=cutoff_ms,
                             session=session,
                         )
-                        deleted = 0
-                        if aggregated > 0:
-                            deleted = await delete_old_candles(
-                                symbol=symbol,
-                                interval=source_interval,
-                                before_ts_ms=cutoff_ms,
-                                session=session,
-                            )
-                        await session.commit()
-
-                    if aggregated > 0 or deleted > 0:
-                        symbol_summary[f"{source_interval}->{target_interval}"] = {
-                            "aggregated": aggregated,
-                            "deleted": deleted,
-                        }
-                        logger.info(
-                            "CandleAggregator: %s %s->%s: aggregated=%d, deleted=%d",
-                            symbol,
-                            source_interval,
-                            target_interval,
-                            aggregated,
-                            deleted,
+                    elif aggregated > 0:
+                        deleted = await delete_old_candles(
+                            symbol=symbol,
+                            interval=source_interval,
+                            before_ts_ms=cutoff_ms,
+                            session=session,
                         )
-                except Exception as e:
-                    logger.error(
-                        "CandleAggregator: %s %s->%s failed: %s",
+                    await session.commit()
+
+                if aggregated > 0 or deleted > 0:
+                    symbol_summary[f"{source_interval}->{target_interval}"] = {
+                        "aggregated": aggregated,
+                        "deleted": deleted,
+                    }
+                    logger.info(
+                        "CandleAggregator: %s %s->%s: aggregated=%d, deleted=%d",
                         symbol,
                         source_interval,
                         target_interval,
-                        e,
+                        aggregated,
+                        deleted,
                     )
-            if symbol_summary:
-                summary[symbol] = symbol_summary
-
-        return summary
+            except Exception as e:
+                failed_sources.add(source_interval)
+                logger.error(
+                    "CandleAggregator: %s %s->%s failed: %s",
+                    symbol,
+                    source_interval,
+                    target_interval,
+                    e,
+                )
+        return symbol_summary, failed_sources
 
 
 async def run_aggregation_loop() -> None:
@@ -111,6 +184,12 @@ async def run_aggregation_loop() -> None:
     aggregator = CandleAggregator()
     logger.info("CandleAggregator: background loop started (interval: %ds)", _RUN_INTERVAL_SEC)
 
+    # 다운타임 이후 재시작 시 오늘 파티션이 없을 수 있으므로 대기 전에 먼저 생성
+    try:
+        await aggregator.maintain_partitions()
+    except Exception as e:
+        logger.error("CandleAggregator: partition maintenance failed: %s", e)
+
     # Wait 5 minutes after startup before first run
     await asyncio.sleep(300)
 
@@ -119,6 +198,7 @@ async def run_aggregation_loop() -> None:
             summary = await aggregator.run_once()
             if summary:
                 logger.info("CandleAggregator: completed — %s", summary)
+            await aggregator.maintain_partitions()
         except asyncio.CancelledError:
             logger.info("CandleAggregator: background loop cancelled")
             return
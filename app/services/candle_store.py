@@ -8,6 +8,7 @@ an existing transaction context OR with a fresh session.
 from __future__ import annotations
 
 import logging
+from datetime import UTC, datetime
 
 from sqlalchemy import delete, select, text
 from sqlalchemy.dialects.postgresql import insert as pg_insert
@@ -31,6 +32,11 @@ BUCKET_MS = {
     "1d": 24 * 60 * 60 * 1000,
 }
 
+# price_candles_1m daily RANGE partitions (see migration 027)
+_1M_PARENT = PriceCandle1m.__tablename__
+_1M_DEFAULT = f"{_1M_PARENT}_default"
+_PARTITION_DAY_MS = BUCKET_MS["1d"]
+
 
 async def store_closed_candle_1m(
     symbol: str,
@@ -176,3 +182,100 @@ async def delete_old_candles(
     )
     result = await session.execute(stmt)
     return result.rowcount
+
+
+async def delete_old_candles_1m_default(
+    symbol: str,
+    before_ts_ms: int,
+    *,
+    session: AsyncSession,
+) -> int:
+    """Delete 1m candles older than before_ts_ms from the DEFAULT partition only.
+
+    Rows in the daily partitions are removed by drop_expired_candle_partitions_1m;
+    only days whose partition was missing when they arrived end up here.
+    Returns count deleted.
+    """
+    result = await session.execute(
+        text(f"DELETE FROM {_1M_DEFAULT} WHERE symbol = :symbol AND ts_ms < :before"),
+        {"symbol": symbol, "before": before_ts_ms},
+    )
+    return result.rowcount
+
+
+def candle_partition_name_1m(ts_ms: int) -> str:
+    """Return the daily partition name that holds ts_ms, e.g. price_candles_1m_p20260115."""
+    day = datetime.fromtimestamp(ts_ms // 1000, tz=UTC)
+    return f"{_1M_PARENT}_p{day:%Y%m%d}"
+
+
+async def ensure_candle_partitions_1m(
+    now_ms: int,
+    days_ahead: int = 3,
+    *,
+    session: AsyncSession,
+) -> list[str]:
+    """Create daily 1m partitions from today through today + days_ahead.
+
+    Must run before candles for those days arrive: once the DEFAULT partition
+    holds rows for a day, PostgreSQL refuses to create that day's partition.
+    Each day is created in its own SAVEPOINT so such a day is logged and skipped
+    without aborting the other days (or the caller's transaction).
+    Returns names of the partitions created.
+    """
+    day_start = now_ms // _PARTITION_DAY_MS * _PARTITION_DAY_MS
+    created = []
+    for i in range(days_ahead + 1):
+        lower = day_start + i * _PARTITION_DAY_MS
+        name = candle_partition_name_1m(lower)
+        exists = await session.scalar(text("SELECT to_regclass(:name)"), {"name": name})
+        if exists is not None:
+            continue
+        conn = await session.connection()
+        try:
+            async with conn.begin_nested():
+                # SAFETY: name/bounds are derived from integers only — no user input
+                await conn.execute(
+                    text(
+                        f"CREATE TABLE {name} PARTITION OF {_1M_PARENT} "
+                        f"FOR VALUES FROM ({lower}) TO ({lower + _PARTITION_DAY_MS})"
+                    )
+                )
+        except Exception as e:
+            logger.error("1m partition %s not created (rows for that day stay in DEFAULT): %s", name, e)
+            continue
+        created.append(name)
+    return created
+
+
+async def drop_expired_candle_partitions_1m(
+    before_ts_ms: int,
+    *,
+    session: AsyncSession,
+) -> list[str]:
+    """Drop daily 1m partitions that lie entirely before before_ts_ms.
+
+    Replaces a row-by-row DELETE for the 1m tier: the caller must have
+    aggregated every symbol up to before_ts_ms first, because the rows are
+    dropped together with the partition. The DEFAULT partition is never dropped.
+    Returns names of the partitions dropped.
+    """
+    result = await session.execute(
+        text(
+            "SELECT c.relname FROM pg_inherits i "
+            "JOIN pg_class c ON c.oid = i.inhrelid "
+            "WHERE i.inhparent = CAST(:parent AS regclass)"
+        ),
+        {"parent": _1M_PARENT},
+    )
+    prefix = f"{_1M_PARENT}_p"
+    dropped = []
+    for (name,) in result.all():
+        if not name.startswith(prefix):
+            continue  # DEFAULT partition
+        lower = int(datetime.strptime(name[len(prefix) :], "%Y%m%d").replace(tzinfo=UTC).timestamp() * 1000)
+        if lower + _PARTITION_DAY_MS > before_ts_ms:
+            continue
+        await session.execute(text(f"DROP TABLE {name}"))
+        dropped.append(name)
+    return dropped
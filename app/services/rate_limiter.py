@@ -6,6 +6,10 @@ from aiolimiter import AsyncLimiter
 
 logger = logging.getLogger(__name__)
 
+# 한 번에 요청하는 최대 weight. aiolimiter는 max_rate 초과 요청에 ValueError를 던지고,
+# 대기열에서 작은 요청부터 깨우므로 큰 요청은 잘게 나눠야 굶지 않는다.
+_MAX_ACQUIRE_CHUNK = 50
+
 
 class GlobalRateLimiter:
     """
@@ -17,11 +21,17 @@ class GlobalRateLimiter:
     def __init__(self, max_rate: int = 1000, time_period: float = 60.0):
         self._limiter = AsyncLimiter(max_rate=max_rate, time_period=time_period)
         self._max_rate = max_rate
+        self._chunk = max(1, min(max_rate, _MAX_ACQUIRE_CHUNK))
 
     async def acquire(self, weight: int = 1):
-        """weight만큼의 API 요청 용량을 확보. 초과 시 자동 대기."""
-        for _ in range(weight):
-            await self._limiter.acquire()
+        """weight만큼의 API 요청 용량을 확보. 초과 시 자동 대기.
+
+        여러 요청분을 한 번에 확보할 때는 weight 합계를 chunk 단위로 나눠 확보한다.
+        """
+        while weight > 0:
+            amount = min(weight, self._chunk)
+            await self._limiter.acquire(amount)
+            weight -= amount
 
     @property
     def max_rate(self) -> int:
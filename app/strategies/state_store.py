@@ -2,7 +2,8 @@ from __future__ import annotations
 
 from uuid import UUID
 
-from sqlalchemy import delete, select
+from sqlalchemy import String, func, literal, select, update
+from sqlalchemy.dialects.postgresql import ARRAY
 from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -13,6 +14,7 @@ class StrategyStateStore:
     """
     전략별 상태를 strategy_state 테이블에서 관리.
     scope별로 격리: 'lot_stacking', 'trend_buy', 'shared'
+    scope당 한 행 — 모든 키가 state JSONB에 있으므로 preload()는 단일 PK 조회.
     """
 
     def __init__(self, account_id: UUID, scope: str, session: AsyncSession):
@@ -30,20 +32,34 @@ class StrategyStateStore:
         """Create a store with the same session but different scope (cache not inherited)."""
         return StrategyStateStore(self.account_id, scope, self._session)
 
+    @classmethod
+    async def preload_many(
+        cls, account_id: UUID, scopes: list[str], session: AsyncSession
+    ) -> dict[str, StrategyStateStore]:
+        """Build preloaded stores for several scopes with a single SELECT (scope → store)."""
+        stores = {scope: cls(account_id, scope, session) for scope in scopes}
+        if not stores:
+            return stores
+        stmt = select(StrategyState.scope, StrategyState.state).where(
+            StrategyState.account_id == account_id,
+            StrategyState.scope.in_(list(stores)),
+        )
+        result = await session.execute(stmt)
+        loaded = {scope: dict(state or {}) for scope, state in result.all()}
+        for scope, store in stores.items():
+            store._cache = loaded.get(scope, {})
+        return stores
+
     async def preload(self) -> None:
         """Bulk-load all keys for this scope into the in-memory cache."""
         self._cache = await self.get_all()
 
     async def get(self, key: str, default: str | None = None) -> str | None:
-        """strategy_state에서 (account_id, scope, key)로 값 조회"""
+        """strategy_state에서 (account_id, scope) 행의 state->>key 조회"""
         if self._cache is not None:
             val = self._cache.get(key)
             return val if val is not None else default
-        stmt = select(StrategyState.value).where(
-            StrategyState.account_id == self.account_id,
-            StrategyState.scope == self.scope,
-            StrategyState.key == key,
-        )
+        stmt = select(StrategyState.state[key].astext).where(*self._row_filter())
         result = await self._session.execute(stmt)
         row = result.scalar_one_or_none()
         return row if row is not None else default
@@ -67,63 +83,35 @@ class StrategyStateStore:
             return default
 
     async def set(self, key: str, value) -> None:
-        """strategy_state에 (account_id, scope, key) -> value upsert (write-through cache)"""
-        str_value = str(value)
-        stmt = (
-            pg_insert(StrategyState)
-            .values(
-                account_id=self.account_id,
-                scope=self.scope,
-                key=key,
-                value=str_value,
-            )
-            .on_conflict_do_update(
-                index_elements=["account_id", "scope", "key"],
-                set_={"value": str_value},
-            )
-        )
-        await self._session.execute(stmt)
-        if self._cache is not None:
-            self._cache[key] = str_value
+        """strategy_state에 (account_id, scope) 행의 key -> value upsert (write-through cache)"""
+        await self.set_many({key: value})
 
     async def set_many(self, items: dict[str, object]) -> None:
-        """Batch upsert multiple keys in a single statement."""
+        """Merge multiple keys into the scope's state in a single statement."""
         if not items:
             return
-        rows = [
-            {"account_id": self.account_id, "scope": self.scope, "key": k, "value": str(v)} for k, v in items.items()
-        ]
-        stmt = (
-            pg_insert(StrategyState)
-            .values(rows)
-            .on_conflict_do_update(
-                index_elements=["account_id", "scope", "key"],
-                set_={"value": pg_insert(StrategyState).excluded.value},
-            )
+        values = {k: str(v) for k, v in items.items()}
+        stmt = pg_insert(StrategyState).values(account_id=self.account_id, scope=self.scope, state=values)
+        # state || excluded.state — 기존 키는 유지하고 전달된 키만 덮어쓴다 (행 단위 원자적 병합)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["account_id", "scope"],
+            set_={"state": StrategyState.state.op("||")(stmt.excluded.state), "updated_at": func.now()},
         )
         await self._session.execute(stmt)
         if self._cache is not None:
-            for k, v in items.items():
-                self._cache[k] = str(v)
+            self._cache.update(values)
 
     async def delete(self, key: str) -> None:
-        stmt = delete(StrategyState).where(
-            StrategyState.account_id == self.account_id,
-            StrategyState.scope == self.scope,
-            StrategyState.key == key,
-        )
-        await self._session.execute(stmt)
-        if self._cache is not None:
-            self._cache.pop(key, None)
+        await self.clear_keys(key)
 
     async def clear_keys(self, *keys: str) -> None:
-        """여러 키 삭제 — single batch DELETE (pending 상태 정리 등)"""
+        """여러 키 삭제 — single UPDATE (state - keys[]) (pending 상태 정리 등)"""
         if not keys:
             return
-        stmt = delete(StrategyState).where(
-            StrategyState.account_id == self.account_id,
-            StrategyState.scope == self.scope,
-            StrategyState.key.in_(keys),
+        stmt = (
+            update(StrategyState)
+            .where(*self._row_filter())
+            .values(state=StrategyState.state.op("-")(literal(list(keys), ARRAY(String))))
         )
         await self._session.execute(stmt)
         if self._cache is not None:
@@ -132,9 +120,9 @@ class StrategyStateStore:
 
     async def get_all(self) -> dict[str, str]:
         """이 scope의 모든 키-값 조회"""
-        stmt = select(StrategyState.key, StrategyState.value).where(
-            StrategyState.account_id == self.account_id,
-            StrategyState.scope == self.scope,
-        )
+        stmt = select(StrategyState.state).where(*self._row_filter())
         result = await self._session.execute(stmt)
-        return {row.key: row.value for row in result}
+        return dict(result.scalar_one_or_none() or {})
+
+    def _row_filter(self) -> tuple:
+        return (StrategyState.account_id == self.account_id, StrategyState.scope == self.scope)
@@ -0,0 +1,22 @@
+"""RFC 9562 UUIDv7 generator.
+
+앞 48비트가 Unix ms 타임스탬프라 새 PK가 B-tree 인덱스 끝에 모인다 (uuid4는 임의 leaf 페이지에 삽입).
+Python 3.14 전까지 표준 라이브러리에 uuid7이 없어 직접 구현한다.
+"""
+
+import os
+import time
+import uuid
+
+_RAND_B_BITS = 62
+_RAND_B_MASK = (1 << _RAND_B_BITS) - 1
+
+
+def uuid7() -> uuid.UUID:
+    """Return a time-ordered UUID: 48-bit unix_ts_ms | ver=7 | 12-bit rand_a | var=0b10 | 62-bit rand_b."""
+    ts_ms = time.time_ns() // 1_000_000
+    rand = int.from_bytes(os.urandom(10), "big")  # 80 bits: 12 for rand_a, 62 for rand_b (+6 unused)
+    rand_a = (rand >> _RAND_B_BITS) & 0xFFF
+    rand_b = rand & _RAND_B_MASK
+    value = (ts_ms & 0xFFFF_FFFF_FFFF) << 80 | 0x7 << 76 | rand_a << 64 | 0b10 << 62 | rand_b
+    return uuid.UUID(int=value)
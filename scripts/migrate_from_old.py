@@ -178,16 +178,36 @@ async def upsert_strategy_state(
     await session.execute(
         text(
             """
-            INSERT INTO strategy_state (account_id, scope, key, value)
-            VALUES (:account_id, :scope, :key, :value)
-            ON CONFLICT (account_id, scope, key)
-            DO UPDATE SET value = EXCLUDED.value
+            INSERT INTO strategy_state (account_id, scope, state)
+            VALUES (:account_id, :scope, jsonb_build_object(CAST(:key AS text), CAST(:value AS text)))
+            ON CONFLICT (account_id, scope)
+            DO UPDATE SET state = strategy_state.state || EXCLUDED.state
             """
         ),
-        {"account_id": account_id, "scope": scope, "key": key, "value": value},
+        {"account_id": account_id, "scope": scope, "key": key, "value": str(value)},
     )
 
 
+async def set_account_reserves(
+    session: AsyncSession,
+    account_id: uuid.UUID,
+    settings: dict[str, str],
+) -> dict[str, float]:
+    """Write legacy reserve settings into the trading_accounts reserve columns."""
+    values = {
+        column: _float(settings[legacy_key])
+        for legacy_key, column in RESERVE_COLUMN_MAP
+        if settings.get(legacy_key) is not None
+    }
+    if values:
+        assignments = ", ".join(f"{column} = :{column}" for column in values)
+        await session.execute(
+            text(f"UPDATE trading_accounts SET {assignments} WHERE id = :account_id"),
+            {**values, "account_id": account_id},
+        )
+    return values
+
+
 async def upsert_strategy_config(
     session: AsyncSession,
     account_id: uuid.UUID,
@@ -303,44 +323,33 @@ async def insert_order(
     )
 
 
-async def insert_fill(
-    session: AsyncSession,
-    account_id: uuid.UUID,
-    fill: dict,
-):
+FILL_COLUMNS = (
+    "trade_id", "account_id", "order_id", "symbol", "side",
+    "price", "qty", "quote_qty", "commission", "commission_asset",
+    "trade_time_ms", "raw_json",
+)
+
+
+def fill_record(account_id: uuid.UUID, fill: dict) -> tuple:
+    """Legacy fill row → COPY record in FILL_COLUMNS order."""
     raw = dict(fill)
     for k, v in raw.items():
         if isinstance(v, datetime):
             raw[k] = v.isoformat()
 
-    await session.execute(
-        text(
-            """
-            INSERT INTO fills
-              (trade_id, account_id, order_id, symbol, side,
-               price, qty, quote_qty, commission, commission_asset,
-               trade_time_ms, raw_json)
-            VALUES
-              (:trade_id, :account_id, :order_id, :symbol, :side,
-               :price, :qty, :quote_qty, :commission, :commission_asset,
-               :trade_time_ms, :raw_json::jsonb)
-            ON CONFLICT (trade_id, account_id) DO NOTHING
-            """
-        ),
-        {
-            "trade_id": int(fill["trade_id"]),
-            "account_id": account_id,
-            "order_id": _int(fill.get("order_id")),
-            "symbol": _str(fill.get("symbol")),
-            "side": fill.get("side"),
-            "price": _float(fill.get("price")) if fill.get("price") else None,
-            "qty": _float(fill.get("qty")) if fill.get("qty") else None,
-            "quote_qty": _float(fill.get("quote_qty")) if fill.get("quote_qty") else None,
-            "commission": _float(fill.get("commission")) if fill.get("commission") else None,
-            "commission_asset": fill.get("commission_asset"),
-            "trade_time_ms": _int(fill.get("trade_time_ms")),
-            "raw_json": json.dumps(raw),
-        },
+    return (
+        int(fill["trade_id"]),
+        account_id,
+        _int(fill.get("order_id")),
+        _str(fill.get("symbol")),
+        fill.get("side"),
+        _float(fill.get("price")) if fill.get("price") else None,
+        _float(fill.get("qty")) if fill.get("qty") else None,
+        _float(fill.get("quote_qty")) if fill.get("quote_qty") else None,
+        _float(fill.get("commission")) if fill.get("commission") else None,
+        fill.get("commission_asset"),
+        _int(fill.get("trade_time_ms")),
+        json.dumps(raw),
     )
 
 
@@ -400,46 +409,24 @@ async def insert_core_history(
     )
 
 
-async def insert_price_snapshot(
-    session: AsyncSession,
-    row: dict,
-):
-    await session.execute(
-        text(
-            """
-            INSERT INTO price_snapshots (symbol, ts_ms, price)
-            VALUES (:symbol, :ts_ms, :price)
-            ON CONFLICT (symbol, ts_ms) DO NOTHING
-            """
-        ),
-        {
-            "symbol": _str(row.get("symbol")),
-            "ts_ms": int(row["ts_ms"]),
-            "price": _float(row.get("price")),
-        },
-    )
+SNAPSHOT_COLUMNS = ("symbol", "ts_ms", "price")
 
 
-async def insert_price_candle(
-    session: AsyncSession,
-    row: dict,
-):
-    await session.execute(
-        text(
-            """
-            INSERT INTO price_candles_5m (symbol, ts_ms, open, high, low, close)
-            VALUES (:symbol, :ts_ms, :open, :high, :low, :close)
-            ON CONFLICT (symbol, ts_ms) DO NOTHING
-            """
-        ),
-        {
-            "symbol": _str(row.get("symbol")),
-            "ts_ms": int(row["ts_ms"]),
-            "open": _float(row.get("open")),
-            "high": _float(row.get("high")),
-            "low": _float(row.get("low")),
-            "close": _float(row.get("close")),
-        },
+def price_snapshot_record(row: dict) -> tuple:
+    return (_str(row.get("symbol")), int(row["ts_ms"]), _float(row.get("price")))
+
+
+CANDLE_COLUMNS = ("symbol", "ts_ms", "open", "high", "low", "close")
+
+
+def price_candle_record(row: dict) -> tuple:
+    return (
+        _str(row.get("symbol")),
+        int(row["ts_ms"]),
+        _float(row.get("open")),
+        _float(row.get("high")),
+        _float(row.get("low")),
+        _float(row.get("close")),
     )
 
 
@@ -468,9 +455,13 @@ SETTINGS_MAP: list[tuple[str, str, str]] = [
     ("trend_pending_trend_bucket_usdt",   "trend_buy",    "pending_trend_bucket_usdt"),
     ("trend_pending_trigger_price",       "trend_buy",    "pending_trigger_price"),
     ("trend_core_bucket_usdt",            "trend_buy",    "core_bucket_usdt"),
-    # shared scope
-    ("reserve_btc_qty",                   "shared",       "reserve_qty"),
-    ("reserve_cost_usdt",                 "shared",       "reserve_cost_usdt"),
+]
+
+# Reserve pool: legacy btc_settings key -> trading_accounts column.
+# Since migration 037 AccountStateManager reads these columns, not strategy_state.
+RESERVE_COLUMN_MAP: list[tuple[str, str]] = [
+    ("reserve_btc_qty",   "reserve_qty"),
+    ("reserve_cost_usdt", "reserve_cost_usdt"),
 ]
 
 # tune.lot_* -> strategy_configs[lot_stacking].params.*
@@ -599,6 +590,10 @@ async def migrate(
             if val is not None:
                 await upsert_strategy_state(session, account_id, scope, new_key, val)
 
+        reserves = await set_account_reserves(session, account_id, settings)
+        if reserves:
+            logger.info("Migrating reserve pool → trading_accounts: %s", reserves)
+
         # ------------------------------------------------------------------
         # Strategy configs (tune params)
         # ------------------------------------------------------------------
@@ -631,9 +626,15 @@ async def migrate(
         # ------------------------------------------------------------------
         # Fills
         # ------------------------------------------------------------------
+        # fills/snapshots/candles는 대량이므로 행 단위 INSERT 대신 COPY + ON CONFLICT로 적재
+        from app.db.bulk import copy_insert_ignore
+
         logger.info("Migrating %d fills …", len(fills))
-        for fill in fills:
-            await insert_fill(session, account_id, fill)
+        await copy_insert_ignore(
+            session, "fills", FILL_COLUMNS,
+            (fill_record(account_id, f) for f in fills),
+            conflict_columns=("trade_id", "account_id"),
+        )
 
         # ------------------------------------------------------------------
         # Position
@@ -653,15 +654,21 @@ async def migrate(
         # Price snapshots
         # ------------------------------------------------------------------
         logger.info("Migrating %d price_snapshots …", len(snapshots))
-        for row in snapshots:
-            await insert_price_snapshot(session, row)
+        await copy_insert_ignore(
+            session, "price_snapshots", SNAPSHOT_COLUMNS,
+            (price_snapshot_record(r) for r in snapshots),
+            conflict_columns=("symbol", "ts_ms"),
+        )
 
         # ------------------------------------------------------------------
         # Price candles
         # ------------------------------------------------------------------
         logger.info("Migrating %d price_candles_5m …", len(candles))
-        for row in candles:
-            await insert_price_candle(session, row)
+        await copy_insert_ignore(
+            session, "price_candles_5m", CANDLE_COLUMNS,
+            (price_candle_record(r) for r in candles),
+            conflict_columns=("symbol", "ts_ms"),
+        )
 
         await session.commit()
 
@@ -40,7 +40,12 @@ def _is_db_available() -> bool:
 
 def _make_engine():
     """Create a disposable async engine with NullPool (no cross-loop issues)."""
-    return create_async_engine(TEST_DATABASE_URL, echo=False, poolclass=NullPool)
+    from app.db.session import register_float_numeric_codec
+
+    engine = create_async_engine(TEST_DATABASE_URL, echo=False, poolclass=NullPool)
+    # 운영 엔진과 동일하게 NUMERIC → float 디코딩
+    event.listen(engine.sync_engine, "connect", register_float_numeric_codec)
+    return engine
 
 
 @pytest_asyncio.fixture(scope="session", loop_scope="session")
@@ -99,6 +104,24 @@ async def db_session(_init_test_db):
     await engine.dispose()
 
 
+@pytest.fixture
+def query_counter(db_session):
+    """
+    Collect every SQL statement emitted on db_session's connection.
+
+    Use to assert N+1 absence: the statement count must not grow with row count.
+    """
+    statements: list[str] = []
+    sync_engine = db_session.bind.sync_engine
+
+    def _record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(sync_engine, "before_cursor_execute", _record)
+    yield statements
+    event.remove(sync_engine, "before_cursor_execute", _record)
+
+
 @pytest_asyncio.fixture
 async def db_session_factory(_init_test_db):
     """
@@ -0,0 +1,22 @@
+"""test_db 공용 fixture."""
+
+from __future__ import annotations
+
+import uuid
+
+import pytest_asyncio
+
+from app.models.account import TradingAccount
+from app.models.user import UserProfile
+
+
+@pytest_asyncio.fixture
+async def seeded_account(db_session) -> TradingAccount:
+    """소유자 + 거래 계정 1개를 flush해 둔다 (db_session SAVEPOINT 롤백으로 정리)."""
+    owner = UserProfile(id=uuid.uuid4(), email=f"owner-{uuid.uuid4().hex[:8]}@example.com")
+    db_session.add(owner)
+    await db_session.flush()
+    account = TradingAccount(owner_id=owner.id, name="seeded", api_key_encrypted="k", api_secret_encrypted="s")
+    db_session.add(account)
+    await db_session.flush()
+    return account
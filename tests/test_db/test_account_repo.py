@@ -0,0 +1,104 @@
+"""Integration tests for AccountRepository loader strategies."""
+
+from __future__ import annotations
+
+import uuid
+
+import pytest
+from sqlalchemy.exc import InvalidRequestError
+
+from app.db.account_repo import AccountRepository
+from app.models.account import TradingAccount
+from app.models.trading_combo import TradingCombo
+
+
+async def _seed_accounts(db_session, seeded_account: TradingAccount, count: int) -> uuid.UUID:
+    """seeded_account와 같은 소유자로 count개 계정을 맞추고 계정마다 combo 1개씩 추가."""
+    owner_id = seeded_account.owner_id
+    accounts = [seeded_account]
+    for i in range(1, count):
+        account = TradingAccount(owner_id=owner_id, name=f"acc-{i}", api_key_encrypted="k", api_secret_encrypted="s")
+        db_session.add(account)
+        accounts.append(account)
+    await db_session.flush()
+    for i, account in enumerate(accounts):
+        db_session.add(
+            TradingCombo(
+                account_id=account.id,
+                name=f"combo-{i}",
+                symbols=["BTCUSDT"],
+                buy_logic_name="lot_stacking",
+                sell_logic_name="fixed_tp",
+            )
+        )
+    await db_session.flush()
+    db_session.expunge_all()
+    return owner_id
+
+
+@pytest.mark.integration
+@pytest.mark.asyncio
+async def test_lazy_child_collection_raises(db_session, seeded_account):
+    """Unloaded child collections must raise instead of issuing a hidden query."""
+    owner_id = await _seed_accounts(db_session, seeded_account, 1)
+    account = (await AccountRepository(db_session).get_all_accounts())[0]
+    assert account.owner_id == owner_id
+
+    with pytest.raises(InvalidRequestError):
+        _ = account.lots
+
+
+@pytest.mark.integration
+@pytest.mark.asyncio
+async def test_get_by_owner_query_count_constant(db_session, seeded_account, query_counter):
+    """get_by_owner must load combos in one extra SELECT regardless of account count."""
+    owner_id = await _seed_accounts(db_session, seeded_account, 3)
+    query_counter.clear()
+
+    accounts = await AccountRepository(db_session).get_by_owner(owner_id)
+
+    assert len(accounts) == 3
+    assert all(len(a.trading_combos) == 1 for a in accounts)
+    assert len(query_counter) == 2  # accounts + selectinload(trading_combos)
+
+
+@pytest.mark.integration
+@pytest.mark.asyncio
+async def test_get_all_accounts_with_owner_joins_owner_email(db_session, seeded_account, query_counter):
+    """Owner email comes from the accounts query itself (JOIN), only combos need a second SELECT."""
+    owner_id = await _seed_accounts(db_session, seeded_account, 3)
+    query_counter.clear()
+
+    accounts = [a for a in await AccountRepository(db_session).get_all_accounts_with_owner() if a.owner_id == owner_id]
+
+    assert len(accounts) == 3
+    assert all(a.owner.email.startswith("owner-") for a in accounts)
+    assert len(query_counter) == 2  # accounts JOIN owner + selectinload(trading_combos)
+
+
+@pytest.mark.integration
+@pytest.mark.asyncio
+async def test_get_with_enabled_combos_single_query(db_session, seeded_account, query_counter):
+    """Account and its enabled combos come back from one JOIN query; disabled combos are filtered out."""
+    owner_id = await _seed_accounts(db_session, seeded_account, 1)
+    repo = AccountRepository(db_session)
+    account_id = (await repo.get_by_owner(owner_id))[0].id
+    db_session.add(
+        TradingCombo(
+            account_id=account_id,
+            name="disabled",
+            symbols=["ETHUSDT"],
+            buy_logic_name="lot_stacking",
+            sell_logic_name="fixed_tp",
+            is_enabled=False,
+        )
+    )
+    await db_session.flush()
+    db_session.expunge_all()
+    query_counter.clear()
+
+    account = await repo.get_with_enabled_combos(account_id)
+
+    assert [c.name for c in account.trading_combos] == ["combo-0"]
+    assert len(query_counter) == 1
+    assert await repo.get_with_enabled_combos(uuid.uuid4()) is None
@@ -0,0 +1,22 @@
+"""Integration tests for AccountStateManager reserve columns."""
+
+from __future__ import annotations
+
+import pytest
+
+from app.services.account_state_manager import AccountStateManager
+
+
+@pytest.mark.integration
+@pytest.mark.asyncio
+async def test_reserve_add_returns_updated_value(db_session, seeded_account):
+    state = AccountStateManager(seeded_account.id, db_session)
+    assert await state.get_reserve_qty() == 0.0
+
+    await state.set_reserve_qty(1.5)
+    await state.set_reserve_cost_usdt(3000.0)
+
+    assert await state.add_reserve_qty(0.25) == 1.75
+    assert await state.add_reserve_cost_usdt(-500.0) == 2500.0
+    assert await state.get_reserve_qty() == 1.75
+    assert await state.get_reserve_cost_usdt() == 2500.0
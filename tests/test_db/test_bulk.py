@@ -0,0 +1,74 @@
+"""Integration tests for COPY-based bulk ingest helpers."""
+
+from __future__ import annotations
+
+import json
+import uuid
+
+import pytest
+from sqlalchemy import select, text
+from sqlalchemy.orm import undefer
+
+from app.api.backtest import _load_trade_log_and_equity
+from app.db.bulk import copy_insert_ignore, copy_records
+from app.models.backtest_run import BacktestRun
+from app.models.backtest_trade import BacktestEquityPoint, BacktestTrade
+from app.models.fill import Fill
+
+
+async def _seed_run(db_session, user_id: uuid.UUID) -> uuid.UUID:
+    run = BacktestRun(user_id=user_id, symbol="BTCUSDT", initial_usdt=1000.0, start_ts_ms=0, end_ts_ms=1)
+    db_session.add(run)
+    await db_session.flush()
+    return run.id
+
+
+@pytest.mark.integration
+@pytest.mark.asyncio
+async def test_copy_backtest_results_round_trip(db_session, seeded_account):
+    run_id = await _seed_run(db_session, seeded_account.owner_id)
+
+    copied = await copy_records(
+        db_session,
+        BacktestTrade.__tablename__,
+        ("run_id", "idx", "ts_ms", "side", "price", "qty", "quote_qty"),
+        [(run_id, 0, 1000, "BUY", 100.5, 0.1, 10.05), (run_id, 1, 2000, "SELL", 101.0, 0.1, 10.1)],
+    )
+    await copy_records(
+        db_session,
+        BacktestEquityPoint.__tablename__,
+        ("run_id", "ts_ms", "equity_usdt"),
+        [(run_id, 2000, 1000.05), (run_id, 1000, 1000.0)],
+    )
+
+    trade_log, equity_curve = await _load_trade_log_and_equity(db_session, run_id)
+    # COPY 이후에도 float NUMERIC 코덱이 복원되어 있어야 한다
+    raw_price = await db_session.scalar(text("SELECT price FROM backtest_trades WHERE idx = 0"))
+
+    assert copied == 2
+    assert type(raw_price) is float
+    assert [t["side"] for t in trade_log] == ["BUY", "SELL"]
+    assert trade_log[0] == {"ts_ms": 1000, "side": "BUY", "price": 100.5, "qty": 0.1, "quote_qty": 10.05}
+    assert equity_curve == [{"ts_ms": 1000, "value": 1000.0}, {"ts_ms": 2000, "value": 1000.05}]
+
+
+@pytest.mark.integration
+@pytest.mark.asyncio
+async def test_copy_insert_ignore_skips_duplicates(db_session, seeded_account):
+    account = seeded_account
+
+    columns = ("trade_id", "account_id", "symbol", "side", "price", "qty", "trade_time_ms", "raw_json")
+
+    def _rows(ids):
+        return [(i, account.id, "BTCUSDT", "BUY", 100.0, 0.1, 1000 + i, json.dumps({"id": i})) for i in ids]
+
+    first = await copy_insert_ignore(db_session, "fills", columns, _rows([1, 2]), ("trade_id", "account_id"))
+    second = await copy_insert_ignore(db_session, "fills", columns, _rows([2, 3]), ("trade_id", "account_id"))
+
+    assert (first, second) == (2, 1)
+    fills = (
+        await db_session.execute(
+            select(Fill).options(undefer(Fill.raw_json)).where(Fill.account_id == account.id).order_by(Fill.trade_id)
+        )
+    ).scalars()
+    assert [(f.trade_id, f.raw_json) for f in fills] == [(1, {"id": 1}), (2, {"id": 2}), (3, {"id": 3})]
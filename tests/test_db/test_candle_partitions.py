@@ -0,0 +1,86 @@
+"""Integration tests for price_candles_1m daily partition maintenance."""
+
+from __future__ import annotations
+
+import pytest
+from sqlalchemy import text
+
+from app.services.candle_store import (
+    candle_partition_name_1m,
+    delete_old_candles_1m_default,
+    drop_expired_candle_partitions_1m,
+    ensure_candle_partitions_1m,
+    store_closed_candle_1m,
+)
+
+_DAY_MS = 24 * 60 * 60 * 1000
+_NOW_MS = 1_767_225_600_000 + 3_600_000  # 2026-01-01 01:00 UTC
+
+
+@pytest.mark.unit
+def test_partition_name_uses_utc_day():
+    assert candle_partition_name_1m(_NOW_MS) == "price_candles_1m_p20260101"
+    assert candle_partition_name_1m(_NOW_MS + _DAY_MS) == "price_candles_1m_p20260102"
+
+
+@pytest.mark.integration
+@pytest.mark.asyncio
+async def test_ensure_partitions_idempotent_and_routes_rows(db_session):
+    created = await ensure_candle_partitions_1m(_NOW_MS, days_ahead=2, session=db_session)
+    assert created == [
+        "price_candles_1m_p20260101",
+        "price_candles_1m_p20260102",
+        "price_candles_1m_p20260103",
+    ]
+    assert await ensure_candle_partitions_1m(_NOW_MS, days_ahead=2, session=db_session) == []
+
+    await store_closed_candle_1m("BTCUSDT", _NOW_MS, 1.0, 1.0, 1.0, 1.0, session=db_session)
+    partition = await db_session.scalar(
+        text("SELECT tableoid::regclass::text FROM price_candles_1m WHERE ts_ms = :ts"), {"ts": _NOW_MS}
+    )
+    assert partition == "price_candles_1m_p20260101"
+
+
+@pytest.mark.integration
+@pytest.mark.asyncio
+async def test_drop_expired_drops_with_rows_and_keeps_recent(db_session):
+    await ensure_candle_partitions_1m(_NOW_MS, days_ahead=2, session=db_session)
+    await store_closed_candle_1m("BTCUSDT", _NOW_MS, 1.0, 1.0, 1.0, 1.0, session=db_session)
+
+    # 01-01 has a row, 01-02 is empty, both expired; 01-03 ends after the cutoff
+    dropped = await drop_expired_candle_partitions_1m(_NOW_MS + 2 * _DAY_MS, session=db_session)
+
+    assert dropped == ["price_candles_1m_p20260101", "price_candles_1m_p20260102"]
+    assert await db_session.scalar(text("SELECT count(*) FROM price_candles_1m")) == 0
+    assert await db_session.scalar(text("SELECT to_regclass('price_candles_1m_default')")) is not None
+
+
+@pytest.mark.integration
+@pytest.mark.asyncio
+async def test_ensure_skips_day_already_in_default(db_session):
+    # WS 백필이 파티션 생성보다 먼저 도착한 경우: 01-01 행이 DEFAULT 파티션에 있다
+    await store_closed_candle_1m("BTCUSDT", _NOW_MS, 1.0, 1.0, 1.0, 1.0, session=db_session)
+
+    created = await ensure_candle_partitions_1m(_NOW_MS, days_ahead=2, session=db_session)
+
+    assert created == ["price_candles_1m_p20260102", "price_candles_1m_p20260103"]
+    partition = await db_session.scalar(
+        text("SELECT tableoid::regclass::text FROM price_candles_1m WHERE ts_ms = :ts"), {"ts": _NOW_MS}
+    )
+    assert partition == "price_candles_1m_default"
+
+
+@pytest.mark.integration
+@pytest.mark.asyncio
+async def test_delete_old_default_only_touches_default_partition(db_session):
+    await ensure_candle_partitions_1m(_NOW_MS + _DAY_MS, days_ahead=0, session=db_session)
+    # 01-01 행은 DEFAULT, 01-02 행은 일별 파티션
+    await store_closed_candle_1m("BTCUSDT", _NOW_MS, 1.0, 1.0, 1.0, 1.0, session=db_session)
+    await store_closed_candle_1m("BTCUSDT", _NOW_MS + _DAY_MS, 1.0, 1.0, 1.0, 1.0, session=db_session)
+    await store_closed_candle_1m("ETHUSDT", _NOW_MS, 1.0, 1.0, 1.0, 1.0, session=db_session)
+
+    deleted = await delete_old_candles_1m_default("BTCUSDT", _NOW_MS + 2 * _DAY_MS, session=db_session)
+
+    assert deleted == 1
+    rows = await db_session.execute(text("SELECT symbol, ts_ms FROM price_candles_1m ORDER BY symbol, ts_ms"))
+    assert rows.all() == [("BTCUSDT", _NOW_MS + _DAY_MS), ("ETHUSDT", _NOW_MS)]
@@ -0,0 +1,101 @@
+"""Integration tests for LotRepository combo references (lots.combo_seq)."""
+
+from __future__ import annotations
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.orm import undefer
+
+from app.db.lot_repo import LotRepository
+from app.models.account import TradingAccount
+from app.models.lot import Lot
+from app.models.trading_combo import TradingCombo
+
+
+def _combo(account_id, name: str) -> TradingCombo:
+    return TradingCombo(
+        account_id=account_id,
+        name=name,
+        symbols=["BTCUSDT"],
+        buy_logic_name="lot_stacking",
+        sell_logic_name="fixed_tp",
+    )
+
+
+@pytest.mark.integration
+@pytest.mark.asyncio
+async def test_insert_lot_resolves_combo_seq(db_session, seeded_account, query_counter):
+    account = seeded_account
+    combos = [_combo(account.id, f"combo-{i}") for i in range(2)]
+    db_session.add_all(combos)
+    await db_session.flush()
+    assert sorted(c.combo_seq for c in combos) == [1, 2]
+
+    repo = LotRepository(db_session)
+    query_counter.clear()
+    lot = await repo.insert_lot(
+        account_id=account.id,
+        symbol="BTCUSDT",
+        strategy_name="lot_stacking",
+        buy_order_id=None,
+        buy_price=100.0,
+        buy_qty=0.1,
+        buy_time_ms=0,
+        combo_id=combos[1].id,
+    )
+
+    # combo_seq는 INSERT 안의 서브쿼리로 해석되고 RETURNING으로 채워진다 (별도 SELECT 없음)
+    assert lot.combo_seq == combos[1].combo_seq
+    assert len(query_counter) == 1
+    assert [x.lot_id for x in await repo.get_open_lots_by_combo(account.id, "BTCUSDT", combos[1].id)] == [lot.lot_id]
+    assert await repo.get_open_lots_by_combo(account.id, "BTCUSDT", combos[0].id) == []
+    combo_id = await db_session.scalar(select(Lot.combo_id).where(Lot.lot_id == lot.lot_id))
+    assert combo_id == combos[1].id
+    db_session.expunge_all()
+    reloaded = await db_session.scalar(select(Lot).options(undefer(Lot.combo_id)).where(Lot.lot_id == lot.lot_id))
+    assert reloaded.combo_id == combos[1].id
+
+
+@pytest.mark.integration
+@pytest.mark.asyncio
+async def test_lot_counters_track_open_and_close(db_session, seeded_account):
+    account = seeded_account
+
+    repo = LotRepository(db_session)
+    kwargs = dict(account_id=account.id, symbol="BTCUSDT", strategy_name="lot_stacking", buy_price=100.0, buy_qty=0.1)
+    lot = await repo.insert_lot(buy_order_id=1, buy_time_ms=0, **kwargs)
+    await repo.insert_lot(buy_order_id=1, buy_time_ms=0, **kwargs)  # duplicate → existing lot, not counted
+    await repo.insert_lot(buy_order_id=2, buy_time_ms=1, **kwargs)
+    await repo.close_lot(
+        account_id=account.id, lot_id=lot.lot_id, sell_price=110.0, sell_time_ms=2, fee_usdt=0.0, net_profit_usdt=1.0
+    )
+
+    # 이미 CLOSED인 로트를 다시 닫아도 카운트/매도 정보가 바뀌지 않는다
+    await repo.close_lot(
+        account_id=account.id, lot_id=lot.lot_id, sell_price=120.0, sell_time_ms=3, fee_usdt=0.0, net_profit_usdt=2.0
+    )
+
+    assert (repo.lots_opened, repo.lots_closed) == (2, 1)
+    assert await db_session.scalar(select(Lot.sell_price).where(Lot.lot_id == lot.lot_id)) == 110.0
+
+
+@pytest.mark.integration
+@pytest.mark.asyncio
+async def test_combo_seq_is_scoped_to_account(db_session, seeded_account):
+    account = seeded_account
+    other = TradingAccount(owner_id=account.owner_id, name="other", api_key_encrypted="k", api_secret_encrypted="s")
+    db_session.add(other)
+    await db_session.flush()
+    own_combo, other_combo = _combo(account.id, "own"), _combo(other.id, "other")
+    db_session.add_all([own_combo, other_combo])
+    await db_session.flush()
+    # 두 계정 모두 combo_seq 1 — seq만으로는 계정을 구분할 수 없다
+    assert own_combo.combo_seq == other_combo.combo_seq == 1
+
+    repo = LotRepository(db_session)
+    kwargs = dict(account_id=account.id, symbol="BTCUSDT", strategy_name="lot_stacking", buy_price=100.0, buy_qty=0.1)
+    await repo.insert_lot(buy_order_id=1, buy_time_ms=0, combo_id=own_combo.id, **kwargs)
+    foreign = await repo.insert_lot(buy_order_id=2, buy_time_ms=1, combo_id=other_combo.id, **kwargs)
+
+    assert foreign.combo_seq is None
+    assert await repo.get_open_lots_by_combo(account.id, "BTCUSDT", other_combo.id) == []
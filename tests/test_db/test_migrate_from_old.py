@@ -0,0 +1,38 @@
+"""Integration tests for the legacy import script (scripts/migrate_from_old.py)."""
+
+from __future__ import annotations
+
+import pytest
+from sqlalchemy import select
+
+from app.models.account import TradingAccount
+from app.services.account_state_manager import AccountStateManager
+from scripts.migrate_from_old import SETTINGS_MAP, set_account_reserves
+
+
+@pytest.mark.unit
+def test_reserves_not_mapped_to_strategy_state():
+    assert not [row for row in SETTINGS_MAP if row[1] == "shared"]
+
+
+@pytest.mark.integration
+@pytest.mark.asyncio
+async def test_legacy_reserves_land_in_account_columns(db_session, seeded_account):
+    settings = {"reserve_btc_qty": "0.125", "reserve_cost_usdt": "7500.5", "core_bucket_usdt": "10"}
+
+    written = await set_account_reserves(db_session, seeded_account.id, settings)
+
+    assert written == {"reserve_qty": 0.125, "reserve_cost_usdt": 7500.5}
+    state = AccountStateManager(seeded_account.id, db_session)
+    assert await state.get_reserve_qty() == 0.125
+    assert await state.get_reserve_cost_usdt() == 7500.5
+
+
+@pytest.mark.integration
+@pytest.mark.asyncio
+async def test_missing_legacy_reserves_leave_columns_untouched(db_session, seeded_account):
+    assert await set_account_reserves(db_session, seeded_account.id, {}) == {}
+    reserve_qty = await db_session.scalar(
+        select(TradingAccount.reserve_qty).where(TradingAccount.id == seeded_account.id)
+    )
+    assert reserve_qty == 0
@@ -0,0 +1,68 @@
+"""Integration tests for OrderRepository batch writes."""
+
+from __future__ import annotations
+
+import pytest
+from sqlalchemy import select
+
+from app.db.order_repo import OrderRepository
+from app.models.order import Order
+
+
+def _order(order_id: int, status: str, update_time: int) -> dict:
+    return {
+        "orderId": order_id,
+        "symbol": "BTCUSDT",
+        "side": "BUY",
+        "type": "LIMIT",
+        "status": status,
+        "price": "100.0",
+        "origQty": "0.1",
+        "executedQty": "0.1" if status == "FILLED" else "0",
+        "updateTime": update_time,
+    }
+
+
+@pytest.mark.integration
+@pytest.mark.asyncio
+async def test_upsert_orders_batch_keeps_latest_duplicate(db_session, seeded_account):
+    account = seeded_account
+
+    repo = OrderRepository(db_session)
+    await repo.upsert_orders_batch(
+        account.id,
+        [_order(1, "FILLED", 2000), _order(1, "NEW", 1000), _order(2, "NEW", 1000)],
+    )
+
+    rows = (
+        await db_session.execute(
+            select(Order.order_id, Order.status).where(Order.account_id == account.id).order_by(Order.order_id)
+        )
+    ).all()
+    assert [tuple(r) for r in rows] == [(1, "FILLED"), (2, "NEW")]
+
+
+@pytest.mark.integration
+@pytest.mark.asyncio
+async def test_get_final_order_ids(db_session, seeded_account):
+    account = seeded_account
+
+    repo = OrderRepository(db_session)
+    await repo.upsert_orders_batch(account.id, [_order(1, "FILLED", 1), _order(2, "NEW", 1), _order(3, "CANCELED", 1)])
+
+    assert await repo.get_final_order_ids(account.id, [1, 2, 3, 4]) == {1, 3}
+    assert await repo.get_final_order_ids(account.id, []) == set()
+
+
+@pytest.mark.integration
+@pytest.mark.asyncio
+async def test_insert_fills_batch_returns_inserted_count(db_session, seeded_account):
+    account = seeded_account
+    repo = OrderRepository(db_session)
+
+    def _trade(trade_id: int) -> tuple[int, dict]:
+        return 1, {"id": trade_id, "symbol": "BTCUSDT", "isBuyer": True, "price": "100", "qty": "0.1", "time": 1}
+
+    assert await repo.insert_fills_batch(account.id, [_trade(1), _trade(2)]) == 2
+    assert await repo.insert_fills_batch(account.id, [_trade(2), _trade(3)]) == 1
+    assert await repo.insert_fills_batch(account.id, []) == 0
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 import uuid
 from unittest.mock import AsyncMock, MagicMock
 
@@ -56,6 +57,7 @@ def _make_sync_deps(last_trade_ids: dict[str, int] | None = None):
     order_repo.upsert_orders_batch = AsyncMock()
     order_repo.insert_fill = AsyncMock()
     order_repo.insert_fills_batch = AsyncMock()
+    order_repo.get_final_order_ids = AsyncMock(return_value=set())
 
     position_repo = MagicMock()
     position_repo.recompute_from_fills = AsyncMock()
@@ -148,6 +150,26 @@ async def test_sync_error_isolation(trader, caplog):
     assert batch_call.args[0] == trader.account_id
 
 
+@pytest.mark.asyncio
+async def test_sync_fills_skips_refetch_of_final_orders(trader):
+    """Trades for orders already stored as FILLED must not trigger a get_order call."""
+    account, order_repo, position_repo, session = _make_sync_deps()
+    order_repo.get_final_order_ids = AsyncMock(return_value={7})
+
+    trader._client = AsyncMock()
+    trader._client.get_open_orders = AsyncMock(return_value=[])
+    trader._client.get_my_trades = AsyncMock(
+        return_value=[{"id": 1, "orderId": 7, "symbol": "BTCUSDT"}, {"id": 2, "orderId": 8, "symbol": "BTCUSDT"}]
+    )
+    trader._client.get_order = AsyncMock(return_value={"orderId": 8, "symbol": "BTCUSDT", "status": "FILLED"})
+    trader._rate_limiter.acquire = AsyncMock()
+
+    await trader._sync_orders_and_fills(account, {"BTCUSDT"}, order_repo, position_repo, session)
+
+    order_repo.get_final_order_ids.assert_awaited_once_with(trader.account_id, [7, 8])
+    assert [c.args[0] for c in trader._client.get_order.call_args_list] == [8]
+
+
 # ---------------------------------------------------------------------------
 # CRIT-7: incremental trade sync tests
 # ---------------------------------------------------------------------------
@@ -309,10 +331,11 @@ def test_health_status(trader):
 
 
 def test_stop(trader):
-    """stop() must set _running to False."""
+    """stop() must set _running to False and wake any in-flight sleep."""
     assert trader._running is True
     trader.stop()
     assert trader._running is False
+    assert trader._wake_event.is_set()
 
 
 @pytest.mark.asyncio
@@ -326,9 +349,51 @@ async def test_stop_async_clears_client(trader):
     await trader.stop_async()
 
     assert trader._running is False
+    assert trader._wake_event.is_set()
     mock_client.close.assert_awaited_once()
 
 
+@pytest.mark.asyncio
+async def test_interruptible_sleep_times_out_and_wakes(trader):
+    """_interruptible_sleep returns after the timeout, or early on wake()."""
+    await asyncio.wait_for(trader._interruptible_sleep(0.01), timeout=1)
+
+    asyncio.get_running_loop().call_later(0.01, trader.wake)
+    await asyncio.wait_for(trader._interruptible_sleep(60), timeout=1)
+
+
+@pytest.mark.asyncio
+async def test_interruptible_sleep_returns_immediately_after_stop(trader):
+    """stop() during step() sets the event before the sleep starts — the sleep must not swallow it."""
+    trader.stop()
+    await asyncio.wait_for(trader._interruptible_sleep(60), timeout=1)
+
+
+def test_order_prefix_distinct_for_back_to_back_uuid7_combos():
+    """UUIDv7 앞자리는 타임스탬프 — 연달아 만든 combo도 clientOrderId prefix가 달라야 한다."""
+    from app.utils.uuid7 import uuid7
+
+    account_id = uuid7()
+    combo_a, combo_b = uuid7(), uuid7()
+    assert str(combo_a)[:8] == str(combo_b)[:8]  # 기존 형식이면 충돌하던 조건
+
+    t = AccountTrader(account_id=account_id, price_collector=MagicMock(), rate_limiter=MagicMock(), encryption=None)
+    prefix_a, prefix_b = t._order_prefix(combo_a), t._order_prefix(combo_b)
+
+    assert prefix_a != prefix_b
+    assert AccountTrader._ORPHAN_TP_RE.match(f"{prefix_a}_TP_42").group(1) == "42"
+    assert len(f"{prefix_a}_TP_{2**31}") <= 36  # Binance newClientOrderId 길이 제한
+
+
+def test_order_prefix_cached_per_combo(trader):
+    combo_id = uuid.uuid4()
+    prefix = trader._order_prefix(combo_id)
+
+    assert trader._order_prefix(combo_id) is prefix
+    assert prefix == f"CMT_{trader.account_id.hex[-8:]}_{combo_id.hex[-8:]}_"
+    assert trader._order_prefixes == {combo_id: prefix}
+
+
 # ---------------------------------------------------------------------------
 # _do_step tests
 # ---------------------------------------------------------------------------
@@ -398,36 +463,16 @@ def _build_step_mocks(trader, account, combos, *, open_lots_before=0, open_lots_
     nested_ctx.__aexit__ = AsyncMock(return_value=False)
     session.begin_nested = MagicMock(return_value=nested_ctx)
 
-    # session.execute call sequence:
-    #   call 0 → combo query result
-    #   call 1 → open_lots count
-    #   further calls → MAX(trade_id) result (empty)
-    combo_scalars = MagicMock()
-    combo_scalars.all.return_value = combos
-    combo_result = MagicMock()
-    combo_result.scalars.return_value = combo_scalars
-
-    count_result = MagicMock()
-    count_result.scalar_one.return_value = open_lots_after
-
-    # Fallback for MAX(trade_id) query and orphan-reconcile lot/order queries
+    # session.execute: MAX(trade_id) query and orphan-reconcile lot/order queries (all empty)
     generic_result = MagicMock()
     generic_result.all.return_value = []
     generic_result.scalar_one.return_value = 0
-
-    def _route_execute(stmt, *args, **kwargs):
-        stmt_str = str(stmt)
-        if "trading_combos" in stmt_str:
-            return combo_result
-        if "count(" in stmt_str.lower() and "lots" in stmt_str.lower():
-            return count_result
-        return generic_result
-
-    session.execute = AsyncMock(side_effect=lambda stmt, *a, **kw: _route_execute(stmt, *a, **kw))
+    session.execute = AsyncMock(return_value=generic_result)
 
     # --- Repositories ---
     account_repo = MagicMock()
-    account_repo.get_by_id = AsyncMock(return_value=account)
+    account.trading_combos = combos
+    account_repo.get_with_enabled_combos = AsyncMock(return_value=account)
     account_repo.update_last_success = AsyncMock()
     account_repo.reset_auto_recovery_on_success = AsyncMock()
 
@@ -440,8 +485,11 @@ def _build_step_mocks(trader, account, combos, *, open_lots_before=0, open_lots_
     position_repo.recompute_from_fills = AsyncMock()
 
     lot_repo = MagicMock()
-    open_lots = [MagicMock(combo_id=c.id, symbol=c.symbols[0]) for c in combos for _ in range(open_lots_before)]
+    open_lots = [MagicMock(combo_seq=c.combo_seq, symbol=c.symbols[0]) for c in combos for _ in range(open_lots_before)]
     lot_repo.get_all_open_lots_for_account = AsyncMock(return_value=open_lots)
+    # Lot open/close counters the strategies would have bumped during the cycle
+    lot_repo.lots_opened = max(open_lots_after - open_lots_before, 0)
+    lot_repo.lots_closed = max(open_lots_before - open_lots_after, 0)
 
     # Orphan-reconcile query (select Lot.lot_id): return no orphans
     orphan_result = MagicMock()
@@ -453,6 +501,8 @@ def _build_step_mocks(trader, account, combos, *, open_lots_before=0, open_lots_
 
     combo_state = MagicMock()
     combo_state.preload = AsyncMock()
+    state_store_cls = MagicMock(return_value=combo_state)
+    state_store_cls.preload_many = AsyncMock(side_effect=lambda _acc, scopes, _s: dict.fromkeys(scopes, combo_state))
 
     # --- Strategy logic instances ---
     buy_logic = MagicMock()
@@ -485,7 +535,7 @@ def _build_step_mocks(trader, account, combos, *, open_lots_before=0, open_lots_
         patch("app.services.account_trader.PositionRepository", return_value=position_repo),
         patch("app.services.account_trader.LotRepository", return_value=lot_repo),
         patch("app.services.account_trader.AccountStateManager", return_value=account_state),
-        patch("app.services.account_trader.StrategyStateStore", return_value=combo_state),
+        patch("app.services.account_trader.StrategyStateStore", state_store_cls),
         patch("app.services.account_trader.BuyLogicRegistry", buy_registry_mock),
         patch("app.services.account_trader.SellLogicRegistry", sell_registry_mock),
     ]
@@ -535,6 +585,41 @@ async def test_do_step_happy_path_single_combo(trader):
     extras["session"].commit.assert_awaited_once()
 
 
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_do_step_sync_failure_cancels_price_prefetch(trader):
+    """If order/fill sync raises, the in-flight price prefetch is cancelled, not left dangling."""
+    import contextlib
+    from unittest.mock import patch
+
+    account = _make_account_mock()
+    combo = _make_combo_mock(trader.account_id)
+    _extras, patches = _build_step_mocks(trader, account, [combo])
+
+    started, cancelled = asyncio.Event(), asyncio.Event()
+
+    async def _slow_price(_symbol):
+        started.set()
+        try:
+            await asyncio.sleep(60)
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+
+    async def _failing_sync(*_a, **_kw):
+        await started.wait()
+        raise RuntimeError("sync failed")
+
+    trader._price_collector.get_price = _slow_price
+    with contextlib.ExitStack() as stack:
+        for p in patches:
+            stack.enter_context(p)
+        stack.enter_context(patch.object(trader, "_sync_orders_and_fills", _failing_sync))
+        with pytest.raises(RuntimeError, match="sync failed"):
+            await trader._do_step()
+        await asyncio.wait_for(cancelled.wait(), timeout=1)
+
+
 @pytest.mark.unit
 @pytest.mark.asyncio
 async def test_do_step_inactive_account_returns_early(trader):
@@ -837,7 +922,7 @@ async def test_do_step_transient_error_does_not_trip_breaker(trader):
             stack.enter_context(p)
         stack.enter_context(patch.object(trader, "step", side_effect=_failing_then_succeeding))
         stack.enter_context(patch.object(trader, "_init_client", AsyncMock()))
-        stack.enter_context(patch("app.services.account_trader.asyncio.sleep", side_effect=_fake_sleep))
+        stack.enter_context(patch.object(trader, "_interruptible_sleep", side_effect=_fake_sleep))
         await trader.run_forever()
 
     assert trader._consecutive_failures == 0
@@ -149,3 +149,20 @@ async def test_send_returns_true_on_200():
     result = await svc.send("test message", AlertSeverity.HIGH)
     assert result is True
     assert svc._consecutive_failures == 0
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_send_in_background_does_not_block_and_flushes_on_close():
+    """send_in_background() returns immediately; close() waits for the queued send."""
+    settings = _make_settings()
+    svc = AlertService(settings)
+    svc._client = _mock_client(status_code=200)
+
+    svc.send_in_background("cb tripped", AlertSeverity.CRITICAL)
+    assert svc._client.post.await_count == 0
+
+    await svc.close()
+
+    assert svc._client.post.await_count == 1
+    assert not svc._pending
@@ -88,6 +88,21 @@ class TestAuthService:
             await auth.authenticate("nonexistent@example.com", "anypassword")
             mock_check.assert_called_once()
 
+    async def test_inactive_user_runs_single_dummy_compare(self, auth, test_user):
+        await auth.set_user_active(test_user["id"], False)
+        with patch("app.services.auth_service.bcrypt.checkpw", return_value=True) as mock_check:
+            result = await auth.authenticate("test@example.com", "Password12345")
+        assert result is None
+        mock_check.assert_called_once()
+
+    async def test_locked_user_runs_single_dummy_compare(self, auth, test_user):
+        for _ in range(MAX_FAILED_ATTEMPTS):
+            await auth.authenticate("test@example.com", "wrongpassword")
+        with patch("app.services.auth_service.bcrypt.checkpw", return_value=True) as mock_check:
+            result = await auth.authenticate("test@example.com", "Password12345")
+        assert result is None
+        mock_check.assert_called_once()
+
     async def test_get_user_by_id_returns_password_changed_at(self, auth, test_user):
         result = await auth.get_user_by_id(test_user["id"])
         assert result is not None
@@ -144,3 +159,36 @@ class TestValidatePassword:
         from app.services.auth_service import AuthService
 
         AuthService._validate_password("ValidPass123")  # should not raise
+
+
+@pytest.mark.unit
+def test_hash_password_uses_configured_rounds():
+    from app.services.auth_service import AuthService
+
+    with patch("app.services.auth_service._BCRYPT_ROUNDS", 4):
+        hashed = AuthService._hash_password("ValidPass123")
+    assert hashed.startswith("$2b$04$")
+
+
+@pytest.mark.unit
+class TestLoginThrottle:
+    async def test_exhausted_bucket_rejects_before_db(self):
+        from app.services.auth_service import LOGIN_BUCKET_CAPACITY, LoginThrottledError
+
+        auth = AuthService(session_factory=None)  # DB에 닿으면 실패해야 함
+        for _ in range(LOGIN_BUCKET_CAPACITY):
+            assert auth._take_login_token("a@example.com")
+        with pytest.raises(LoginThrottledError):
+            await auth.authenticate("A@example.com", "whatever")
+        assert auth._take_login_token("b@example.com")  # 다른 이메일은 별도 버킷
+
+    def test_bucket_refills_over_time(self):
+        from app.services.auth_service import LOGIN_BUCKET_CAPACITY, LOGIN_BUCKET_RATE
+
+        auth = AuthService(session_factory=None)
+        with patch("app.services.auth_service.time.monotonic", return_value=1000.0):
+            for _ in range(LOGIN_BUCKET_CAPACITY):
+                auth._take_login_token("a@example.com")
+            assert not auth._take_login_token("a@example.com")
+        with patch("app.services.auth_service.time.monotonic", return_value=1000.0 + 1 / LOGIN_BUCKET_RATE):
+            assert auth._take_login_token("a@example.com")
@@ -23,21 +23,12 @@ def _make_store(session=None, account_id=None, scope="test_scope"):
 
 
 def _mock_session_with_rows(rows: dict[str, str]) -> MagicMock:
-    """Return a mock AsyncSession whose execute() yields key/value row objects."""
+    """Return a mock AsyncSession whose execute() yields the scope's state dict."""
     session = MagicMock()
 
-    # Build mock rows for get_all-style SELECT (key, value)
-    mock_rows = []
-    for k, v in rows.items():
-        row = MagicMock()
-        row.key = k
-        row.value = v
-        mock_rows.append(row)
-
-    # execute() returns a result whose scalar_one_or_none() and __iter__ work
+    # get_all-style SELECT state → scalar_one_or_none() returns the JSONB dict
     result = MagicMock()
-    result.__iter__ = MagicMock(return_value=iter(mock_rows))
-    result.scalar_one_or_none = MagicMock(return_value=None)
+    result.scalar_one_or_none = MagicMock(return_value=dict(rows))
 
     session.execute = AsyncMock(return_value=result)
     return session
@@ -293,3 +284,21 @@ async def test_get_float_and_int(db_session):
     assert await store.get_int("count_i") == 7
     assert await store.get_float("missing", 9.9) == pytest.approx(9.9)
     assert await store.get_int("missing", 42) == 42
+
+
+@pytest.mark.asyncio
+@pytest.mark.integration
+async def test_preload_many_single_query(db_session, query_counter):
+    """preload_many() fills every requested scope's cache from one SELECT; missing scopes start empty."""
+    acct = await _create_test_account(db_session)
+    await StrategyStateStore(account_id=acct.id, scope="c1:BTCUSDT", session=db_session).set("base_price", 100)
+    await StrategyStateStore(account_id=acct.id, scope="c2:BTCUSDT", session=db_session).set("base_price", 200)
+    query_counter.clear()
+
+    stores = await StrategyStateStore.preload_many(acct.id, ["c1:BTCUSDT", "c2:BTCUSDT", "c3:BTCUSDT"], db_session)
+
+    assert len(query_counter) == 1
+    assert await stores["c1:BTCUSDT"].get_float("base_price") == 100.0
+    assert await stores["c2:BTCUSDT"].get_float("base_price") == 200.0
+    assert stores["c3:BTCUSDT"]._cache == {}
+    assert len(query_counter) == 1
@@ -0,0 +1,28 @@
+"""Unit tests for the UUIDv7 generator."""
+
+import time
+import uuid
+
+import pytest
+
+from app.utils.uuid7 import uuid7
+
+
+@pytest.mark.unit
+class TestUuid7:
+    def test_version_and_variant(self):
+        u = uuid7()
+        assert u.version == 7
+        assert u.variant == uuid.RFC_4122
+
+    def test_embeds_current_unix_ms(self):
+        before = time.time_ns() // 1_000_000
+        u = uuid7()
+        after = time.time_ns() // 1_000_000
+        assert before <= u.int >> 80 <= after
+
+    def test_ordered_across_milliseconds(self):
+        first = uuid7()
+        time.sleep(0.002)
+        second = uuid7()
+        assert first < second
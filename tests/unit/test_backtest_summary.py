@@ -0,0 +1,21 @@
+"""Unit tests for backtest summary helpers."""
+
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from app.backtest.isolated_runner import _max_drawdown_pct
+
+pytestmark = pytest.mark.unit
+
+
+def test_max_drawdown_uses_running_peak():
+    values = np.array([100.0, 120.0, 90.0, 130.0, 117.0])
+    assert _max_drawdown_pct(values) == pytest.approx(25.0)
+
+
+def test_max_drawdown_empty_or_flat():
+    assert _max_drawdown_pct(np.array([], dtype=np.float64)) == 0.0
+    assert _max_drawdown_pct(np.array([0.0, 0.0])) == 0.0
+    assert _max_drawdown_pct(np.array([50.0, 50.0, 60.0])) == 0.0
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 from contextlib import asynccontextmanager
 from unittest.mock import AsyncMock, MagicMock, patch
 
@@ -61,6 +62,11 @@ class TestRunOnce:
             patch("app.services.candle_aggregator.TradingSessionLocal", fake_session_local),
             patch("app.services.candle_aggregator.aggregate_candles") as mock_agg,
             patch("app.services.candle_aggregator.delete_old_candles") as mock_del,
+            patch(
+                "app.services.candle_aggregator.drop_expired_candle_partitions_1m",
+                new_callable=AsyncMock,
+                return_value=[],
+            ) as mock_drop,
         ):
             aggregator = CandleAggregator()
             result = await aggregator.run_once()
@@ -68,6 +74,8 @@ class TestRunOnce:
         assert result == {}
         mock_agg.assert_not_called()
         mock_del.assert_not_called()
+        # 1m 테이블이 비어 있어도 만료 파티션 정리는 수행
+        mock_drop.assert_awaited_once()
 
     # ------------------------------------------------------------------
     # 2. Single symbol, 1m→5m tier only (patched _TIERS effectively via
@@ -102,10 +110,19 @@ class TestRunOnce:
                 "app.services.candle_aggregator.delete_old_candles",
                 new_callable=AsyncMock,
             ) as mock_del,
+            patch(
+                "app.services.candle_aggregator.delete_old_candles_1m_default",
+                new_callable=AsyncMock,
+                return_value=3,
+            ) as mock_del_default,
+            patch(
+                "app.services.candle_aggregator.drop_expired_candle_partitions_1m",
+                new_callable=AsyncMock,
+                return_value=[],
+            ) as mock_drop,
         ):
             # Only 1m→5m returns aggregated rows; others return 0
             mock_agg.side_effect = [5, 0, 0]
-            mock_del.return_value = 3
 
             aggregator = CandleAggregator()
             result = await aggregator.run_once()
@@ -123,11 +140,16 @@ class TestRunOnce:
         assert first_call.kwargs["target_interval"] == "5m"
         assert first_call.kwargs["session"] is tier_session
 
-        # delete_old_candles called once (only when aggregated > 0)
-        mock_del.assert_called_once()
-        del_call = mock_del.call_args
+        # 1m은 DEFAULT 파티션 행만 DELETE하고, 일별 파티션은 일 경계 cutoff로 DROP
+        mock_del.assert_not_called()
+        mock_del_default.assert_called_once()
+        del_call = mock_del_default.call_args
         assert del_call.kwargs["symbol"] == "BTCUSDT"
-        assert del_call.kwargs["interval"] == "1m"
+        cutoff_1m = first_call.kwargs["cutoff_ts_ms"]
+        assert del_call.kwargs["before_ts_ms"] == cutoff_1m
+        assert cutoff_1m % (24 * 60 * 60 * 1000) == 0
+        mock_drop.assert_awaited_once()
+        assert mock_drop.call_args.args == (cutoff_1m,)
 
     # ------------------------------------------------------------------
     # 3. 2 symbols × 3 tiers = 6 aggregate_candles calls
@@ -160,6 +182,11 @@ class TestRunOnce:
                 new_callable=AsyncMock,
                 return_value=0,
             ) as mock_del,
+            patch(
+                "app.services.candle_aggregator.drop_expired_candle_partitions_1m",
+                new_callable=AsyncMock,
+                return_value=[],
+            ) as mock_drop,
         ):
             aggregator = CandleAggregator()
             await aggregator.run_once()
@@ -168,6 +195,8 @@ class TestRunOnce:
         assert mock_agg.call_count == 6
         # delete never called since aggregated == 0
         mock_del.assert_not_called()
+        # 모든 심볼의 1m->5m이 성공했으므로 만료 파티션 DROP은 한 번
+        mock_drop.assert_awaited_once()
 
         # Verify each symbol appears in calls
         called_symbols = {c.kwargs["symbol"] for c in mock_agg.call_args_list}
@@ -207,6 +236,11 @@ class TestRunOnce:
                 new_callable=AsyncMock,
                 return_value=0,
             ),
+            patch(
+                "app.services.candle_aggregator.drop_expired_candle_partitions_1m",
+                new_callable=AsyncMock,
+                return_value=[],
+            ) as mock_drop,
         ):
             # First tier raises, second and third succeed with 0
             mock_agg.side_effect = [Exception("DB timeout"), 0, 0]
@@ -217,6 +251,9 @@ class TestRunOnce:
         # All 3 tiers attempted despite first failure
         assert mock_agg.call_count == 3
 
+        # 1m->5m 집계가 실패한 행이 남아 있으므로 만료 파티션은 DROP하지 않음
+        mock_drop.assert_not_called()
+
         # Failed tier does not appear in result; others processed but returned 0
         # so symbol_summary is empty → symbol not in result
         assert result == {}
@@ -251,12 +288,18 @@ class TestRunOnce:
                 "app.services.candle_aggregator.delete_old_candles",
                 new_callable=AsyncMock,
             ) as mock_del,
+            patch(
+                "app.services.candle_aggregator.drop_expired_candle_partitions_1m",
+                new_callable=AsyncMock,
+                return_value=[],
+            ) as mock_drop,
         ):
             aggregator = CandleAggregator()
             result = await aggregator.run_once()
 
         mock_agg.assert_called()
         mock_del.assert_not_called()
+        mock_drop.assert_awaited_once()
         assert result == {}
 
     # ------------------------------------------------------------------
@@ -274,7 +317,8 @@ class TestRunOnce:
 
         # Track each unique session opened for tiers
         tier_sessions = [AsyncMock() for _ in range(len(symbols) * num_tiers)]
-        sessions_iter = iter([query_session] + tier_sessions)
+        drop_session = AsyncMock()
+        sessions_iter = iter([query_session] + tier_sessions + [drop_session])
 
         @asynccontextmanager
         async def fake_session_local():
@@ -292,6 +336,11 @@ class TestRunOnce:
                 new_callable=AsyncMock,
                 return_value=0,
             ),
+            patch(
+                "app.services.candle_aggregator.drop_expired_candle_partitions_1m",
+                new_callable=AsyncMock,
+                return_value=[],
+            ) as mock_drop,
         ):
             aggregator = CandleAggregator()
             await aggregator.run_once()
@@ -302,3 +351,47 @@ class TestRunOnce:
 
         # Query session (symbol lookup) must NOT have had commit() called
         query_session.commit.assert_not_awaited()
+
+        # 파티션 DROP은 별도 세션에서 커밋
+        assert mock_drop.call_args.kwargs["session"] is drop_session
+        drop_session.commit.assert_awaited_once()
+
+    # ------------------------------------------------------------------
+    # 7. Symbols run concurrently, bounded by _MAX_CONCURRENT_SYMBOLS
+    # ------------------------------------------------------------------
+
+    async def test_run_once_bounds_symbol_concurrency(self):
+        symbols = [f"SYM{i}USDT" for i in range(6)]
+
+        query_session = AsyncMock()
+        result_mock = MagicMock()
+        result_mock.all.return_value = [(s,) for s in symbols]
+        query_session.execute = AsyncMock(return_value=result_mock)
+        sessions_iter = iter([query_session] + [AsyncMock() for _ in range(len(symbols) * 3 + 1)])
+
+        @asynccontextmanager
+        async def fake_session_local():
+            yield next(sessions_iter)
+
+        in_flight: set[str] = set()
+        peak = 0
+
+        async def fake_aggregate(*, symbol, **_kwargs):
+            nonlocal peak
+            in_flight.add(symbol)
+            peak = max(peak, len(in_flight))
+            await asyncio.sleep(0)
+            in_flight.discard(symbol)
+            return 0
+
+        with (
+            patch("app.services.candle_aggregator.TradingSessionLocal", fake_session_local),
+            patch("app.services.candle_aggregator.aggregate_candles", side_effect=fake_aggregate) as mock_agg,
+            patch("app.services.candle_aggregator.delete_old_candles", new_callable=AsyncMock),
+            patch("app.services.candle_aggregator.drop_expired_candle_partitions_1m", new_callable=AsyncMock),
+            patch("app.services.candle_aggregator._MAX_CONCURRENT_SYMBOLS", 2),
+        ):
+            await CandleAggregator().run_once()
+
+        assert mock_agg.call_count == len(symbols) * 3
+        assert peak == 2
@@ -0,0 +1,22 @@
+"""ORM registry sanity checks — each model/table is mapped exactly once."""
+
+from collections import Counter
+
+import pytest
+from sqlalchemy.orm import configure_mappers
+
+import app.models  # noqa: F401  (register all models)
+from app.models.base import Base
+
+
+@pytest.mark.unit
+def test_each_model_class_mapped_once():
+    configure_mappers()
+    names = Counter(m.class_.__name__ for m in Base.registry.mappers)
+    assert [n for n, c in names.items() if c > 1] == []
+
+
+@pytest.mark.unit
+def test_each_table_mapped_once():
+    tables = Counter(m.local_table.name for m in Base.registry.mappers)
+    assert [t for t, c in tables.items() if c > 1] == []
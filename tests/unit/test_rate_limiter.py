@@ -0,0 +1,34 @@
+"""Unit tests for GlobalRateLimiter weight accounting."""
+
+from __future__ import annotations
+
+import asyncio
+from unittest.mock import AsyncMock
+
+import pytest
+
+from app.services.rate_limiter import GlobalRateLimiter
+
+pytestmark = pytest.mark.unit
+
+
+@pytest.mark.asyncio
+async def test_acquire_reserves_full_weight_at_once():
+    limiter = GlobalRateLimiter(max_rate=10, time_period=60.0)
+
+    await limiter.acquire(weight=7)
+
+    assert limiter._limiter.has_capacity(3)
+    assert not limiter._limiter.has_capacity(4)
+
+
+@pytest.mark.asyncio
+async def test_acquire_weight_above_max_rate_is_split():
+    # aiolimiter rejects a single acquire(amount > max_rate) with ValueError
+    limiter = GlobalRateLimiter(max_rate=10, time_period=0.05)
+
+    await asyncio.wait_for(limiter.acquire(weight=25), timeout=2)
+
+    limiter._limiter = AsyncMock()
+    await limiter.acquire(weight=25)
+    assert [c.args[0] for c in limiter._limiter.acquire.await_args_list] == [10, 10, 5]
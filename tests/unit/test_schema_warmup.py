@@ -0,0 +1,18 @@
+"""Unit tests for deferred schema warm-up."""
+
+from __future__ import annotations
+
+import pytest
+
+import app.schemas  # noqa: F401 — load every schema module
+from app.schemas.common import build_deferred_schemas
+from app.schemas.trade import LotResponse
+
+pytestmark = pytest.mark.unit
+
+
+def test_build_deferred_schemas_completes_models():
+    build_deferred_schemas()
+
+    assert LotResponse.__pydantic_complete__
+    assert build_deferred_schemas() == 0
@@ -173,3 +173,15 @@ class TestProductionSecretStrength:
         assert len(cfg.session_secret_key) >= 32
         assert len(cfg.csrf_secret) >= 32
         assert len(cfg.encryption_keys) > 0
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("rounds", [3, 32])
+def test_bcrypt_rounds_out_of_range_rejected(rounds):
+    """Out-of-range BCRYPT_ROUNDS fails config validation, not bcrypt.gensalt at import."""
+    from pydantic import ValidationError
+
+    from app.config import GlobalConfig
+
+    with pytest.raises(ValidationError, match="bcrypt_rounds"):
+        GlobalConfig(bcrypt_rounds=rounds)
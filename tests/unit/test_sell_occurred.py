@@ -1,72 +1,129 @@
 """
 Regression tests for CRIT-2: sell_occurred detection.
 
-These tests verify the semantics of sell_occurred = (after < before)
-under various lot count scenarios. The scope unification (both queries
-using account-wide WHERE) is enforced by the code change in account_trader.py.
+Sell detection no longer compares account-wide open lot COUNT(*) snapshots;
+it reads the per-cycle counters kept by LotRepository (lots_opened / lots_closed).
 
 Production reference:
-    app/services/account_trader.py — AccountTrader._run_cycle() (approx. line 302)
-    Inline expression: ``did_sell_occur = open_lots_after < open_lots_count_before``
-
-    The helper below mirrors that expression exactly. Any change to the
-    production comparison operator MUST be reflected here; a mismatch
-    will cause all sell-detection tests to fail.
+    app/services/account_trader.py — AccountTrader._post_cycle_sell_check()
+    Inline expression: ``did_sell_occur = lots_closed > 0``
 """
 
+import uuid
+from unittest.mock import AsyncMock, MagicMock
+
 import pytest
 
+from app.db.lot_repo import LotRepository
+from app.models.account import BuyPauseState
+from app.services.account_trader import AccountTrader
+from app.strategies.base import RepositoryBundle, StrategyContext
+from app.strategies.sells.fixed_tp import FixedTpSell
+
+
+def _lot_repo(rowcount: int = 1) -> LotRepository:
+    """LotRepository over a stub session whose UPDATEs report ``rowcount`` rows."""
+    session = AsyncMock()
+    session.execute = AsyncMock(return_value=MagicMock(rowcount=rowcount))
+    return LotRepository(session)
+
+
+def _filled_lot(lot_id: int) -> MagicMock:
+    return MagicMock(lot_id=lot_id, buy_price=50000.0, buy_qty=0.001, sell_order_id=1000 + lot_id)
+
+
+async def _run_fixed_tp(account_id, lot_repo: LotRepository, lots: list) -> None:
+    ctx = StrategyContext(
+        account_id=account_id,
+        symbol="BTCUSDT",
+        base_asset="BTC",
+        quote_asset="USDT",
+        current_price=50000.0,
+        params=FixedTpSell.default_params.copy(),
+        client_order_prefix="TEST_",
+        free_balance=10000.0,
+        open_lots=None,
+    )
+    exchange = AsyncMock()
+    exchange.get_symbol_filters = AsyncMock(return_value=MagicMock(min_notional=10.0))
+    exchange.adjust_price = AsyncMock(side_effect=lambda p, s: float(p))
+    exchange.adjust_qty = AsyncMock(side_effect=lambda q, s: float(q))
+    exchange.get_order = AsyncMock(
+        side_effect=lambda oid, _s: {
+            "orderId": oid,
+            "status": "FILLED",
+            "executedQty": "0.001",
+            "cummulativeQuoteQty": "51.65",
+            "updateTime": 2000000,
+        }
+    )
+    repos = MagicMock(spec=RepositoryBundle)
+    repos.lot = lot_repo
+    repos.order = AsyncMock()
+    state = AsyncMock()
+    state.get_float = AsyncMock(return_value=0.0)
+    strategy = FixedTpSell()
+    strategy._last_order_ts = 0.0
+    await strategy.tick(ctx, state, exchange, AsyncMock(), repos, open_lots=lots)
+
+
+def _paused_trader(account_id) -> AccountTrader:
+    trader = AccountTrader(
+        account_id=account_id, price_collector=MagicMock(), rate_limiter=MagicMock(), encryption=None
+    )
+    trader._client = AsyncMock()
+    trader._client.get_free_balance = AsyncMock(return_value=100.0)
+    trader._buy_pause_state = BuyPauseState.PAUSED
+    return trader
+
+
+def _pause_mgr() -> MagicMock:
+    pause_mgr = MagicMock()
+    pause_mgr.update_state = AsyncMock(return_value=(BuyPauseState.ACTIVE, 0))
+    return pause_mgr
+
 
 @pytest.mark.unit
+@pytest.mark.asyncio
 class TestSellOccurredDetection:
-    """sell_occurred = open_lots_after < open_lots_count_before
-
-    Production code location:
-        app/services/account_trader.py ~ line 302
-        ``did_sell_occur = open_lots_after < open_lots_count_before``
-    """
-
-    @staticmethod
-    def _sell_occurred(before: int, after: int) -> bool:
-        # Mirrors: did_sell_occur = open_lots_after < open_lots_count_before
-        # (app/services/account_trader.py)
-        return after < before
-
-    def test_normal_sell_detected(self):
-        """매도 1건 발생 → before=3, after=2 → True"""
-        assert self._sell_occurred(before=3, after=2) is True
-
-    def test_no_change_no_sell(self):
-        """변동 없음 → before=3, after=3 → False"""
-        assert self._sell_occurred(before=3, after=3) is False
-
-    def test_buy_only_increases_count(self):
-        """매수만 발생 → before=3, after=4 → False"""
-        assert self._sell_occurred(before=3, after=4) is False
-
-    def test_multiple_sells_detected(self):
-        """매도 2건 → before=5, after=3 → True"""
-        assert self._sell_occurred(before=5, after=3) is True
-
-    def test_same_cycle_buy_sell_compensation_known_limitation(self):
-        """
-        Known limitation: 동일 사이클에서 매수 1건 + 매도 1건이 정확히
-        상쇄되면 sell_occurred=False. Option C (sell flag)로만 해결 가능.
-        이 테스트는 한계를 문서화한다.
-        """
-        # sell 1 + buy 1 → before=3, after=3
-        assert self._sell_occurred(before=3, after=3) is False
-
-    def test_orphan_lots_scope_unified(self):
-        """
-        Regression CRIT-2: 비활성 combo의 orphan 로트가 있어도
-        before/after 스코프가 동일하므로 정확히 감지.
-
-        수정 전: before=2 (활성 combo만), after=2 (orphan 1 포함) → False (버그)
-        수정 후: before=3 (account-wide), after=2 (account-wide) → True (정상)
-        """
-        assert self._sell_occurred(before=3, after=2) is True
-
-    def test_empty_account_no_sell(self):
-        """로트 없는 계정 → before=0, after=0 → False"""
-        assert self._sell_occurred(before=0, after=0) is False
+    async def test_fixed_tp_fills_counted_and_detected(self):
+        """같은 사이클 매도 2건 → lots_closed=2, 매도 감지로 PAUSED 잔고 재체크."""
+        account_id = uuid.uuid4()
+        lot_repo = _lot_repo()
+
+        await _run_fixed_tp(account_id, lot_repo, [_filled_lot(1), _filled_lot(2)])
+
+        assert (lot_repo.lots_opened, lot_repo.lots_closed) == (0, 2)
+        trader, pause_mgr = _paused_trader(account_id), _pause_mgr()
+        account = MagicMock(quote_asset="USDT")
+        assert await trader._post_cycle_sell_check(account, 1, lot_repo.lots_closed, False, pause_mgr) is True
+        trader._client.get_free_balance.assert_awaited_once_with("USDT")
+        assert pause_mgr.update_state.await_args.args[3] is True  # did_sell_occur
+
+    async def test_already_closed_lot_not_counted(self):
+        """UPDATE가 0행이면 (이미 CLOSED) 카운트하지 않는다."""
+        lot_repo = _lot_repo(rowcount=0)
+
+        await _run_fixed_tp(uuid.uuid4(), lot_repo, [_filled_lot(1)])
+
+        assert lot_repo.lots_closed == 0
+
+    async def test_orphan_reconcile_does_not_count_as_sell(self):
+        """orphan 매도 주문 연결(set_sell_order)은 로트를 닫지 않으므로 매도로 감지되지 않는다."""
+        account_id = uuid.uuid4()
+        lot_repo = _lot_repo()
+        session = AsyncMock()
+        orphan_lots = MagicMock()
+        orphan_lots.all.return_value = [(42,)]
+        sell_orders = MagicMock()
+        sell_orders.all.return_value = [(12345, "CMT_a1b2c3d4_e5f6a7b8__TP_42", 1700000000000)]
+        session.execute = AsyncMock(side_effect=[orphan_lots, sell_orders])
+        trader = _paused_trader(account_id)
+
+        assert await trader._reconcile_orphan_sells(AsyncMock(), lot_repo, session) == 1
+
+        assert (lot_repo.lots_opened, lot_repo.lots_closed) == (0, 0)
+        pause_mgr = _pause_mgr()
+        await trader._post_cycle_sell_check(MagicMock(quote_asset="USDT"), 1, lot_repo.lots_closed, False, pause_mgr)
+        trader._client.get_free_balance.assert_not_awaited()
+        assert pause_mgr.update_state.await_args.args[3] is False